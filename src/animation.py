@@ -1,12 +1,22 @@
 import os
 import pygame
-from typing import Callable, List, Optional, Tuple, Dict
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 class Animation:
     """Spritesheet-based animation player with lazy frame loading and per-frame duration support."""
 
     # [15] github copilot
     _sprite_sheet_cache: Dict[str, pygame.Surface] = {}
+    # Extracted frames shared by every Animation using the same sheet and frame geometry,
+    # bounded per geometry so repeated rescaling cannot grow them forever
+    _shared_frame_caches: Dict[Tuple[str, int, int, int, int, bool], "OrderedDict[Tuple[int, int, bool, float], pygame.Surface]"] = {}
+    _FRAME_CACHE_MAX_ENTRIES = 512
+    # Sheet paths already checked on disk, mapped to their normalized form
+    _verified_sheet_paths: Dict[str, str] = {}
 
     def __init__(
             self, 
@@ -15,7 +25,8 @@ class Animation:
             frame_height: int, 
             scale: float = 1.0,
             margin: int = 0,
-            spacing: int = 0
+            spacing: int = 0,
+            smooth: bool = True
         ):
         """
         Initialize the animation handler with a spritesheet.
@@ -26,19 +37,27 @@ class Animation:
             scale (float): Uniform scale factor applied to each extracted frame.
             margin (int): Pixel margin around the spritesheet edge before frames begin.
             spacing (int): Pixel gap between adjacent frames.
+            smooth (bool): Use bilinear smoothscale for fractional scales; integer scales always use nearest-neighbour.
         """
-        if not os.path.exists(sprite_sheet_path):
-            raise FileNotFoundError(f"Sprite sheet not found: {sprite_sheet_path}")
-        self.sprite_sheet_path = os.path.normpath(sprite_sheet_path)
+        # Entities are rebuilt on every save-slot click, so only stat each sheet path once
+        normalized_path = self._verified_sheet_paths.get(sprite_sheet_path)
+        if normalized_path is None:
+            if not os.path.exists(sprite_sheet_path):
+                raise FileNotFoundError(f"Sprite sheet not found: {sprite_sheet_path}")
+            normalized_path = os.path.normpath(sprite_sheet_path)
+            self._verified_sheet_paths[sprite_sheet_path] = normalized_path
+        self.sprite_sheet_path = normalized_path
         self.sprite_sheet: Optional[pygame.Surface] = None
         self.frame_width = frame_width
         self.frame_height = frame_height
         self.scale = float(scale)
         self.margin = int(margin)
         self.spacing = int(spacing)
+        self.smooth = bool(smooth)
 
         self.animations: Dict[str, Dict] = {}
         self.current_animation: Optional[str] = None
+        self._active_anim: Optional[Dict] = None  # loaded dict of current_animation, set by set_animation
 
         # Playback state
         self.elapsed = 0.0
@@ -49,22 +68,64 @@ class Animation:
         self.reverse = False
         
         # [15] github copilot
-        # Cache for extracted frames to avoid re-blitting repeatedly
-        self._frame_cache: Dict[Tuple[int, int, bool, float], pygame.Surface] = {}
+        # Cache for extracted frames to avoid re-blitting repeatedly.
+        # Shared across instances so e.g. every button pointer or respawned enemy reuses the same surfaces.
+        geometry_key = (self.sprite_sheet_path, self.frame_width, self.frame_height, self.margin, self.spacing, self.smooth)
+        self._frame_cache: "OrderedDict[Tuple[int, int, bool, float], pygame.Surface]" = \
+            self._shared_frame_caches.setdefault(geometry_key, OrderedDict())
 
     def _get_sprite_sheet(self) -> pygame.Surface:
         """
         Load the spritesheet from disk or return the cached copy.
+        Frames are first extracted after the display mode is set, so the sheet is converted to the
+        display's alpha format here; subsurface copies, scales and flips all keep that format, which
+        keeps every cached frame on SDL's matching-format blit path.
         Returns:
             pygame.Surface: The loaded (and cached) spritesheet surface.
         """
         cached_sheet = self._sprite_sheet_cache.get(self.sprite_sheet_path)
         if cached_sheet is None:
-            cached_sheet = pygame.image.load(self.sprite_sheet_path).convert_alpha()
+            cached_sheet = self._to_display_format(pygame.image.load(self.sprite_sheet_path), self.sprite_sheet_path)
             self._sprite_sheet_cache[self.sprite_sheet_path] = cached_sheet
         self.sprite_sheet = cached_sheet
         return cached_sheet
 
+    @staticmethod
+    def _to_display_format(sheet: pygame.Surface, path: str) -> pygame.Surface:
+        """
+        Convert a freshly decoded sheet to the display's alpha format when a display exists.
+        Args:
+            sheet (pygame.Surface): Decoded spritesheet.
+            path (str): Sheet path, used in the warning.
+        Returns:
+            pygame.Surface: Converted sheet, or the original when no display mode is set.
+        """
+        if pygame.display.get_surface() is not None:
+            return sheet.convert_alpha()
+        # No display yet (e.g. offline tooling); leave the sheet in its file format
+        print(f"Warning: Loading {path} before a display mode is set; frames will not be display-converted")
+        return sheet
+
+    @classmethod
+    def preload_sprite_sheets(cls, animations: Iterable["Animation"]):
+        """
+        Decode the sheets of several animations in parallel and add them to the shared cache.
+        pygame.image.load releases the GIL while decoding, so worker threads overlap the PNG
+        decodes; conversion to the display format still happens on the calling thread.
+        Args:
+            animations (Iterable[Animation]): Animations whose sheets should be loaded.
+        """
+        paths = list(dict.fromkeys(
+            anim.sprite_sheet_path for anim in animations
+            if anim.sprite_sheet_path not in cls._sprite_sheet_cache
+        ))
+        if len(paths) < 2:
+            return
+        with ThreadPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1)) as pool:
+            decoded_sheets = list(pool.map(pygame.image.load, paths))
+        for path, sheet in zip(paths, decoded_sheets):
+            cls._sprite_sheet_cache[path] = cls._to_display_format(sheet, path)
+
     def _extract_frame_surface(self, col: int, row: int, flip_x: bool) -> pygame.Surface:
         """
         Extract and cache a single frame surface from the spritesheet.
@@ -76,8 +137,16 @@ class Animation:
             pygame.Surface: The extracted (and optionally flipped/scaled) frame surface.
         """
         key = (col, row, flip_x, self.scale)
-        if key in self._frame_cache:
-            return self._frame_cache[key]
+        frame_surf = self._frame_cache.get(key)
+        if frame_surf is not None:
+            self._frame_cache.move_to_end(key)
+            return frame_surf
+
+        if flip_x:
+            # Mirror the cached unflipped frame instead of re-extracting and re-scaling the sheet pixels
+            frame_surf = pygame.transform.flip(self._extract_frame_surface(col, row, False), True, False)
+            self._store_frame(key, frame_surf)
+            return frame_surf
 
         sprite_sheet = self.sprite_sheet if self.sprite_sheet is not None else self._get_sprite_sheet()
         
@@ -96,15 +165,29 @@ class Animation:
                 f"Margin: {self.margin}, Spacing: {self.spacing}"
             )
         
-        frame_surf = sprite_sheet.subsurface(rect).copy()
+        frame_surf = sprite_sheet.subsurface(rect)
         if self.scale != 1.0:
+            # Scaling already allocates a new surface, so the subsurface needs no copy first.
+            # Integer factors on pixel art look crisper and scale faster with nearest-neighbour.
+            scaler = pygame.transform.scale if (self.scale.is_integer() or not self.smooth) else pygame.transform.smoothscale
             new_size = (int(self.frame_width * self.scale), int(self.frame_height * self.scale))
-            frame_surf = pygame.transform.smoothscale(frame_surf, new_size)
-        if flip_x:
-            frame_surf = pygame.transform.flip(frame_surf, True, False)
-        self._frame_cache[key] = frame_surf
+            frame_surf = scaler(frame_surf, new_size)
+        else:
+            frame_surf = frame_surf.copy()
+        self._store_frame(key, frame_surf)
         return frame_surf
 
+    def _store_frame(self, key: Tuple[int, int, bool, float], frame_surf: pygame.Surface):
+        """
+        Insert a frame into the shared cache, evicting the least recently used entry when full.
+        Args:
+            key (tuple): (col, row, flip_x, scale) cache key.
+            frame_surf (pygame.Surface): Extracted frame surface.
+        """
+        self._frame_cache[key] = frame_surf
+        if len(self._frame_cache) > self._FRAME_CACHE_MAX_ENTRIES:
+            self._frame_cache.popitem(last=False)
+
     def extract_frames(self, row: int, start_col: int, num_frames: int, flip_x: bool = False) -> List[pygame.Surface]:
         """
         Extract a sequence of frames from a row in the spritesheet.
@@ -116,11 +199,44 @@ class Animation:
         Returns:
             List[pygame.Surface]: Extracted frame surfaces.
         """
+        if flip_x and self.scale == 1.0 and num_frames > 1:
+            self._extract_flipped_row(row, start_col, num_frames)
         frames: List[pygame.Surface] = []
         for i in range(num_frames):
             col = start_col + i
             frames.append(self._extract_frame_surface(col, row, flip_x))
         return frames
+
+    def _extract_flipped_row(self, row: int, start_col: int, num_frames: int):
+        """
+        Mirror a run of unscaled frames with one flip of the whole row strip and cache each slice.
+        Only valid at scale 1.0: smoothscale does not commute with a flip, so scaled frames keep
+        mirroring their cached unflipped frame instead.
+        Args:
+            row (int): Zero-based row index.
+            start_col (int): Zero-based column to begin extraction from.
+            num_frames (int): Number of consecutive frames to extract.
+        """
+        keys = [(start_col + i, row, True, 1.0) for i in range(num_frames)]
+        if all(key in self._frame_cache for key in keys):
+            return
+        sprite_sheet = self.sprite_sheet if self.sprite_sheet is not None else self._get_sprite_sheet()
+        stride = self.frame_width + self.spacing
+        strip_rect = pygame.Rect(
+            self.margin + start_col * stride,
+            self.margin + row * (self.frame_height + self.spacing),
+            num_frames * stride - self.spacing,
+            self.frame_height,
+        )
+        if not sprite_sheet.get_rect().contains(strip_rect):
+            # Let the per-frame path raise its detailed bounds error
+            return
+        flipped_strip = pygame.transform.flip(sprite_sheet.subsurface(strip_rect), True, False)
+        for i, key in enumerate(keys):
+            if key not in self._frame_cache:
+                # Column i sits mirrored at the right-to-left position in the flipped strip
+                frame_rect = pygame.Rect(strip_rect.width - i * stride - self.frame_width, 0, self.frame_width, self.frame_height)
+                self._store_frame(key, flipped_strip.subsurface(frame_rect).copy())
     
     def add_animation(
             self, 
@@ -174,6 +290,9 @@ class Animation:
         if durations is not None and len(durations) != frame_count:
             raise ValueError("Length of durations must match number of frames.")
 
+        if name == self.current_animation:
+            # Re-registering the playing animation; update() reloads it on the next tick
+            self._active_anim = None
         self.animations[name] = {
             'frames': resolved_frames,
             'durations': durations,
@@ -232,6 +351,7 @@ class Animation:
         if name != self.current_animation or reset:
             anim = self._ensure_animation_loaded(name)
             self.current_animation = name
+            self._active_anim = anim
             self.current_frame = 0 if not reverse else len(anim['frames']) - 1
             self.elapsed = 0.0
             self.playing = True
@@ -248,18 +368,36 @@ class Animation:
         if not self.playing or self.current_animation is None or self.finished:
             return
 
-        anim = self._ensure_animation_loaded(self.current_animation)
+        anim = self._active_anim
+        if anim is None:
+            anim = self._active_anim = self._ensure_animation_loaded(self.current_animation)
         durations = anim['durations']
-        frame_count = len(durations)
+        if not durations:
+            return
 
-        if frame_count == 0:
+        # Hot path: most ticks stay inside the current frame, so skip the flag lookups and stepping
+        self.elapsed += dt
+        if self.elapsed < durations[self.current_frame]:
             return
-        
+
+        frame_count = len(durations)
         # Cache loop and pingpong flags to avoid dict lookups
         loop = anim['loop']
         pingpong = anim['pingpong']
-        
-        self.elapsed += dt
+
+        if loop and not pingpong and not self.reverse:
+            # Forward loops: locate the frame by bisecting cumulative durations instead of stepping one frame at a time
+            cum = anim.get('cum')
+            if cum is None or len(cum) != frame_count:
+                cum = anim['cum'] = list(accumulate(durations))
+            total = cum[-1]
+            if total > 0:
+                position = (cum[self.current_frame] - durations[self.current_frame] + self.elapsed) % total
+                frame = min(bisect_right(cum, position), frame_count - 1)
+                self.current_frame = frame
+                self.elapsed = max(0.0, position - (cum[frame] - durations[frame]))
+                return
+
         # Use while to support large dt values
         while self.elapsed >= durations[self.current_frame]:
             self.elapsed -= durations[self.current_frame]
@@ -355,12 +493,12 @@ class Animation:
 
     def set_scale(self, scale: float):
         """
-        Set a new scale factor and clear the frame cache to force re-extraction.
+        Set a new scale factor; frames are re-extracted lazily at the new scale.
         Args:
             scale (float): New uniform scale factor (must be > 0).
         """
         if scale <= 0:
             raise ValueError("Scale must be a positive number.")
         if scale != self.scale:
-            self.scale = float(scale)
-            self._frame_cache.clear()  # Clear cache to re-extract frames with new scale
\ No newline at end of file
+            # Scale is part of the frame cache key, so the shared cache stays valid
+            self.scale = float(scale)
\ No newline at end of file
@@ -1,16 +1,23 @@
 import pygame
+import numpy as np
 import os
 import json
 import random
-from typing import Dict, List, Optional
+import time
+import atexit
+from typing import Dict, List, Optional, Sequence
 
-from runtime_paths import assets_path, user_data_file
+import config
+from runtime_paths import assets_path, user_data_file, write_json_atomic
 
 class AudioManager:
     """Singleton audio manager for music playback, sound effects, and volume control."""
 
     _instance = None
     _initialized = False
+    _SAVE_DELAY = 0.25  # seconds of inactivity before a volume change is written
+    _AUDIO_EXTENSIONS = ('.wav', '.ogg', '.mp3')
+    _GAIN_EPSILON = 1e-4  # gain changes smaller than this are inaudible and not re-applied
 
     def stop_all_sfx(self):
         """Immediately stop all SFX channels (not music or atmosphere)."""
@@ -32,13 +39,7 @@ class AudioManager:
             return
         AudioManager._initialized = True
         
-        self._audio_available = True
-        try:
-            pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
-            pygame.mixer.set_num_channels(32)
-        except Exception as e:
-            self._audio_available = False
-            print(f"Warning: Audio disabled ({e})")
+        self._audio_available = True  # cleared by _init_mixer when no audio device can be opened
 
         self.audio_dir = os.path.normpath(assets_path("audio"))
 
@@ -46,109 +47,358 @@ class AudioManager:
         self.master_volume = 0.7
         self.music_volume = 0.5
         self.sfx_volume = 0.8
+        self._sfx_gain = self.sfx_volume * self.master_volume  # combined sfx * master, see _refresh_sfx_gain
+        self._music_gain = self.music_volume * self.master_volume  # combined music * master, see _refresh_music_gain
+        self._overridden_channels = set()  # sfx channels an override play left at a non-unit volume
+        self._atmos_base_volume = 0.6  # atmosphere volume before the sfx * master gain
 
-        # Audio channels (0-29 for sfx, 30 for atmosphere)
-        self.sfx_channels = [pygame.mixer.Channel(i) for i in range(30)] if self._audio_available else []
-        self._atmos_channel = pygame.mixer.Channel(30) if self._audio_available else None
-        self.current_channel = 0
-        self.sfx_sounds = {}
+        # Audio channels (0 reserved for atmosphere, the rest for sfx), built by _init_mixer
+        self.sfx_channels = []
+        self._next_channel = 0  # where the idle-channel scan starts, and the slot stolen when none is idle, see _acquire_channel
+        self._atmos_channel = None
+        self.sfx_sounds = {}  # decoded sounds at full volume, filled on first play by _get_sound
+        self._sfx_baked = {}  # sound name -> (gain, Sound with that gain applied to its samples), see _get_baked_sound
+        self._sfx_paths: Dict[str, List[str]] = {}  # registered sound name -> candidate files, see load_sounds
         self._current_music_name = None
+        self._audio_files: Optional[Dict[str, Dict[str, str]]] = None  # lowercased basename -> {ext: path}, see _find_audio_files
+        self._music_paths: Optional[Dict[str, List[str]]] = None  # lowercased basename -> music files by preference, see _find_music_files
 
         self.settings_file = user_data_file("game_progress.json")
+        atexit.register(self.flush_settings)
+        self._last_saved_volumes: Optional[Dict[str, float]] = None  # skip rewriting identical settings
+        # Parsed progress file and the (mtime, size) it was read at; other modules write the same file,
+        # so the cache is only trusted while the file on disk is unchanged
+        self._settings_cache: Optional[dict] = None
+        self._settings_cache_stamp = None
+        # Volume changes (e.g. slider drags) are coalesced into one write shortly after the last change
+        self._save_pending = False
+        self._save_deadline = 0.0
+        self._init_mixer()
         self.load_settings()
     
+    def _init_mixer(self):
+        """Start the mixer and build the sfx channel pool; disables audio if that fails."""
+        try:
+            pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
+            # Exactly the sfx pool plus the atmosphere channel
+            pygame.mixer.set_num_channels(config.SFX_CHANNEL_COUNT + 1)
+            # Reserve channel 0 for atmosphere so Sound.play() never auto-picks it. The reservation does
+            # not cover forced lookups (find_channel(True) steals from every channel), so sfx only ever
+            # play on channels taken from sfx_channels, see _acquire_channel
+            pygame.mixer.set_reserved(1)
+        except Exception as e:
+            self._audio_available = False
+            print(f"Warning: Audio disabled ({e})")
+            return
+        self.sfx_channels = [pygame.mixer.Channel(i) for i in range(1, config.SFX_CHANNEL_COUNT + 1)]
+        self._atmos_channel = pygame.mixer.Channel(0)
+
     def load_settings(self):
         """Load volume settings from the game progress file."""
         try:
-            if os.path.exists(self.settings_file):
-                with open(self.settings_file, 'r') as f:
-                    data = json.load(f)
-                    audio_settings = data.get("audio_settings", {})
-                    self.master_volume = audio_settings.get("master", 0.7)
-                    self.music_volume = audio_settings.get("music", 0.5)
-                    self.sfx_volume = audio_settings.get("sfx", 0.8)
+            data = self._read_settings_file()
+            if data is not None:
+                audio_settings = data.get("audio_settings", {})
+                self.master_volume = audio_settings.get("master", 0.7)
+                self.music_volume = audio_settings.get("music", 0.5)
+                self.sfx_volume = audio_settings.get("sfx", 0.8)
+                self._last_saved_volumes = self.get_volumes()
         except Exception as e:
             print(f"Error loading audio settings: {e}")
+        self._refresh_sfx_gain()
+        self._refresh_music_gain()
+
+    def _read_settings_file(self) -> Optional[dict]:
+        """
+        Return the parsed progress file, re-parsing only when it changed on disk since the last read/write.
+        Returns:
+            dict | None: Parsed file contents, or None if the file does not exist.
+        """
+        try:
+            stat = os.stat(self.settings_file)
+        except FileNotFoundError:
+            self._settings_cache = None
+            self._settings_cache_stamp = None
+            return None
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if self._settings_cache is None or stamp != self._settings_cache_stamp:
+            with open(self.settings_file, 'r') as f:
+                self._settings_cache = json.load(f)
+            self._settings_cache_stamp = stamp
+        return self._settings_cache
+
+    def _refresh_sfx_gain(self):
+        """
+        Recompute the combined sfx * master gain; called whenever either volume changes.
+        Baked sfx copies are rebuilt lazily on their next play; the looping atmosphere
+        is adjusted on its channel so the change is heard immediately.
+        """
+        gain = self.sfx_volume * self.master_volume
+        if abs(gain - self._sfx_gain) < self._GAIN_EPSILON:
+            return
+        self._sfx_gain = gain
+        if self._audio_available:
+            self._atmos_channel.set_volume(self._atmos_base_volume * self._sfx_gain)
+
+    def _refresh_music_gain(self):
+        """
+        Recompute the combined music * master gain, pushing it to the mixer only when it changed.
+        Without audio output the value is just stored; play_music applies it.
+        """
+        gain = self.music_volume * self.master_volume
+        if abs(gain - self._music_gain) < self._GAIN_EPSILON:
+            return
+        self._music_gain = gain
+        if self._audio_available:
+            pygame.mixer.music.set_volume(gain)
         
     def save_settings(self):
-        """Persist volume settings to the game progress file."""
+        """Persist volume settings to the game progress file, skipping the write when nothing changed."""
+        volumes = self.get_volumes()
+        if volumes == self._last_saved_volumes:
+            return
         try:
-            # Load existing data if file exists
-            existing_data = {}
-            if os.path.exists(self.settings_file):
-                with open(self.settings_file, 'r') as f:
-                    existing_data = json.load(f)
+            # Existing data (cached parse unless another writer touched the file)
+            existing_data = self._read_settings_file()
+            if existing_data is None:
+                existing_data = {}
             
             # Update only the audio_settings section
-            existing_data['audio_settings'] = {
-                "master": self.master_volume,
-                "music": self.music_volume,
-                "sfx": self.sfx_volume
-            }
-            
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(self.settings_file), exist_ok=True)
+            existing_data['audio_settings'] = volumes
             
-            with open(self.settings_file, 'w') as f:
-                json.dump(existing_data, f, indent=2)
+            # The directory was created once by user_data_file() in __init__; the swap-in write
+            # means a crash mid-write can't truncate the progress file
+            write_json_atomic(self.settings_file, existing_data)
+            self._last_saved_volumes = volumes
+            stat = os.stat(self.settings_file)
+            self._settings_cache = existing_data
+            self._settings_cache_stamp = (stat.st_mtime_ns, stat.st_size)
         except Exception as e:
             print(f"Error saving audio settings: {e}")
 
+    def _schedule_save(self):
+        """Mark settings dirty; the write happens in tick() once changes stop for _SAVE_DELAY seconds."""
+        self._save_pending = True
+        self._save_deadline = time.monotonic() + self._SAVE_DELAY
+
+    def tick(self, now: Optional[float] = None):
+        """
+        Flush a pending settings save once its debounce deadline has passed; call once per frame.
+        Args:
+            now (float | None): Current time.monotonic() value; read here when omitted.
+        """
+        if not self._save_pending:
+            return
+        if now is None:
+            now = time.monotonic()
+        if now >= self._save_deadline:
+            self.flush_settings()
+
+    def flush_settings(self):
+        """Write any pending settings change to disk immediately."""
+        if self._save_pending:
+            self._save_pending = False
+            self.save_settings()
+
+    def _get_audio_files(self) -> Dict[str, Dict[str, str]]:
+        """
+        Return the audio directory index, listing the directory on first use.
+        Returns:
+            Dict[str, Dict[str, str]]: Lowercased basename -> {extension: full path}.
+        """
+        if self._audio_files is None:
+            # One scandir pass replaces an exists() probe per extension per sound; names are
+            # keyed case-insensitively, as the exists() probes were on Windows
+            self._audio_files = {}
+            try:
+                with os.scandir(self.audio_dir) as entries:
+                    for entry in entries:
+                        base, ext = os.path.splitext(entry.name)
+                        ext = ext.lower()
+                        if ext in self._AUDIO_EXTENSIONS and entry.is_file():
+                            self._audio_files.setdefault(base.lower(), {})[ext] = entry.path
+            except OSError as e:
+                print(f"Warning: Could not list audio directory {self.audio_dir}: {e}")
+        return self._audio_files
+
+    def _find_audio_files(self, name: str, extensions) -> List[str]:
+        """
+        Look up the audio files for a basename (case-insensitive) in the audio directory index.
+        Args:
+            name (str): Filename without extension.
+            extensions (tuple): Extensions to try, in order of preference.
+        Returns:
+            List[str]: Full paths of the matching files in preference order (empty if none).
+        """
+        by_ext = self._get_audio_files().get(name.lower())
+        if not by_ext:
+            return []
+        return [by_ext[ext] for ext in extensions if ext in by_ext]
+
+    def _find_music_files(self, name: str) -> List[str]:
+        """
+        Look up the music files for a basename, resolving the mp3/ogg/wav preference once for all tracks.
+        Args:
+            name (str): Filename without extension.
+        Returns:
+            List[str]: Full paths of the matching files in preference order (empty if none).
+        """
+        if self._music_paths is None:
+            self._music_paths = {}
+            for base in self._get_audio_files():
+                paths = self._find_audio_files(base, ('.mp3', '.ogg', '.wav'))
+                if paths:
+                    self._music_paths[base] = paths
+        return self._music_paths.get(name.lower(), [])
+
     def load_sounds(self, sounds):
         """
-        Load sound effects from the audio directory by name.
+        Register sound effects from the audio directory by name; each is decoded on first play.
         Args:
             sounds (dict): Mapping of sound key to filename (without extension).
         """
         sfx_dir = self.audio_dir
-        if not os.path.exists(sfx_dir):
-            print(f"Warning: Audio directory not found: {sfx_dir}")
+        if not self._get_audio_files():
+            print(f"Warning: No audio files found in {sfx_dir}")
             return
 
         for sound_name, sound_file in sounds.items():
-            sound_loaded = False
-            for ext in ['.wav', '.ogg', '.mp3']:
-                file_path = os.path.join(sfx_dir, f"{sound_file}{ext}")
-                try:
-                    if os.path.exists(file_path):
-                        self.sfx_sounds[sound_name] = pygame.mixer.Sound(file_path)
-                        sound_loaded = True
-                        break
-                except FileNotFoundError:
-                    # File doesn't exist, try next extension
-                    continue
-                except Exception as e:
-                    print(f"Error loading sound '{sound_name}' from {file_path}: {e}")
-                    continue
-            
-            if not sound_loaded:
+            file_paths = self._find_audio_files(sound_file, ('.wav', '.ogg', '.mp3'))
+            if not file_paths:
                 print(f"Warning: Sound file '{sound_file}' not found in {sfx_dir}")
+                continue
+            self._sfx_paths[sound_name] = file_paths
+
+    def _get_sound(self, sound_name) -> Optional[pygame.mixer.Sound]:
+        """
+        Return a registered sound, decoding it the first time it is played.
+        Args:
+            sound_name (str): Key of the registered sound.
+        Returns:
+            pygame.mixer.Sound | None: The decoded sound, or None if unknown or undecodable.
+        """
+        sound = self.sfx_sounds.get(sound_name)
+        if sound is not None:
+            return sound
+        file_paths = self._sfx_paths.get(sound_name)
+        if not file_paths:
+            return None
+        # Fall back to the next extension when a file fails to decode
+        while file_paths:
+            file_path = file_paths[0]
+            try:
+                sound = pygame.mixer.Sound(file_path)
+            except Exception as e:
+                print(f"Error loading sound '{sound_name}' from {file_path}: {e}")
+                # Forget the path so a broken file is not re-decoded on every play
+                file_paths.pop(0)
+                continue
+            self.sfx_sounds[sound_name] = sound
+            return sound
+        del self._sfx_paths[sound_name]
+        return None
+
+    def _get_baked_sound(self, sound_name) -> Optional[pygame.mixer.Sound]:
+        """
+        Return a registered sound with the current sfx * master gain applied to its samples.
+        The scaled copy is built once per gain value, so repeated plays need no channel volume.
+        Args:
+            sound_name (str): Key of the registered sound.
+        Returns:
+            pygame.mixer.Sound | None: The scaled sound, or None if unknown or undecodable.
+        """
+        baked = self._sfx_baked.get(sound_name)
+        if baked is not None and baked[0] == self._sfx_gain:
+            return baked[1]
+        sound = self._get_sound(sound_name)
+        if sound is None:
+            return None
+        baked_sound = self._scale_samples(sound, self._sfx_gain)
+        self._sfx_baked[sound_name] = (self._sfx_gain, baked_sound)
+        return baked_sound
+
+    @staticmethod
+    def _scale_samples(sound: pygame.mixer.Sound, gain: float) -> pygame.mixer.Sound:
+        """
+        Build a copy of a sound with its PCM samples multiplied by gain.
+        Falls back to a volume-scaled copy of the original if the samples cannot be read.
+        Args:
+            sound (pygame.mixer.Sound): Decoded sound at full volume.
+            gain (float): Linear gain to apply (0.0–1.0).
+        Returns:
+            pygame.mixer.Sound: Sound that plays at the given gain with channel volume 1.0.
+        """
+        if gain >= 1.0:
+            return sound
+        try:
+            samples = pygame.sndarray.samples(sound)
+            if np.issubdtype(samples.dtype, np.integer):
+                limits = np.iinfo(samples.dtype)
+                scaled = np.clip(samples.astype(np.float32) * gain, limits.min, limits.max)
+            else:
+                scaled = samples * gain
+            return pygame.sndarray.make_sound(scaled.astype(samples.dtype))
+        except Exception as e:
+            print(f"Warning: could not pre-scale sound samples: {e}")
+            fallback = pygame.mixer.Sound(buffer=sound.get_raw())
+            fallback.set_volume(gain)
+            return fallback
 
     def play_sfx(self, sound_name, volume_override=None):
         """
-        Play a loaded sound effect on the next available channel.
+        Play a registered sound effect on the next available channel.
+        Unknown or undecodable names are skipped with a dict lookup, so callers need no
+        try/except around it.
         Args:
-            sound_name (str): Key of the loaded sound to play.
-            volume_override (float | None): Optional 0–1 override; multiplied with sfx and master volume.
+            sound_name (str): Key of the registered sound to play.
+            volume_override (float | None): Optional 0–1 override; applied on the channel on top of
+                the sfx * master gain already baked into the sound's samples.
         """
         if not self._audio_available:
             return
-        if sound_name not in self.sfx_sounds:
+        sound = self._get_baked_sound(sound_name)
+        if sound is None:
             return
         
-        channel = None
-        for ch in self.sfx_channels:
-            if not ch.get_busy():
-                channel = ch
-                break
-        
-        if not channel:
-            channel = self.sfx_channels[self.current_channel]
-            self.current_channel = (self.current_channel + 1) % len(self.sfx_channels)
+        channel = self._acquire_channel()
+        if channel is None:
+            return
         
-        volume = (volume_override or 1.0) * self.sfx_volume * self.master_volume
-        channel.set_volume(volume)
-        channel.play(self.sfx_sounds[sound_name])
+        # The samples already carry the sfx * master gain, so the common case skips set_volume
+        if volume_override:
+            channel.set_volume(volume_override)
+            self._overridden_channels.add(channel)
+        elif channel in self._overridden_channels:
+            channel.set_volume(1.0)
+            self._overridden_channels.discard(channel)
+        channel.play(sound)
+
+    def _acquire_channel(self) -> Optional[pygame.mixer.Channel]:
+        """
+        Return an sfx channel to play on, reusing the pooled Channel objects.
+        Idle channels are scanned first, starting at the round-robin cursor, so long sounds such
+        as roars keep playing while the pool has room. Only when every channel is busy is the
+        cursor slot stopped and reused. pygame.mixer.find_channel(True) is deliberately not used:
+        its forced lookup ignores set_reserved and can return the atmosphere channel.
+        Returns:
+            pygame.mixer.Channel | None: An idle (or stolen) channel, or None if none exists.
+        """
+        channels = self.sfx_channels
+        if not channels:
+            return None
+        count = len(channels)
+        start = self._next_channel
+        for offset in range(count):
+            index = (start + offset) % count
+            channel = channels[index]
+            if not channel.get_busy():
+                self._next_channel = (index + 1) % count
+                return channel
+        # Every pool channel is busy: steal the cursor slot, never the atmosphere channel
+        channel = channels[start]
+        self._next_channel = (start + 1) % count
+        channel.stop()
+        return channel
 
     def stop_sfx(self, sound_name):
         """Stop all channels currently playing the named sound effect."""
@@ -157,6 +407,9 @@ class AudioManager:
         sound = self.sfx_sounds.get(sound_name)
         if sound:
             sound.stop()
+        baked = self._sfx_baked.get(sound_name)
+        if baked:
+            baked[1].stop()
 
     def play_music(self, music_name, loop=True, fade_in=0):
         """
@@ -173,28 +426,22 @@ class AudioManager:
         self._current_music_name = music_name
         music_dir = self.audio_dir
 
-        music_loaded = False
-        for ext in ['.mp3', '.ogg', '.wav']:
-            music_path = os.path.join(music_dir, f"{music_name}{ext}")
+        music_paths = self._find_music_files(music_name)
+        if not music_paths:
+            print(f"Warning: Music file '{music_name}' not found in {music_dir}")
+            return
+        # Fall back to the next extension when a file fails to load
+        for music_path in music_paths:
             try:
-                if os.path.exists(music_path):
-                    pygame.mixer.music.load(music_path)
-                    if fade_in > 0:
-                        pygame.mixer.music.play(-1 if loop else 0, fade_ms=fade_in*1000)
-                    else:
-                        pygame.mixer.music.play(-1 if loop else 0)
-                    pygame.mixer.music.set_volume(self.music_volume * self.master_volume)
-                    music_loaded = True
-                    return
-            except FileNotFoundError:
-                # File doesn't exist, try next extension
-                continue
+                pygame.mixer.music.load(music_path)
+                if fade_in > 0:
+                    pygame.mixer.music.play(-1 if loop else 0, fade_ms=fade_in*1000)
+                else:
+                    pygame.mixer.music.play(-1 if loop else 0)
+                pygame.mixer.music.set_volume(self._music_gain)
+                return
             except Exception as e:
                 print(f"Error loading music '{music_name}' from {music_path}: {e}")
-                continue
-        
-        if not music_loaded:
-            print(f"Warning: Music file '{music_name}' not found in {music_dir}")
     
     def stop_music(self, fade_out: float = 0):
         """
@@ -214,77 +461,74 @@ class AudioManager:
         """
         Play a looping atmosphere sound on the dedicated atmosphere channel.
         Args:
-            sound_name (str): Key of the loaded sound to loop.
+            sound_name (str): Key of the registered sound to loop.
             volume_override (float | None): Optional base volume (default 0.6); multiplied with sfx and master.
         """
-        if not self._audio_available or self._atmos_channel is None:
+        if not self._audio_available:
             return
-        if sound_name not in self.sfx_sounds:
+        sound = self._get_sound(sound_name)
+        if sound is None:
             return
-        volume = (volume_override if volume_override is not None else 0.6) * self.sfx_volume * self.master_volume
-        self._atmos_channel.set_volume(volume)
-        self._atmos_channel.play(self.sfx_sounds[sound_name], loops=-1)
+        # The loop outlives volume changes, so its gain stays on the channel rather than in the samples
+        self._atmos_base_volume = volume_override if volume_override is not None else 0.6
+        self._atmos_channel.set_volume(self._atmos_base_volume * self._sfx_gain)
+        self._atmos_channel.play(sound, loops=-1)
 
     def stop_atmosphere(self):
         """Stop the looping atmosphere channel."""
-        if not self._audio_available or self._atmos_channel is None:
+        if not self._audio_available:
             return
         self._atmos_channel.stop()
 
-    def play_sfx_random(self, sound_names: List[str], volume_override=None):
+    def play_sfx_random(self, sound_names: Sequence[str], volume_override=None):
         """
         Play a random sound from the provided list of sound-name keys.
         Args:
-            sound_names (List[str]): Pool of sound keys to choose from.
+            sound_names (Sequence[str]): Pool of sound keys to choose from.
             volume_override (float | None): Optional volume override passed to play_sfx.
         """
-        available = [name for name in sound_names if name in self.sfx_sounds]
+        available = [name for name in sound_names if name in self._sfx_paths]
         if not available:
             return
         self.play_sfx(random.choice(available), volume_override=volume_override)
     
-    def set_master_volume(self, volume: float):
+    def set_master_volume(self, volume: float, save: bool = True):
         """
-        Set the master volume, clamped to [0, 1], and save settings.
+        Set the master volume, clamped to [0, 1], and schedule a settings save.
         Args:
             volume (float): New master volume (0.0–1.0).
+            save (bool): Schedule a debounced settings write; pass False when the caller saves them itself.
         """
         self.master_volume = max(0.0, min(1.0, volume))
-        if self._audio_available:
-            pygame.mixer.music.set_volume(self.music_volume * self.master_volume)
-            self._refresh_sfx_channel_volumes()
-        self.save_settings()
+        self._refresh_sfx_gain()
+        self._refresh_music_gain()
+        if save:
+            self._schedule_save()
     
-    def set_music_volume(self, volume: float):
+    def set_music_volume(self, volume: float, save: bool = True):
         """
-        Set the music volume, clamped to [0, 1], and save settings.
+        Set the music volume, clamped to [0, 1], and schedule a settings save.
         Args:
             volume (float): New music volume (0.0–1.0).
+            save (bool): Schedule a debounced settings write; pass False when the caller saves them itself.
         """
         self.music_volume = max(0.0, min(1.0, volume))
-        if self._audio_available:
-            pygame.mixer.music.set_volume(self.music_volume * self.master_volume)
-        self.save_settings()
+        self._refresh_music_gain()
+        if save:
+            self._schedule_save()
     
-    def set_sfx_volume(self, volume: float):
+    def set_sfx_volume(self, volume: float, save: bool = True):
         """
-        Set the sound-effects volume, clamped to [0, 1], and save settings.
+        Set the sound-effects volume, clamped to [0, 1], and schedule a settings save.
         Args:
             volume (float): New sfx volume (0.0–1.0).
+            save (bool): Schedule a debounced settings write; pass False when the caller saves them itself.
         """
         self.sfx_volume = max(0.0, min(1.0, volume))
-        if self._audio_available:
-            self._refresh_sfx_channel_volumes()
-        self.save_settings()
-
-    def _refresh_sfx_channel_volumes(self):
-        """Apply current master and sfx volume to all mixer channels."""
-        channel_volume = self.sfx_volume * self.master_volume
-        for channel in self.sfx_channels:
-            channel.set_volume(channel_volume)
-        if self._atmos_channel is not None:
-            self._atmos_channel.set_volume(self.sfx_volume * self.master_volume * 0.6)
-    
+        self._refresh_sfx_gain()
+        if save:
+            self._schedule_save()
+
     def get_volumes(self) -> Dict[str, float]:
         """Return a dict with current master, music, and sfx volume levels."""
         return {'master': self.master_volume, 'music': self.music_volume, 'sfx': self.sfx_volume}
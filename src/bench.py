@@ -20,9 +20,7 @@ class Bench:
 
     def draw(self, screen, camera_x=0, camera_y=0, look_y_offset=0, screen_offset=(0, 0)):
         """Draw the bench on screen, adjusted for camera, look, and shake offsets."""
-        draw_rect = self.rect.copy()
-        draw_rect.x -= int(camera_x)
-        draw_rect.y -= int(camera_y + look_y_offset)
-        draw_rect.x += int(screen_offset[0])
-        draw_rect.y += int(screen_offset[1])
-        screen.blit(self.image, draw_rect)
\ No newline at end of file
+        # blit takes the top-left directly, so no Rect copy is needed per frame
+        draw_x = self.rect.x - int(camera_x) + int(screen_offset[0])
+        draw_y = self.rect.y - int(camera_y + look_y_offset) + int(screen_offset[1])
+        screen.blit(self.image, (draw_x, draw_y))
\ No newline at end of file
@@ -2,6 +2,40 @@ import pygame
 from typing import Tuple, Optional
 from asset_paths import resolve_image_path
 from animation import Animation
+import config
+
+# Mirrored pointer frames keyed by the source frame surface (kept alive by the key itself)
+_mirrored_pointers = {}
+_MIRRORED_POINTERS_MAX_ENTRIES = 64
+# Composed (surface, topleft) pairs kept per button: one per pointer frame the button has shown
+_COMPOSED_CACHE_MAX_ENTRIES = 32
+
+def mirrored_pointer(frame: pygame.Surface) -> pygame.Surface:
+    """
+    Return the horizontally flipped copy of a pointer frame, flipping it only once.
+    Shared by every widget that mirrors a pointer on its right-hand side.
+    Args:
+        frame (pygame.Surface): Pointer frame from the button's animation.
+    Returns:
+        pygame.Surface: Mirrored frame (shared; do not modify).
+    """
+    mirrored = _mirrored_pointers.get(frame)
+    if mirrored is None:
+        # Frames evicted from the animation cache come back as new surfaces; start over rather than grow
+        if len(_mirrored_pointers) >= _MIRRORED_POINTERS_MAX_ENTRIES:
+            _mirrored_pointers.clear()
+        mirrored = pygame.transform.flip(frame, True, False)
+        _mirrored_pointers[frame] = mirrored
+    return mirrored
+
+def draw_buttons(surface: pygame.Surface, buttons):
+    """
+    Draw several buttons with a single Surface.blits call.
+    Args:
+        surface (pygame.Surface): Target surface.
+        buttons (Iterable[Button]): Buttons to draw, in back-to-front order.
+    """
+    surface.blits([button.get_composed_blit() for button in buttons], doreturn=False)
 
 class Button:
     """Animated menu button with hover and press pointer animations."""
@@ -22,20 +56,25 @@ class Button:
         self._text = text
         self.color = color
         
-        # Load font
-        self.font = pygame.font.Font(font_path, font_size)
+        # Load font (shared through the config cache so identical buttons don't each open the file)
+        self.font = config.get_font_for_path(font_path, font_size)
         
         # Cache rendered text surface and rect
         self._text_surface = None
         self._text_rect = None
         self._cached_rect = None
         self._update_text_cache()
+
+        # Label and pointers pre-composed into one surface per pointer frame, see get_composed_blit
+        self._composed_cache = {}
+        self._composed_text = None
         
         # Interaction state
         self.active = True
         self.press_timer = 0.0
         self.press_duration = 0.12
         self.was_hovering = False  # Track if we were hovering in previous frame
+        self._mouse_over = False  # mouse inside the rect at the last update, see is_hovered
 
         # Pointer animation
         pointer_sheet = resolve_image_path("pointer.png")
@@ -47,7 +86,7 @@ class Button:
     
     def _update_text_cache(self):
         """Rebuild the cached text surface and collision rect."""
-        self._text_surface = self.font.render(self.text, True, self.color)
+        self._text_surface = config.render_text(self.font, self.text, self.color)
         self._text_rect = self._text_surface.get_rect(center=(self.x, self.y))
         # Cache collision rect
         collision_rect = self._text_rect.copy()
@@ -86,38 +125,91 @@ class Button:
             loop=False
         )
     
-    def draw(self, screen: pygame.Surface):
-        """Draw the button text with animated pointers on both sides."""
-        # Get current pointer frame based on state
+    def _current_pointer_frame(self) -> pygame.Surface:
+        """Return the pointer frame for the current state."""
         if self.current_state == "normal":
             # Normal state
-            pointer_frame = self.pointer_anim.extract_frames(0, 0, 1)[0]
-        else:
-            # All other states (hover, pressed, release)
-            pointer_frame = self.pointer_anim.get_current_frame()
-        
-        # Draw text in the center (use cached surface)
-        screen.blit(self._text_surface, self._text_rect)
-        
-        # Draw left pointer
+            return self.pointer_anim.extract_frames(0, 0, 1)[0]
+        # All other states (hover, pressed, release)
+        return self.pointer_anim.get_current_frame()
+
+    def get_blit_sequence(self) -> list:
+        """
+        Build the (surface, rect) pairs needed to draw this button.
+        Returns:
+            list: Blit pairs for the label and both pointers, usable with Surface.blits.
+        """
+        pointer_frame = self._current_pointer_frame()
+
+        # Left pointer
         left_rect = pointer_frame.get_rect(right=self._text_rect.left - 10, centery=self.y-7)
-        screen.blit(pointer_frame, left_rect)
-        
-        # Draw right pointer
-        right_pointer = pygame.transform.flip(pointer_frame, True, False)
+
+        # Right pointer
+        right_pointer = mirrored_pointer(pointer_frame)
         right_rect = right_pointer.get_rect(left=self._text_rect.right + 10, centery=self.y-7)
-        screen.blit(right_pointer, right_rect)
+
+        # Text in the center (use cached surface)
+        return [
+            (self._text_surface, self._text_rect),
+            (pointer_frame, left_rect),
+            (right_pointer, right_rect),
+        ]
+
+    def get_composed_blit(self) -> tuple:
+        """
+        Return the pre-composed button surface and where to blit it.
+        Returns:
+            tuple: (surface, topleft) blit pair, usable with Surface.blits.
+        """
+        # Compositions are only valid for the label they were built with
+        if self._composed_text is not self._text_surface:
+            self._composed_cache.clear()
+            self._composed_text = self._text_surface
+        pointer_frame = self._current_pointer_frame()
+        composed = self._composed_cache.get(pointer_frame)
+        if composed is None:
+            # Frames evicted from the animation cache come back as new surfaces; start over rather than grow
+            if len(self._composed_cache) >= _COMPOSED_CACHE_MAX_ENTRIES:
+                self._composed_cache.clear()
+            composed = self._compose()
+            self._composed_cache[pointer_frame] = composed
+        return composed
+
+    def draw(self, screen: pygame.Surface):
+        """Draw the button text with animated pointers on both sides."""
+        screen.blit(*self.get_composed_blit())
+
+    def _compose(self) -> tuple:
+        """
+        Pre-compose the label and both pointers (current frame) into one surface for draw().
+        Returns:
+            tuple: (surface, topleft) blit pair for the composition.
+        """
+        blit_sequence = self.get_blit_sequence()
+        bounds = blit_sequence[0][1].unionall([rect for _, rect in blit_sequence[1:]])
+        composed = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        # The three parts never overlap, so a max blend onto the cleared surface copies each
+        # one's pixels and alpha unchanged (a normal blit would premultiply them)
+        composed.blits(
+            [(surface, rect.move(-bounds.x, -bounds.y), None, pygame.BLEND_RGBA_MAX)
+             for surface, rect in blit_sequence],
+            doreturn=False,
+        )
+        return composed, bounds.topleft
     
-    def update(self, dt: float):
+    def update(self, dt: float, mouse_pos=None):
         """
         Update hover state and pointer animation.
         Args:
             dt (float): Elapsed time in seconds since the last frame.
+            mouse_pos (tuple | None): Mouse position for this frame; queried here when None.
         """
         
         # Update pointer animation based on state (use cached rect)
-        mouse_pos = pygame.mouse.get_pos()
-        is_hover = self._cached_rect.collidepoint(mouse_pos) and self.active
+        if mouse_pos is None:
+            mouse_pos = pygame.mouse.get_pos()
+        self._mouse_over = self._cached_rect.collidepoint(mouse_pos)
+        is_hover = self._mouse_over and self.active
         
         if self.press_timer > 0:
             self.press_timer = max(0.0, self.press_timer - dt)
@@ -160,9 +252,8 @@ class Button:
         return self._cached_rect.collidepoint(pos) and self.active
     
     def is_hovered(self):
-        """Return True if the mouse is over the button."""
-        mouse_pos = pygame.mouse.get_pos()
-        return self._cached_rect.collidepoint(mouse_pos)
+        """Return True if the mouse was over the button at the last update."""
+        return self._mouse_over
     
     def press(self):
         """Start the button press animation."""
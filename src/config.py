@@ -1,11 +1,10 @@
 import pygame
+import pygame.freetype
 import os
+from collections import OrderedDict
 
 from runtime_paths import assets_path
 
-# Initialize Pygame
-pygame.init()
-
 # Constants
 
 # Game resolution — fixed at 1920x1080 for all machines
@@ -30,6 +29,9 @@ scale_y = 1.0
 HORNET_SCALE_MULTIPLIER = 1.3
 ENEMY_SCALE_MULTIPLIER = 1.3
 
+# Audio: size of the sound-effect channel pool (one more channel is reserved for atmosphere)
+SFX_CHANNEL_COUNT = 30
+
 # Fonts
 font_path = assets_path("fonts", "Perpetua Regular.otf")
 title_font_path = assets_path("fonts", "TrajanPro-Regular.ttf")
@@ -37,6 +39,17 @@ title_font_path = assets_path("fonts", "TrajanPro-Regular.ttf")
 # Font cache for efficient reuse
 _font_cache = {}
 
+def _ensure_font_modules():
+    """
+    Start pygame's font modules on first font creation.
+    config does not call pygame.init() at import, so importing it never starts SDL
+    subsystems; the game itself initializes pygame in main.py.
+    """
+    if not pygame.font.get_init():
+        pygame.font.init()
+    if not pygame.freetype.get_init():
+        pygame.freetype.init()
+
 def get_font(size=None):
     """
     Return the regular game font at the given size, cached for reuse.
@@ -49,6 +62,7 @@ def get_font(size=None):
         size = 32
     key = ('font', size)
     if key not in _font_cache:
+        _ensure_font_modules()
         _font_cache[key] = pygame.font.Font(font_path, size)
     return _font_cache[key]
 
@@ -64,6 +78,7 @@ def get_title_font(size=None):
         size = 48
     key = ('title_font', size)
     if key not in _font_cache:
+        _ensure_font_modules()
         _font_cache[key] = pygame.font.Font(title_font_path, size)
     return _font_cache[key]
 
@@ -79,13 +94,98 @@ def get_super_title_font(size=None):
         size = 72
     key = ('super_title_font', size)
     if key not in _font_cache:
+        _ensure_font_modules()
         _font_cache[key] = pygame.font.Font(title_font_path, size)
     return _font_cache[key]
 
-# Create default font instances (will be cached)
-font = get_font()
-title_font = get_title_font()
-super_title_font = get_super_title_font()
+def get_font_for_path(path, size):
+    """
+    Return a font loaded from an arbitrary file at the given size, cached for reuse.
+    Lets widgets that take a font path (e.g. Button) share one Font per (path, size).
+    Args:
+        path (str | None): Font file path; None uses the pygame default font.
+        size (int): Point size.
+    Returns:
+        pygame.font.Font: Loaded font object.
+    """
+    key = ('path_font', path, size)
+    if key not in _font_cache:
+        _ensure_font_modules()
+        _font_cache[key] = pygame.font.Font(path, size)
+    return _font_cache[key]
+
+def get_freetype_font(size=None):
+    """
+    Return the regular game font as a pygame.freetype font, cached for reuse.
+    Used for the settings slider labels: Slider.draw renders the label with font.render
+    and keeps the surface until the shown percentage changes. The font is set to origin
+    mode, so callers place the surface from the returned bounds and the ascender.
+    Args:
+        size (int | None): Point size; defaults to 32.
+    Returns:
+        pygame.freetype.Font: Loaded font object.
+    """
+    if size is None:
+        size = 32
+    key = ('freetype_font', size)
+    if key not in _font_cache:
+        _ensure_font_modules()
+        ft_font = pygame.freetype.Font(font_path, size)
+        ft_font.origin = True
+        _font_cache[key] = ft_font
+    return _font_cache[key]
+
+# Rendered text cache, bounded so dynamic strings (counters, timers) cannot grow it forever
+_text_cache = OrderedDict()
+_TEXT_CACHE_MAX_ENTRIES = 256
+
+def render_text(font, text, color, background=None):
+    """
+    Return an antialiased text surface, reusing a cached render when possible.
+    Args:
+        font (pygame.font.Font): Font to render with.
+        text (str): Text to render.
+        color (tuple[int, int, int]): RGB text color.
+        background (tuple[int, int, int] | None): Solid color behind the text. Pass it for
+            text drawn over an opaque panel of that color to get an opaque surface that
+            blits without per-pixel alpha.
+    Returns:
+        pygame.Surface: Rendered text surface (shared; do not modify).
+    """
+    key = (font, text, color, background)
+    surface = _text_cache.get(key)
+    if surface is not None:
+        _text_cache.move_to_end(key)
+        return surface
+    # Match the display pixel format once so every later blit skips conversion
+    if background is None:
+        surface = font.render(text, True, color).convert_alpha()
+    else:
+        surface = font.render(text, True, color, background).convert()
+    _text_cache[key] = surface
+    if len(_text_cache) > _TEXT_CACHE_MAX_ENTRIES:
+        _text_cache.popitem(last=False)
+    return surface
+
+# Default font instances, created on first access through the module __getattr__ below
+_DEFAULT_FONT_GETTERS = {
+    'font': get_font,
+    'title_font': get_title_font,
+    'super_title_font': get_super_title_font,
+}
+
+def __getattr__(name):
+    """
+    Build the default fonts (config.font, config.title_font, config.super_title_font) lazily.
+    Args:
+        name (str): Attribute that was not found on the module.
+    Returns:
+        pygame.font.Font: The cached default font.
+    """
+    getter = _DEFAULT_FONT_GETTERS.get(name)
+    if getter is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getter()
 
 # FPS
 fps = 60
@@ -6,7 +6,15 @@ from bench import Bench
 from asset_paths import resolve_image_path
 import config
 
-_white_overlay_cache: dict = {}
+# Random-pick pools for repeated sound effects, built once instead of per play
+_ATTACK_SCREAM_SFX = (
+    "hornet_attack_scream_1", "hornet_attack_scream_2",
+    "hornet_attack_scream_3", "hornet_attack_scream_4",
+)
+_FOOTSTEP_SFX = (
+    "hornet_footstep_1", "hornet_footstep_2",
+    "hornet_footstep_3", "hornet_footstep_4",
+)
 
 def _apply_white_overlay(surface, intensity):
     """
@@ -18,18 +26,73 @@ def _apply_white_overlay(surface, intensity):
         pygame.Surface: Blended copy of the surface.
     """
     result = surface.copy()
-    size = surface.get_size()
-    white_layer = _white_overlay_cache.get(size)
-    if white_layer is None:
-        white_layer = pygame.Surface(size)
-        _white_overlay_cache[size] = white_layer
-    white_layer.fill((intensity, intensity, intensity))
-    result.blit(white_layer, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
+    # Additive fill brightens in place; no full-size white layer to allocate, fill and blit
+    result.fill((intensity, intensity, intensity), special_flags=pygame.BLEND_RGB_ADD)
     return result
 
 class Hornet:
     """Player character with movement, combat, and platforming."""
-    
+
+    # Every attribute is fixed here: no per-instance __dict__, and the many per-frame
+    # attribute reads in update/draw resolve through slot descriptors
+    __slots__ = (
+        'image', 'image_flipped', 'rect', '_draw_rect', '_ground_foot_width', 'velocity_x', 'velocity_y', 'speed',
+        'jump_power', 'jump_initial_impulse', 'jump_sustain_accel', 'jump_max_hold_time',
+        '_jump_hold_timer', 'jump_cut_multiplier', 'gravity', 'on_ground', '_jump_held', '_jumping',
+        '_rebound_available', 'knockback_velocity_x', 'knockback_strength', 'knockback_decay',
+        'attack_recoil_velocity_x', 'attack_recoil_strength', 'attack_recoil_decay',
+        'touching_wall_left', 'touching_wall_right', 'wall_jump_power_x', 'wall_jump_power_y',
+        'wall_slide_speed', 'wall_slide_acceleration', '_wall_jump_timer', '_wall_jump_cooldown',
+        'is_mantle_clinging', 'is_mantle_canceling', 'is_climbing_ledge', 'ledge_climb_timer',
+        'ledge_climb_duration', '_ledge_target_world_x', '_ledge_target_world_y',
+        '_ledge_wall_direction', '_mantle_cling_world_x', '_mantle_cling_world_bottom',
+        '_mantle_cling_min_timer', '_pressing_down', 'camera_x_correction',
+        'down_attack_charge_speed', 'down_attack_dive_speed',
+        'down_attack_rebound_horizontal_scale', 'screen_width', 'screen_height', 'facing_right',
+        'audio_manager', '_footstep_timer', '_footstep_interval', '_wall_land_played', 'bench',
+        'is_resting', 'rest_timer', 'rest_duration', 'is_getting_off_bench', 'stun_timer',
+        '_camera_velocity', 'look_hold_timer', 'look_hold_threshold', 'camera_look_y',
+        'max_look_distance', 'look_speed', 'look_direction', 'max_health', 'health', 'heal_amount',
+        'heal_channel_duration', 'heal_channel_timer', 'is_healing', 'heal_in_air', 'is_dead',
+        'death_animation_complete', 'death_finish_hold_duration', 'death_finish_hold_timer',
+        'max_silk', 'silk', 'attack_cooldown', 'dash_cooldown', 'special_cooldown', '_attack_timer',
+        '_attack_triggered', '_attack_key_down', '_heal_key_down', '_instructions_surface',
+        'hitbox_inset_x', 'hitbox_inset_y', 'attack_range',
+        'attack_height_padding', 'attack_hitbox_duration', 'down_attack_hitbox_duration',
+        'attack_hitbox_timer', 'attack_hitbox', 'attack_hitbox_facing_right',
+        'attack_hitbox_direction', 'forward_attack_variant', 'active_attack_animation',
+        'active_attack_effect_animation', 'active_attack_visual_key', 'pending_attack_effect_start',
+        'pending_attack_effect_start_frame', '_locked_attack_anim_name', 'active_pose_animation',
+        'active_pose_effect_animation', 'active_pose_key', 'was_on_ground', 'landed_this_frame',
+        'jump_pose_active', 'attack_1_anim', 'attack_2_anim', 'attack_down_anim',
+        'attack_down_effect_anim', 'attack_effect_1_anim', 'attack_effect_2_anim', 'attack_up_anim',
+        'attack_up_effect_anim', 'death_anim', 'charged_effect_anim', 'fall_anim', 'get_off_anim',
+        'heal_anim', 'heal_alt_anim', 'heal_effect_anim', 'hit_flash_anim', 'idle_anim',
+        'jump_anim', 'jump_effect_anim', 'rebound_1_anim', 'rebound_2_anim', 'rebound_effect_anim',
+        'rebound_land_anim', 'land_anim', 'recoil_anim', 'respawn_anim', 'roar_lock_anim',
+        'sit_anim', 'turn_anim', 'walk_anim', 'wall_slide_anim', 'wall_jump_anim', 'look_down_anim',
+        'look_up_anim', 'mantle_cancel_anim', 'mantle_cling_anim', 'mantle_vault_anim',
+        'attack_animation_offsets', 'attack_effect_offsets', 'pose_animation_offsets',
+        'pose_effect_offsets', 'charged_effect_active', 'jump_effect_active', 'hit_flash_active',
+        'rebound_effect_active', 'attack_hit_mossgrub', 'attack_hit_mossmother',
+        'attack_recoil_applied', 'is_down_attacking', 'down_attack_momentum_active',
+        'down_attack_air_ready', 'down_attack_rebound_timer', 'down_attack_jump_lock_duration',
+        'down_attack_jump_lock_timer', 'rebound_horizontal_speed', 'active_rebound_key',
+        'rebound_land_active', 'rebound_land_pending', 'recoil_active', 'recoil_animation_name',
+        'respawn_active', 'turn_pose_active', 'move_input_x', 'respawn_x', 'respawn_y',
+        'hud_base_positions', 'hud_animation_offsets', '_hud_prev_health', '_hud_prev_silk',
+        'hud_flash_active', 'hud_frame_appear_active', 'hud_frame_appear_pending',
+        'hud_bind_orb_active', 'hud_health_appear_active', 'hud_health_appear_slots',
+        'hud_health_break_active', 'hud_health_break_slot', 'hud_silk_down_active',
+        'hud_silk_up_active', 'hud_silk_up_slots', 'hud_silk_up_animating_slots',
+        'hud_silk_up_queue', 'hud_health_last_frame', 'hud_health_break_last_frame',
+        'hud_soul_burst_active', 'hud_spool_appear_active', 'hud_show_spool_sprite',
+        'hit_flash_world_center', 'hit_white_timer', 'white_fade_timer', 'white_fade_duration',
+        'hud_flash_anim', 'hud_frame_appear_anim', 'hud_bind_orb_anim', 'hud_health_appear_anim',
+        'hud_health_break_anim', 'hud_silk_down_anim', 'hud_silk_up_anim', 'hud_soul_burst_anim',
+        'hud_spool_appear_anim', 'hud_silk_up_last_frame', 'hud_spool_image',
+    )
+
     def __init__(self, x, y, screen_width, screen_height):
         """
         Create Hornet at the given position on a screen of the given size.
@@ -50,6 +113,8 @@ class Hornet:
         
         self.rect = self.image.get_rect()
         self.rect.midbottom = (x, y)
+        # Scratch rect that draw() repositions in place each frame instead of copying self.rect
+        self._draw_rect = self.rect.copy()
         # Narrower foot rect width used only for ground landing detection.
         self._ground_foot_width = max(4, self.rect.width - 200)  # Narrow foot rect for landing detection
 
@@ -170,14 +235,12 @@ class Hornet:
         self.dash_cooldown = 0.22
         self.special_cooldown = 0.45
         self._attack_timer = 0.0
-        self._dash_timer = 0.0
-        self._special_timer = 0.0
         self._attack_triggered = False
         self._attack_key_down = False
         self._heal_key_down = False
 
         # Cached instruction text surfaces
-        self._instruction_line_surfaces = None
+        self._instructions_surface = None
 
         # Reduced combat hurtbox
         self.hitbox_inset_x = 0.28
@@ -428,6 +491,8 @@ class Hornet:
             frame_height=250,
             scale=anim_scale,
         )
+        # Decode every sheet up front, in parallel, instead of one by one on first use
+        Animation.preload_sprite_sheets(self._owned_animations())
         self._load_hornet_animation()
         self.attack_animation_offsets = {
             "forward_1": (0, 0),
@@ -593,6 +658,17 @@ class Hornet:
             frames.extend(animation.extract_frames(row, 0, frame_count_per_row, flip_x=flip_x))
         return frames
 
+    def _owned_animations(self):
+        """
+        Yield the Animation objects assigned to Hornet so far.
+        Returns:
+            Iterator[Animation]: Animations stored in Hornet's slots.
+        """
+        for name in self.__slots__:
+            value = getattr(self, name, None)
+            if isinstance(value, Animation):
+                yield value
+
     def _load_hornet_animation(self):
         """Load all Hornet combat and state animations from spritesheets."""
         self.attack_1_anim.add_animation("right", row=0, start_col=0, num_frames=5, speed=0.024, loop=False)
@@ -764,6 +840,8 @@ class Hornet:
             scale=hud_scale,
         )
 
+        # Frame counts below are measured from the sheets, so decode them all together first
+        Animation.preload_sprite_sheets(self._owned_animations())
         self._add_hud_row_animation(self.hud_flash_anim, "play", speed=0.03, loop=False)
         self._add_hud_row_animation(self.hud_frame_appear_anim, "play", speed=0.06, loop=False)
         self._add_hud_row_animation(self.hud_bind_orb_anim, "play", speed=0.06, loop=False)
@@ -1468,11 +1546,15 @@ class Hornet:
         Returns:
             list: [horizontal, vertical] camera velocity.
         """
+        # Read each key once; the attack and look branches below reuse these
+        up_pressed = keys[pygame.K_w]
+        down_pressed = keys[pygame.K_s]
+        attack_pressed = keys[pygame.K_j]
+
         # Horizontal movement (returns velocity for camera)
         self._attack_triggered = False
-        self._pressing_down = keys[pygame.K_s]
+        self._pressing_down = down_pressed
         self.velocity_x = 0
-        attack_pressed = keys[pygame.K_j]
 
         # Heal input (edge-triggered, consume all silk)
         shift_pressed = keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT]
@@ -1537,10 +1619,7 @@ class Hornet:
             self.jump_pose_active = True
             self._jump_hold_timer = 0.0
             self._start_jump_effect()
-            try:
-                self.audio_manager.play_sfx("hornet_jump")
-            except Exception:
-                pass  # Skip if sound doesn't exist
+            self.audio_manager.play_sfx("hornet_jump")
 
         # Auto-rebound from down-attack: variable height via jump hold
         if self._rebound_available:
@@ -1560,10 +1639,7 @@ class Hornet:
                 self._jump_hold_timer = 0.0
                 self.facing_right = True
                 self._start_jump_effect()
-                try:
-                    self.audio_manager.play_sfx("hornet_wall_jump")
-                except Exception:
-                    pass
+                self.audio_manager.play_sfx("hornet_wall_jump")
             elif self.touching_wall_right:
                 self.velocity_y = self.wall_jump_power_y
                 self.knockback_velocity_x = -self.wall_jump_power_x
@@ -1573,10 +1649,7 @@ class Hornet:
                 self._jump_hold_timer = 0.0
                 self.facing_right = False
                 self._start_jump_effect()
-                try:
-                    self.audio_manager.play_sfx("hornet_wall_jump")
-                except Exception:
-                    pass
+                self.audio_manager.play_sfx("hornet_wall_jump")
 
         # While holding SPACE during a jump, keep adding upward force
         if self._jumping and jump_pressed and self._jump_hold_timer < self.jump_max_hold_time:
@@ -1610,10 +1683,10 @@ class Hornet:
         if fresh_attack_press and self._attack_timer <= 0.0:
             self._attack_timer = self.attack_cooldown
             self._attack_triggered = True
-            if keys[pygame.K_w]:
+            if up_pressed:
                 self.attack_hitbox_direction = "up"
                 self._start_up_attack_animation()
-            elif keys[pygame.K_s] and not self.on_ground and self.down_attack_air_ready:
+            elif down_pressed and not self.on_ground and self.down_attack_air_ready:
                 self.attack_hitbox_direction = "down"
                 self.is_down_attacking = True
                 self.jump_pose_active = False
@@ -1628,17 +1701,8 @@ class Hornet:
                 self.attack_hitbox_direction = "forward"
                 self.is_down_attacking = False
                 self._start_forward_attack_animation()
-            try:
-                self.audio_manager.play_sfx("hornet_sword")
-            except Exception:
-                pass  # Skip if sound doesn't exist
-            try:
-                self.audio_manager.play_sfx_random([
-                    "hornet_attack_scream_1", "hornet_attack_scream_2",
-                    "hornet_attack_scream_3", "hornet_attack_scream_4",
-                ])
-            except Exception:
-                pass
+            self.audio_manager.play_sfx("hornet_sword")
+            self.audio_manager.play_sfx_random(_ATTACK_SCREAM_SFX)
         self._attack_key_down = attack_pressed
         
         # Do not let vertical attack inputs, horizontal movement, or jumping drive camera panning.
@@ -1650,12 +1714,12 @@ class Hornet:
         if directional_attack_active or moving_horizontally or in_air:
             self.look_direction = 0
             self.look_hold_timer = 0.0
-        elif keys[pygame.K_w]:
+        elif up_pressed:
             if self.look_direction != -1:
                 # Started pressing up, reset timer
                 self.look_hold_timer = 0.0
                 self.look_direction = -1
-        elif keys[pygame.K_s]:
+        elif down_pressed:
             if self.look_direction != 1:
                 # Started pressing down, reset timer
                 self.look_hold_timer = 0.0
@@ -2119,10 +2183,6 @@ class Hornet:
 
         if self._attack_timer > 0.0:
             self._attack_timer = max(0.0, self._attack_timer - dt)
-        if self._dash_timer > 0.0:
-            self._dash_timer = max(0.0, self._dash_timer - dt)
-        if self._special_timer > 0.0:
-            self._special_timer = max(0.0, self._special_timer - dt)
         if self._wall_jump_timer > 0.0:
             self._wall_jump_timer = max(0.0, self._wall_jump_timer - dt)
         if self.down_attack_rebound_timer > 0.0:
@@ -2478,10 +2538,7 @@ class Hornet:
 
         # --- Audio: landing, wall-land, footsteps ---
         if self.landed_this_frame and not self.is_dead:
-            try:
-                self.audio_manager.play_sfx("hornet_land_moss")
-            except Exception:
-                pass
+            self.audio_manager.play_sfx("hornet_land_moss")
 
         _on_wall_now2 = (
             not self.on_ground
@@ -2490,10 +2547,7 @@ class Hornet:
         )
         if _on_wall_now2:
             if not self._wall_land_played:
-                try:
-                    self.audio_manager.play_sfx("hornet_wall_land")
-                except Exception:
-                    pass
+                self.audio_manager.play_sfx("hornet_wall_land")
                 self._wall_land_played = True
         else:
             self._wall_land_played = False
@@ -2503,13 +2557,7 @@ class Hornet:
                 self._footstep_timer -= dt
                 if self._footstep_timer <= 0.0:
                     self._footstep_timer = self._footstep_interval
-                    try:
-                        self.audio_manager.play_sfx_random([
-                            "hornet_footstep_1", "hornet_footstep_2",
-                            "hornet_footstep_3", "hornet_footstep_4",
-                        ])
-                    except Exception:
-                        pass
+                    self.audio_manager.play_sfx_random(_FOOTSTEP_SFX)
             else:
                 self._footstep_timer = 0.0
         else:
@@ -2566,14 +2614,21 @@ class Hornet:
             camera_x (float): Camera x offset, used to position world-space hit flashes.
             camera_y (float): Camera y offset, used to position world-space hit flashes.
         """
-        draw_rect = self.rect.copy()
-        draw_rect.x += int(screen_offset[0])
-        draw_rect.y += int(look_y_offset + screen_offset[1])
+        draw_rect = self._draw_rect
+        draw_rect.update(
+            self.rect.x + int(screen_offset[0]),
+            self.rect.y + int(look_y_offset + screen_offset[1]),
+            self.rect.width,
+            self.rect.height,
+        )
 
         draw_hitbox_rect = None
         if self.attack_hitbox is not None:
             draw_hitbox_rect = self._build_attack_hitbox(draw_rect)
 
+        # Both facings were flipped once in __init__; pick the one to use as the fallback sprite
+        base_image = self.image_flipped if self.facing_right else self.image
+
         white_intensity = self._get_sprite_white_intensity()
         def maybe_white(surf):
             return _apply_white_overlay(surf, white_intensity) if white_intensity > 0 else surf
@@ -2611,10 +2666,8 @@ class Hornet:
                         effect_rect.x += int(effect_offset_x)
                         effect_rect.y += int(effect_offset_y)
                         screen.blit(effect_frame, effect_rect)
-            elif self.facing_right:
-                screen.blit(maybe_white(self.image_flipped), draw_rect)
             else:
-                screen.blit(maybe_white(self.image), draw_rect)
+                screen.blit(maybe_white(base_image), draw_rect)
         elif self.active_attack_animation is not None and self.attack_hitbox_direction == "up":
             attack_frame = self.active_attack_animation.get_current_frame()
             if attack_frame is not None:
@@ -2635,10 +2688,8 @@ class Hornet:
                         effect_rect.x += int(effect_offset_x)
                         effect_rect.y += int(effect_offset_y)
                         screen.blit(effect_frame, effect_rect)
-            elif self.facing_right:
-                screen.blit(maybe_white(self.image_flipped), draw_rect)
             else:
-                screen.blit(maybe_white(self.image), draw_rect)
+                screen.blit(maybe_white(base_image), draw_rect)
         elif self.active_pose_animation is not None:
             pose_frame = self.active_pose_animation.get_current_frame()
             if pose_frame is not None:
@@ -2659,14 +2710,10 @@ class Hornet:
                         effect_rect.x += int(effect_offset_x)
                         effect_rect.y += int(effect_offset_y)
                         screen.blit(effect_frame, effect_rect)
-            elif self.facing_right:
-                screen.blit(maybe_white(self.image_flipped), draw_rect)
             else:
-                screen.blit(maybe_white(self.image), draw_rect)
-        elif self.facing_right:
-            screen.blit(maybe_white(self.image_flipped), draw_rect)
+                screen.blit(maybe_white(base_image), draw_rect)
         else:
-            screen.blit(maybe_white(self.image), draw_rect)
+            screen.blit(maybe_white(base_image), draw_rect)
 
         if self.charged_effect_active:
             charged_frame = self.charged_effect_anim.get_current_frame()
@@ -2730,15 +2777,21 @@ class Hornet:
         """
         instructions_draw_x = 10
         instructions_draw_y = config.game_height - 550
-        if self._instruction_line_surfaces is None:
+        if self._instructions_surface is None:
             instructions_text = "Instructions:\nPress D to move right\nPress A to move left\nPress W to look up\nPress S to look down\nPress space to jump\nPress J to attack\nPress LSHIFT to heal"
-            self._instruction_line_surfaces = [
+            line_surfaces = [
                 config.font.render(line, True, config.white)
                 for line in instructions_text.split('\n')
             ]
-        for i, line_surface in enumerate(self._instruction_line_surfaces):
-            line_y = instructions_draw_y + (i * config.font.get_linesize())
-            screen.blit(line_surface, (instructions_draw_x, line_y))
+            # Pre-render every line into one block so the HUD blits the instructions once per frame
+            line_height = config.font.get_linesize()
+            block_width = max(line_surface.get_width() for line_surface in line_surfaces)
+            block_height = line_height * (len(line_surfaces) - 1) + line_surfaces[-1].get_height()
+            block = pygame.Surface((block_width, block_height), pygame.SRCALPHA)
+            for i, line_surface in enumerate(line_surfaces):
+                block.blit(line_surface, (0, i * line_height))
+            self._instructions_surface = block.convert_alpha()
+        screen.blit(self._instructions_surface, (instructions_draw_x, instructions_draw_y))
 
         health_x, health_y = self.hud_base_positions["health"]
         silk_x, silk_y = self.hud_base_positions["silk"]
@@ -2810,8 +2863,6 @@ class Hornet:
         self.turn_pose_active = False
         self.move_input_x = 0
         self._attack_timer = 0.0
-        self._dash_timer = 0.0
-        self._special_timer = 0.0
         self._attack_triggered = False
         self._attack_key_down = False
         self._heal_key_down = False
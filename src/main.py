@@ -7,7 +7,7 @@ import config
 from asset_paths import resolve_image_path
 from animation import Animation
 from audio import AudioManager
-from button import Button
+from button import Button, draw_buttons
 from particles import ParticleSystem
 from transition import TransitionManager, TransitionType
 from settings import SettingsMenu
@@ -47,6 +47,10 @@ class ThreadedVideoCapture:
         self._thread = None
         self.fps = 30.0
 
+        # Two decode buffers: the worker fills one while the main thread consumes the other
+        self._buffers = [None, None]
+        self._write_index = 0
+
         if self.capture.isOpened():
             self.capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
             detected_fps = float(self.capture.get(cv2.CAP_PROP_FPS) or 0.0)
@@ -64,10 +68,16 @@ class ThreadedVideoCapture:
                 continue
             self._request_frame.clear()
 
-            ok, frame = self.capture.read()
+            buffer = self._buffers[self._write_index]
+            if buffer is not None:
+                ok, frame = self.capture.read(buffer)
+            else:
+                ok, frame = self.capture.read()
             with self._lock:
                 if ok and frame is not None:
                     self._latest_frame = frame
+                    self._buffers[self._write_index] = frame
+                    self._write_index ^= 1
                 else:
                     self._latest_frame = None
                     self._ended = True
@@ -87,6 +97,7 @@ class ThreadedVideoCapture:
     def read(self, timeout=0.0):
         """
         Return `(frame, ended)` where `frame=None` means not ready yet or stream ended.
+        The returned frame is one of the two decode buffers and stays valid until the next call.
         args:
             timeout (float): How long to wait for the next frame to be ready before giving up
         returns:
@@ -99,7 +110,7 @@ class ThreadedVideoCapture:
             return None, False
 
         with self._lock:
-            frame = None if self._latest_frame is None else self._latest_frame.copy()
+            frame = self._latest_frame
             ended = self._ended
             self._latest_frame = None
             self._frame_ready.clear()
@@ -155,7 +166,7 @@ class Silksong:
     def _load_collider_map_overlays(self):
         """Load collider map layers using the editable overlay settings in config."""
         self._collider_map_layers = {}
-        overlay_config = getattr(config, "collider_map_overlay", {})
+        overlay_config = config.collider_map_overlay
         if not overlay_config.get("enabled", True):
             return
 
@@ -233,10 +244,10 @@ class Silksong:
         args:
             base_y (int): The world Y coordinate of the main ground level, used to split upper and lower collider layers.
         """
-        if not getattr(self, "_collider_map_layers", None):
+        if not self._collider_map_layers:
             return
 
-        overlay_config = getattr(config, "collider_map_overlay", {})
+        overlay_config = config.collider_map_overlay
         padding = int(overlay_config.get("padding", 40))
         global_offset_x, global_offset_y = tuple(overlay_config.get("global_offset", (0, 0)))
         split_y = base_y - int(overlay_config.get("split_y_offset", 1480))
@@ -449,6 +460,7 @@ class Silksong:
         self.player_camera_anchor_x = None
         self.player_camera_anchor_y = None
         self.mouse_locked = False
+        self.mouse_pos = (0, 0)  # sampled once per tick in update() and shared by every widget
         self.boss_arena_rect = None
         self.boss_arena_camera = None
         self.camera_locked_to_arena = False
@@ -479,6 +491,14 @@ class Silksong:
         self.respawn_position = None
         self.pending_death_respawn_transition = False
         self.ground_colliders = []
+        # Static collider index rebuilt with ground_colliders: floors and walls split once, and
+        # floors bucketed into uniform world-X columns so floor lookups only visit nearby rects
+        self._floor_colliders = []
+        self._wall_colliders = []
+        self._floor_collider_grid = {}
+        self._wide_floor_colliders = []
+        self.floor_grid_cell_size = 256
+        self.floor_grid_max_span = 16
         self.mossgrub_patrol_left = None
         self.mossgrub_patrol_right = None
         self.world_ground_y = int(config.screen_height * 0.62)
@@ -489,6 +509,7 @@ class Silksong:
         """Build world-space ground and platform colliders for the level."""
         if not self.player:
             self.ground_colliders = []
+            self._index_ground_colliders()
             self.boss_arena_rect = None
             self.boss_arena_camera = None
             self.mossgrub_patrol_left = None
@@ -536,6 +557,7 @@ class Silksong:
             pygame.Rect(arena_left, arena_ceiling_y, wall_thickness, arena_height),
             pygame.Rect(arena_right, arena_ceiling_y, wall_thickness, arena_height - 200),
         ]
+        self._index_ground_colliders()
         self._rebuild_collider_map_overlays(base_y)
 
         # Keep bench anchored to world ground, not player-specific values.
@@ -570,13 +592,17 @@ class Silksong:
             self.camera_locked_to_arena = False
             return
 
-        self.camera_x += (target_camera_x - self.camera_x) * blend
-        self.camera_y += (target_camera_y - self.camera_y) * blend
-
-        if abs(target_camera_x - self.camera_x) < 0.5:
+        # Snap once within half a pixel so a settled camera stops re-lerping every frame
+        delta_x = target_camera_x - self.camera_x
+        if abs(delta_x) < 0.5:
             self.camera_x = float(target_camera_x)
-        if abs(target_camera_y - self.camera_y) < 0.5:
+        else:
+            self.camera_x += delta_x * blend
+        delta_y = target_camera_y - self.camera_y
+        if abs(delta_y) < 0.5:
             self.camera_y = float(target_camera_y)
+        else:
+            self.camera_y += delta_y * blend
 
         self.player.rect.x = int(player_world_rect.x - self.camera_x)
         self.player.rect.y = int(player_world_rect.y - self.camera_y)
@@ -605,8 +631,15 @@ class Silksong:
                 # First frame entering the arena: seed from Hornet's current screen pos.
                 self._crop_cx = float(self.player.rect.centerx)
                 self._crop_cy = float(self.player.rect.centery)
-            self._crop_cx += (target_cx - self._crop_cx) * blend
-            self._crop_cy += (target_cy - self._crop_cy) * blend
+            # Snap once converged; otherwise the locked crop center creeps toward the target forever
+            delta_cx = target_cx - self._crop_cx
+            delta_cy = target_cy - self._crop_cy
+            if abs(delta_cx) < 0.5 and abs(delta_cy) < 0.5:
+                self._crop_cx = target_cx
+                self._crop_cy = target_cy
+            else:
+                self._crop_cx += delta_cx * blend
+                self._crop_cy += delta_cy * blend
         elif self._crop_cx is not None:
             # Camera just unlocked; lerp crop center back to Hornet.
             target_cx = float(self.player.rect.centerx)
@@ -627,6 +660,56 @@ class Silksong:
         """
         return collider_rect.width >= collider_rect.height
 
+    def _index_ground_colliders(self):
+        """Split ground_colliders into floors and walls and bucket the floors by world-X column."""
+        cell_size = self.floor_grid_cell_size
+        floors = []
+        walls = []
+        grid = {}
+        wide = []
+        for collider_rect in self.ground_colliders:
+            if not self._is_floor_collider(collider_rect):
+                walls.append(collider_rect)
+                continue
+            floors.append(collider_rect)
+            first_cell = collider_rect.left // cell_size
+            last_cell = (collider_rect.right - 1) // cell_size
+            # The main ground spans the whole level; checking it directly beats bucketing it
+            if last_cell - first_cell >= self.floor_grid_max_span:
+                wide.append(collider_rect)
+                continue
+            for cell_x in range(first_cell, last_cell + 1):
+                grid.setdefault(cell_x, []).append(collider_rect)
+        self._floor_colliders = floors
+        self._wall_colliders = walls
+        self._floor_collider_grid = grid
+        self._wide_floor_colliders = wide
+
+    def _floor_colliders_in_span(self, left, right):
+        """
+        Return the floor colliders that may overlap the world-X span [left, right).
+        A collider can appear more than once when it covers several columns, so callers
+        should only use this for order-independent searches (highest/deepest top).
+        args:
+            left (int): Left world X of the span.
+            right (int): Right world X of the span (exclusive).
+        returns:
+            list[pygame.Rect]: Candidate floor colliders.
+        """
+        cell_size = self.floor_grid_cell_size
+        first_cell = int(left // cell_size)
+        last_cell = max(first_cell, int((right - 1) // cell_size))
+        grid = self._floor_collider_grid
+        if first_cell == last_cell:
+            bucket = grid.get(first_cell)
+            return self._wide_floor_colliders + bucket if bucket else self._wide_floor_colliders
+        candidates = list(self._wide_floor_colliders)
+        for cell_x in range(first_cell, last_cell + 1):
+            bucket = grid.get(cell_x)
+            if bucket:
+                candidates.extend(bucket)
+        return candidates
+
     def _get_ground_top_at_world_x(self, world_x):
         """
         Return the top Y of the highest floor collider under the given world X.
@@ -636,9 +719,7 @@ class Silksong:
             int or None: The top Y of the highest floor collider under the given world X, or None if no collider is found.
         """
         top_y = None
-        for ground_rect in self.ground_colliders:
-            if not self._is_floor_collider(ground_rect):
-                continue
+        for ground_rect in self._floor_colliders_in_span(world_x, world_x + 1):
             if ground_rect.left <= world_x < ground_rect.right:
                 if top_y is None or ground_rect.top < top_y:
                     top_y = ground_rect.top
@@ -653,9 +734,7 @@ class Silksong:
             int or None: The top Y of the floor collider intersecting the given world-space rect, or None if no collider is found.
         """
         colliding_top = None
-        for ground_rect in self.ground_colliders:
-            if not self._is_floor_collider(ground_rect):
-                continue
+        for ground_rect in self._floor_colliders_in_span(world_rect.left, world_rect.right):
             # Require horizontal overlap.
             if world_rect.right <= ground_rect.left or world_rect.left >= ground_rect.right:
                 continue
@@ -704,9 +783,7 @@ class Silksong:
         search_bottom = world_bottom + search_radius
 
         best_floor_top = None
-        for collider_rect in self.ground_colliders:
-            if not self._is_floor_collider(collider_rect):
-                continue
+        for collider_rect in self._floor_colliders:
             if world_right <= collider_rect.left or world_left >= collider_rect.right:
                 continue
             if collider_rect.top < search_top or collider_rect.top > search_bottom:
@@ -737,9 +814,7 @@ class Silksong:
         search_bottom = world_bottom + search_radius
 
         best_floor_top = None
-        for collider_rect in self.ground_colliders:
-            if not self._is_floor_collider(collider_rect):
-                continue
+        for collider_rect in self._floor_colliders:
             if world_right <= collider_rect.left or world_left >= collider_rect.right:
                 continue
             if collider_rect.top < search_top or collider_rect.top > search_bottom:
@@ -844,9 +919,7 @@ class Silksong:
             patrol_right = int(platform_rect.centerx + 10)
 
         # Clamp patrol bounds so the grub can't walk into vertical wall colliders that sit within the patrol zone at platform height.
-        for wall_rect in self.ground_colliders:
-            if self._is_floor_collider(wall_rect):
-                continue
+        for wall_rect in self._wall_colliders:
             if wall_rect.top > platform_rect.top or wall_rect.bottom < platform_rect.top:
                 continue
             if wall_rect.right <= patrol_left or wall_rect.left >= patrol_right:
@@ -874,8 +947,7 @@ class Silksong:
         )
         self.mossgrub.velocity_y = 0
         self.mossgrub.on_ground = True
-        if hasattr(self.mossgrub, "_frac_x"):
-            self.mossgrub._frac_x = 0.0
+        self.mossgrub._frac_x = 0.0
 
     def _set_mossgrub_spawn_and_patrol(self):
         """Spawn MossGrub just above the start platform and keep its patrol bounds in world space."""
@@ -898,12 +970,30 @@ class Silksong:
 
     def _iter_mossgrub_entities(self):
         """Yield all active MossGrub entities as (entity, is_arena_spawn)."""
-        overworld = self.mossgrubs.get("overworld")
+        overworld = self.mossgrubs["overworld"]
         if overworld is not None:
             yield overworld, False
-        for arena_grub in self.mossgrubs.get("arena", {}).values():
+        for arena_grub in self.mossgrubs["arena"].values():
             yield arena_grub, True
 
+    def _live_mossgrub_world_rects(self):
+        """
+        Collect the living MossGrubs and their world-space rects for one batched overlap test.
+        returns:
+            tuple[list, list[pygame.Rect]]: Parallel lists of grubs and their world rects, in
+                _iter_mossgrub_entities order, so collidelist picks the same grub a loop would.
+        """
+        grubs = []
+        rects = []
+        offset_x = int(self.camera_x)
+        offset_y = int(self.camera_y)
+        for grub, _ in self._iter_mossgrub_entities():
+            if grub.is_dying or grub.health <= 0:
+                continue
+            grubs.append(grub)
+            rects.append(grub.rect.move(offset_x, offset_y))
+        return grubs, rects
+
     def _clear_arena_mossgrubs(self):
         """Remove all temporary arena-spawned MossGrub entities."""
         self.mossgrubs["arena"] = {}
@@ -959,7 +1049,7 @@ class Silksong:
     def _save_arena_exit_positions(self):
         """Snapshot world positions of arena mossgrubs and mossmother before Hornet exits."""
         self._arena_mossgrub_saved_positions = []
-        for grub in self.mossgrubs.get("arena", {}).values():
+        for grub in self.mossgrubs["arena"].values():
             if grub.is_dying or grub.health <= 0:
                 continue
             self._arena_mossgrub_saved_positions.append({
@@ -1006,10 +1096,15 @@ class Silksong:
             fade = self.camera_shake_timer / max(0.001, self.camera_shake_duration)
             intensity = max(0.0, self.camera_shake_intensity * fade)
             max_offset = int(round(intensity))
-            self.camera_shake_offset = (
-                random.randint(-max_offset, max_offset) if max_offset > 0 else 0,
-                random.randint(-max_offset, max_offset) if max_offset > 0 else 0,
-            )
+            if max_offset > 0:
+                # Two uniform floats scaled to [-max_offset, max_offset]; much cheaper than two randint calls
+                span = 2 * max_offset + 1
+                self.camera_shake_offset = (
+                    int(random.random() * span) - max_offset,
+                    int(random.random() * span) - max_offset,
+                )
+            else:
+                self.camera_shake_offset = (0, 0)
         else:
             self.camera_shake_duration = 0.0
             self.camera_shake_intensity = 0.0
@@ -1055,22 +1150,25 @@ class Silksong:
         if not self.falling_rocks and not self.rock_explosions:
             return
 
-        # Advance existing rock explosion animations
-        active_explosions = []
-        for exp in self.rock_explosions:
+        # Advance existing rock explosion animations, compacting finished ones in place
+        explosions = self.rock_explosions
+        write = 0
+        for exp in explosions:
             exp["elapsed"] += dt
             if exp["elapsed"] >= exp["frame_speed"]:
                 exp["elapsed"] -= exp["frame_speed"]
                 exp["frame"] += 1
             if exp["frame"] < exp["total_frames"]:
-                active_explosions.append(exp)
-        self.rock_explosions = active_explosions
+                explosions[write] = exp
+                write += 1
+        del explosions[write:]
 
         if not self.falling_rocks:
             return
 
-        remaining_rocks = []
-        for rock in self.falling_rocks:
+        rocks = self.falling_rocks
+        write = 0
+        for rock in rocks:
             rock_rect = rock["rect"]
             rock["velocity_y"] += self.rock_fall_gravity * dt
             rock_rect.y += int(rock["velocity_y"] * dt)
@@ -1097,9 +1195,10 @@ class Silksong:
                 self.player.take_damage(1, knockback_direction=knockback_direction)
                 self.player_contact_damage_timer = self.player_contact_damage_cooldown
 
-            remaining_rocks.append(rock)
+            rocks[write] = rock
+            write += 1
 
-        self.falling_rocks = remaining_rocks
+        del rocks[write:]
 
     def _spawn_enemy_death_fung_motes(self, enemy_world_rect):
         """
@@ -1127,7 +1226,7 @@ class Silksong:
                 grub._fung_mote_death_spawned = False
                 continue
 
-            if getattr(grub, "_fung_mote_death_spawned", False):
+            if grub._fung_mote_death_spawned:
                 continue
 
             grub_world_rect = grub.rect.copy()
@@ -1139,7 +1238,7 @@ class Silksong:
         if self.mossmother:
             if self.mossmother.health > 0:
                 self.mossmother._fung_mote_death_spawned = False
-            elif not getattr(self.mossmother, "_fung_mote_death_spawned", False):
+            elif not self.mossmother._fung_mote_death_spawned:
                 mossmother_world_rect = self.mossmother.rect.copy()
                 mossmother_world_rect.x += int(self.camera_x)
                 mossmother_world_rect.y += int(self.camera_y)
@@ -1166,32 +1265,48 @@ class Silksong:
             dt (float): The time delta in seconds since the last update.
         """
         for button in self.buttons.values():
-            button.update(dt)
+            button.update(dt, self.mouse_pos)
 
         if self.pending_title_timer > 0.0:
             self.pending_title_timer = max(0.0, self.pending_title_timer - dt)
             if self.pending_title_timer <= 0.0 and self.pending_title_action is not None:
                 action = self.pending_title_action
                 self.pending_title_action = None
-                if action == "start":
-                    self.change_state("save files")
-                elif action == "settings":
-                    self.settings_menu.show()
-                    self.change_state("settings")
-                elif action == "exit":
-                    self.running = False
+                handler = self._TITLE_ACTION_HANDLERS.get(action)
+                if handler is not None:
+                    handler(self)
         
         # Enable ember spawning and update particle system
         self.particle_system.enable_ember_spawning(True)
         self.particle_system.update(dt)
     
+    def _title_action_start(self):
+        """Open the save file screen from the title menu."""
+        self.change_state("save files")
+
+    def _title_action_settings(self):
+        """Open the settings menu from the title menu."""
+        self.settings_menu.show()
+        self.change_state("settings")
+
+    def _title_action_exit(self):
+        """Quit the game from the title menu."""
+        self.running = False
+
+    # Title button name -> deferred action, built once at class creation
+    _TITLE_ACTION_HANDLERS = {
+        "start": _title_action_start,
+        "settings": _title_action_settings,
+        "exit": _title_action_exit,
+    }
+
     def update_settings(self, dt):
         """
         Update the settings menu elements and handle interactions.
         args:
             dt (float): The time delta in seconds since the last update.
         """
-        self.settings_menu.update(dt)
+        self.settings_menu.update(dt, self.mouse_pos)
     
     def update_save_files(self, dt):
         """
@@ -1205,7 +1320,7 @@ class Silksong:
                 self.change_state("title screen")
                 return
 
-        self.save_file.update(dt)
+        self.save_file.update(dt, self.mouse_pos)
 
     def trigger_ui_flash(self, x=None, y=None):
         """
@@ -1260,8 +1375,9 @@ class Silksong:
         args:
             frame (numpy.ndarray): The OpenCV frame to convert.
         """
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        frame_h, frame_w = rgb_frame.shape[:2]
+        # pygame reads OpenCV's BGR layout directly, so no cvtColor pass or tobytes() copy is
+        # needed; convert() below performs the only per-frame pixel copy.
+        frame_h, frame_w = frame.shape[:2]
 
         if self.cutscene_target_size is None:
             scale = min(config.screen_width / frame_w, config.screen_height / frame_h)
@@ -1270,13 +1386,13 @@ class Silksong:
             self.cutscene_target_size = (scaled_width, scaled_height)
 
         if (frame_w, frame_h) != self.cutscene_target_size:
-            rgb_frame = cv2.resize(rgb_frame, self.cutscene_target_size, interpolation=cv2.INTER_AREA)
+            frame = cv2.resize(frame, self.cutscene_target_size, interpolation=cv2.INTER_AREA)
             frame_w, frame_h = self.cutscene_target_size
 
         self.cutscene_surface = pygame.image.frombuffer(
-            rgb_frame.tobytes(),
+            frame,
             (frame_w, frame_h),
-            "RGB"
+            "BGR"
         ).convert()
         self.cutscene_rect = self.cutscene_surface.get_rect(center=(config.screen_width // 2, config.screen_height // 2))
 
@@ -1339,7 +1455,7 @@ class Silksong:
             self.change_state(next_state)
             return
 
-        self.cutscene_fps = max(1.0, float(getattr(self.cutscene_capture, "fps", 30.0)))
+        self.cutscene_fps = max(1.0, self.cutscene_capture.fps)
 
         first_frame_status = self._read_next_cutscene_frame(wait_timeout=0.35)
         if first_frame_status is False:
@@ -1382,8 +1498,7 @@ class Silksong:
         """
         if self.transition_manager.active:
             return
-        mouse_pos = pygame.mouse.get_pos()
-        self.tutorial.update(dt, mouse_pos)
+        self.tutorial.update(dt, self.mouse_pos)
 
     def update_game(self, dt):
         """
@@ -1391,7 +1506,7 @@ class Silksong:
         args:
             dt (float): The time elapsed since the last update in seconds.
         """
-        self.game_back_button.update(dt)
+        self.game_back_button.update(dt, self.mouse_pos)
 
         if self.pending_game_back_timer > 0.0:
             self.pending_game_back_timer = max(0.0, self.pending_game_back_timer - dt)
@@ -1447,9 +1562,7 @@ class Silksong:
         _pw = player.rect.width
         _ph = player.rect.height
 
-        for _wall in self.ground_colliders:
-            if self._is_floor_collider(_wall):
-                continue
+        for _wall in self._wall_colliders:
             # Vertical guard: skip if Hornet is entirely above or below the wall.
             if _curr_wy + _ph <= _wall.top + 4 or _curr_wy >= _wall.bottom:
                 continue
@@ -1587,9 +1700,7 @@ class Silksong:
                 grub_world_rect = grub.rect.copy()
                 grub_world_rect.x += int(self.camera_x)
                 grub_world_rect.y += int(self.camera_y)
-                for _wall in self.ground_colliders:
-                    if self._is_floor_collider(_wall):
-                        continue
+                for _wall in self._wall_colliders:
                     if not grub_world_rect.colliderect(_wall):
                         continue
                     if grub_world_rect.bottom <= _wall.top + 4:
@@ -1653,15 +1764,12 @@ class Silksong:
         if player.attack_hitbox:
             attack_rect = player.attack_hitbox
 
-            for grub, _ in self._iter_mossgrub_entities():
-                if player.attack_hit_mossgrub:
-                    break
-                if grub.is_dying or grub.health <= 0:
-                    continue
-                mossgrub_world = grub.rect.copy()
-                mossgrub_world.x += int(self.camera_x)
-                mossgrub_world.y += int(self.camera_y)
-                if attack_rect.colliderect(mossgrub_world):
+            if not player.attack_hit_mossgrub:
+                live_grubs, live_grub_rects = self._live_mossgrub_world_rects()
+                hit_index = attack_rect.collidelist(live_grub_rects)
+                if hit_index != -1:
+                    grub = live_grubs[hit_index]
+                    mossgrub_world = live_grub_rects[hit_index]
                     knockback_direction = 1 if player_world_rect.centerx < mossgrub_world.centerx else -1
                     grub.take_damage(self.attack_damage, knockback_direction=knockback_direction)
                     player.apply_attack_recoil_on_hit(enemy_rect=mossgrub_world)
@@ -1688,17 +1796,13 @@ class Silksong:
 
         # Contact damage: compare both in screen space
         if self.player_contact_damage_timer <= 0.0:
-            for grub, _ in self._iter_mossgrub_entities():
-                if grub.is_dying or grub.health <= 0:
-                    continue
-                mossgrub_world = grub.rect.copy()
-                mossgrub_world.x += int(self.camera_x)
-                mossgrub_world.y += int(self.camera_y)
-                if player_world_hitbox.colliderect(mossgrub_world):
-                    knockback_direction = -1 if player_world_hitbox.centerx < mossgrub_world.centerx else 1
-                    player.take_damage(1, knockback_direction=knockback_direction)
-                    self.player_contact_damage_timer = self.player_contact_damage_cooldown
-                    break
+            _, live_grub_rects = self._live_mossgrub_world_rects()
+            hit_index = player_world_hitbox.collidelist(live_grub_rects)
+            if hit_index != -1:
+                mossgrub_world = live_grub_rects[hit_index]
+                knockback_direction = -1 if player_world_hitbox.centerx < mossgrub_world.centerx else 1
+                player.take_damage(1, knockback_direction=knockback_direction)
+                self.player_contact_damage_timer = self.player_contact_damage_cooldown
 
         if self.mossmother and self.mossmother.health > 0:
             mossmother_hitbox_world = self.mossmother.get_world_hitbox(camera_x=self.camera_x, camera_y=self.camera_y)
@@ -1997,14 +2101,13 @@ class Silksong:
         # Draw large ember particles (in front of boneforest)
         self.particle_system.draw_particles(self.screen, size_min=5.0)
 
-        # Draw buttons
-        for button in self.buttons.values():
-            button.draw(self.screen)
+        # Draw buttons (batched into one blits call)
+        draw_buttons(self.screen, self.buttons.values())
                 
     def draw_settings(self):
         """Render the settings overlay on top of the background."""
-        self.screen.blit(self.background_image, (0, 0))
-        self.settings_menu.draw(self.screen, self.settings_menu.font)
+        # The menu blits the background itself, pre-blended with its dim backdrop
+        self.settings_menu.draw(self.screen, self.settings_menu.font, background=self.background_image)
 
     def draw_save_file(self):
         """Render the save-file selection screen."""
@@ -2013,14 +2116,17 @@ class Silksong:
     
     def draw_cutscene(self):
         """Render the active cutscene frame with a skip hint."""
-        self.screen.fill((0, 0, 0))
+        # Clear only when the frame leaves letterbox bars; a full-screen frame overwrites everything
+        if not (self.cutscene_surface and self.cutscene_rect and self.cutscene_rect.contains(self.screen.get_rect())):
+            self.screen.fill((0, 0, 0))
 
         if self.cutscene_surface and self.cutscene_rect:
             self.screen.blit(self.cutscene_surface, self.cutscene_rect)
 
         if self._cutscene_skip_hint_surface is None:
-            hint_font = config.get_font(24)
-            self._cutscene_skip_hint_surface = hint_font.render("Press any key or click to skip", True, (220, 220, 220))
+            self._cutscene_skip_hint_surface = config.render_text(
+                config.get_font(24), "Press any key or click to skip", (220, 220, 220)
+            )
             self._cutscene_skip_hint_rect = self._cutscene_skip_hint_surface.get_rect(
                 midbottom=(config.screen_width // 2, config.screen_height - 24)
             )
@@ -2028,7 +2134,7 @@ class Silksong:
 
     def draw_tutorial(self):
         """Render the tutorial overlay (dark background + slide panel)."""
-        self.screen.fill((0, 0, 0))
+        # Tutorial.draw paints its own full-screen backdrop, so no clear is needed first
         self.tutorial.draw(self.screen)
 
     def draw_game(self):
@@ -2042,24 +2148,27 @@ class Silksong:
         shake_x, shake_y = self.camera_shake_offset
 
         ws = self._world_surface
-        # Only clear the viewport region — the rest of _world_surface is never displayed.
-        vw = config.camera_viewport_width
-        vh = config.camera_viewport_height
-        if self.player:
-            if self._crop_cx is not None:
-                _fill_cx = self._crop_cx
-                _fill_cy = self._crop_cy
+        # The parallax background is clamped to cover the whole world surface whenever it is at
+        # least that large, so clearing first would only rewrite pixels about to be overdrawn.
+        bg_width, bg_height = self.game_background_image.get_size()
+        if bg_width < config.game_width or bg_height < config.game_height:
+            # Only clear the viewport region — the rest of _world_surface is never displayed.
+            vw = config.camera_viewport_width
+            vh = config.camera_viewport_height
+            if self.player:
+                if self._crop_cx is not None:
+                    _fill_cx = self._crop_cx
+                    _fill_cy = self._crop_cy
+                else:
+                    _fill_cx = float(self.player.rect.centerx)
+                    _fill_cy = float(self.player.rect.centery)
+                _fill_x = max(0, min(config.game_width - vw, int(_fill_cx - vw // 2)))
+                _fill_y = max(0, min(config.game_height - vh, int(_fill_cy - vh // 2)))
             else:
-                _fill_cx = float(self.player.rect.centerx)
-                _fill_cy = float(self.player.rect.centery)
-            _fill_x = max(0, min(config.game_width - vw, int(_fill_cx - vw // 2)))
-            _fill_y = max(0, min(config.game_height - vh, int(_fill_cy - vh // 2)))
-        else:
-            _fill_x = (config.game_width - vw) // 2
-            _fill_y = (config.game_height - vh) // 2
-        ws.fill((0, 0, 0), pygame.Rect(_fill_x, _fill_y, vw, vh))
+                _fill_x = (config.game_width - vw) // 2
+                _fill_y = (config.game_height - vh) // 2
+            ws.fill((0, 0, 0), pygame.Rect(_fill_x, _fill_y, vw, vh))
 
-        bg_width, bg_height = self.game_background_image.get_size()
         bg_x = int((config.screen_width - bg_width) / 2 - self.camera_x * 0.18 + shake_x)
         bg_y = int((config.screen_height - bg_height) / 2 - self.camera_y * 0.12 - look_y * 0.35 + shake_y)
         bg_x = min(0, max(config.screen_width - bg_width, bg_x))
@@ -2067,7 +2176,7 @@ class Silksong:
         ws.blit(self.game_background_image, (bg_x, bg_y))
 
         # Draw collider map overlay layers aligned to world space.
-        for layer_data in getattr(self, "_collider_map_layers", {}).values():
+        for layer_data in (self._collider_map_layers or {}).values():
             layer_image = layer_data.get("image")
             layer_origin = layer_data.get("world_origin")
             if layer_image is None or layer_origin is None:
@@ -2100,18 +2209,21 @@ class Silksong:
             ey = int(egg_world_y - self.camera_y - look_y + shake_y) - egg_img.get_height() // 2
             ws.blit(egg_img, (ex, ey))
 
-        if self.moss_collapse_plat_image is not None:
+        if self.moss_collapse_plat_image is not None and self.falling_rocks:
+            # The camera offset is the same for every rock, so compute it once per frame
+            rock_dx = -int(self.camera_x - shake_x)
+            rock_dy = -int(self.camera_y + look_y - shake_y)
+            rock_img = self.moss_collapse_plat_image
             for rock in self.falling_rocks:
-                rock_draw_rect = rock["rect"].copy()
-                rock_draw_rect.x -= int(self.camera_x - shake_x)
-                rock_draw_rect.y -= int(self.camera_y + look_y - shake_y)
-                ws.blit(self.moss_collapse_plat_image, rock_draw_rect)
+                ws.blit(rock_img, rock["rect"].move(rock_dx, rock_dy))
 
-        if self._rock_explode_frames:
+        if self._rock_explode_frames and self.rock_explosions:
+            exp_dx = shake_x - self.camera_x
+            exp_dy = shake_y - self.camera_y - look_y
             for exp in self.rock_explosions:
                 frame_surf = self._rock_explode_frames[exp["frame"]]
-                screen_x = int(exp["world_x"] - self.camera_x + shake_x) - frame_surf.get_width() // 2
-                screen_y = int(exp["world_y"] - self.camera_y - look_y + shake_y) - frame_surf.get_height() // 2
+                screen_x = int(exp["world_x"] + exp_dx) - frame_surf.get_width() // 2
+                screen_y = int(exp["world_y"] + exp_dy) - frame_surf.get_height() // 2
                 ws.blit(frame_surf, (screen_x, screen_y))
 
         if self.player:
@@ -2151,14 +2263,17 @@ class Silksong:
         if self.player:
             if self.bench_interact_text:
                 if self._bench_prompt_cache_text != self.bench_interact_text:
-                    prompt_font = config.get_font(32)
-                    self._bench_prompt_cache_surface = prompt_font.render(self.bench_interact_text, True, config.white)
+                    # Shared text cache: display-format surface, so the per-frame blit skips conversion
+                    self._bench_prompt_cache_surface = config.render_text(
+                        config.get_font(32), self.bench_interact_text, config.white
+                    )
                     self._bench_prompt_cache_rect = self._bench_prompt_cache_surface.get_rect(
                         center=(config.screen_width // 2, 130)
                     )
                     bg_rect = self._bench_prompt_cache_rect.inflate(24, 14)
                     self._bench_prompt_cache_bg = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
                     self._bench_prompt_cache_bg.fill((0, 0, 0, 150))
+                    self._bench_prompt_cache_bg = self._bench_prompt_cache_bg.convert_alpha()
                     self._bench_prompt_cache_bg_topleft = bg_rect.topleft
                     self._bench_prompt_cache_text = self.bench_interact_text
                 self.screen.blit(self._bench_prompt_cache_bg, self._bench_prompt_cache_bg_topleft)
@@ -2168,37 +2283,42 @@ class Silksong:
 
         self.game_back_button.draw(self.screen)
     
+    # State name -> per-frame draw/update method, built once at class creation
+    _STATE_DRAW_HANDLERS = {
+        "title screen": draw_title_screen,
+        "settings": draw_settings,
+        "save files": draw_save_file,
+        "cutscene": draw_cutscene,
+        "tutorial": draw_tutorial,
+        "game": draw_game,
+    }
+    _STATE_UPDATE_HANDLERS = {
+        "title screen": update_title_screen,
+        "settings": update_settings,
+        "save files": update_save_files,
+        "cutscene": update_cutscene,
+        "tutorial": update_tutorial,
+        "game": update_game,
+    }
+
     def draw(self):
         """Render the current state to the screen."""
-        if self.cursor_image:
-            pygame.mouse.set_visible(False)
-        else:
-            pygame.mouse.set_visible(True)
-
-        if self.state == "title screen":
-            self.draw_title_screen()
-        elif self.state == "settings":
-            self.draw_settings()
-        elif self.state == "save files":
-            self.draw_save_file()
-        elif self.state == "cutscene":
-            self.draw_cutscene()
-        elif self.state == "tutorial":
-            self.draw_tutorial()
-        elif self.state == "game":
-            self.draw_game()
-
-        # Apply brightness setting to the rendered scene (1.0 = normal, 0.0 = fully dark)
-        brightness = self.settings_menu.settings_data.get('brightness', 0.8)
-        brightness = max(0.0, min(1.0, brightness))
-        if brightness < 1.0:
-            darkness_alpha = int((1.0 - brightness) * 255)
+        # OS cursor visibility is set once in __init__ (the custom cursor image never changes)
+        draw_state = self._STATE_DRAW_HANDLERS.get(self.state)
+        if draw_state is not None:
+            draw_state(self)
+
+        # Apply brightness setting to the rendered scene (alpha precomputed by the settings menu)
+        darkness_alpha = self.settings_menu.darkness_alpha
+        if darkness_alpha > 0:
             if self._brightness_overlay_alpha != darkness_alpha:
                 self._brightness_overlay.fill((0, 0, 0, darkness_alpha))
                 self._brightness_overlay_alpha = darkness_alpha
             self.screen.blit(self._brightness_overlay, (0, 0))
 
-        self._draw_ui_flash()
+        # Overlays are skipped outright when idle rather than entering their draw helpers
+        if self.ui_flash_active:
+            self._draw_ui_flash()
         
         # Draw transition overlay on top of everything
         if self.transition_manager.active:
@@ -2206,7 +2326,7 @@ class Silksong:
 
         # Draw custom cursor on top of all UI
         if self.cursor_image:
-            mouse_x, mouse_y = pygame.mouse.get_pos()
+            mouse_x, mouse_y = self.mouse_pos
             self.screen.blit(self.cursor_image, (mouse_x - self.cursor_hotspot[0], mouse_y - self.cursor_hotspot[1]))
         
         pygame.display.flip()
@@ -2218,24 +2338,16 @@ class Silksong:
             dt (float): The time elapsed since the last update in seconds.
         """
         self._update_mouse_lock()
+        self.mouse_pos = pygame.mouse.get_pos()
         self._update_camera_shake(dt)
         self._update_ui_flash(dt)
 
         # Update transition manager
         self.transition_manager.update(dt)
 
-        if self.state == "title screen":
-            self.update_title_screen(dt)
-        elif self.state == "settings":
-            self.update_settings(dt)
-        elif self.state == "save files":
-            self.update_save_files(dt)
-        elif self.state == "cutscene":
-            self.update_cutscene(dt)
-        elif self.state == "tutorial":
-            self.update_tutorial(dt)
-        elif self.state == "game":
-            self.update_game(dt)
+        update_state = self._STATE_UPDATE_HANDLERS.get(self.state)
+        if update_state is not None:
+            update_state(self, dt)
             
     def handle_events(self):
         """Process all pending pygame events and dispatch by state."""
@@ -2282,24 +2394,15 @@ class Silksong:
                     if self.pending_title_timer > 0.0:
                         continue
 
-                    if self.buttons['start'].is_clicked(pos):
-                        self.audio_manager.play_sfx("button_click")
-                        self.trigger_ui_flash(self.buttons['start'].x, self.buttons['start'].y)
-                        self.buttons['start'].press()
-                        self.pending_title_action = "start"
-                        self.pending_title_timer = self.title_button_click_delay
-                    if self.buttons['exit'].is_clicked(pos):
-                        self.audio_manager.play_sfx("button_click")
-                        self.trigger_ui_flash(self.buttons['exit'].x, self.buttons['exit'].y)
-                        self.buttons['exit'].press()
-                        self.pending_title_action = "exit"
-                        self.pending_title_timer = self.title_button_click_delay
-                    if self.buttons['settings'].is_clicked(pos):
-                        self.audio_manager.play_sfx("button_click")
-                        self.trigger_ui_flash(self.buttons['settings'].x, self.buttons['settings'].y)
-                        self.buttons['settings'].press()
-                        self.pending_title_action = "settings"
-                        self.pending_title_timer = self.title_button_click_delay
+                    for action in self._TITLE_ACTION_HANDLERS:
+                        button = self.buttons[action]
+                        if button.is_clicked(pos):
+                            self.audio_manager.play_sfx("button_click")
+                            self.trigger_ui_flash(button.x, button.y)
+                            button.press()
+                            self.pending_title_action = action
+                            self.pending_title_timer = self.title_button_click_delay
+                            break
                 
                 elif self.state == "save files":
                     if self.pending_save_files_back_timer > 0.0:
@@ -2330,7 +2433,6 @@ class Silksong:
                         self.mossmother = MossMother((start_x + 1200), (base_y - 1800) - 200, config.screen_width, config.screen_height)
                         self.player.reset_position(start_x, base_y)
                         self.player.on_ground = True
-                        self._build_ground_colliders()
                         # Mossgrub will be placed after camera is finalized below
                         self.camera_x = 0
                         self.camera_y = 0
@@ -2510,9 +2612,11 @@ class Silksong:
             self.handle_events()
             self.update(dt)
             self.draw()
+            self.audio_manager.tick()
 
         # Save one last time before exiting
         self.save_current_game_state(force=True)
+        self.audio_manager.flush_settings()
         self._release_cutscene_resources()
         # Stop all SFX channels on exit
         self.audio_manager.stop_all_sfx()
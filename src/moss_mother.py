@@ -1,14 +1,13 @@
 import pygame
 import math
 import random
+from collections import deque
 from animation import Animation
 from audio import AudioManager
 from asset_paths import resolve_image_path
 import config
 
 
-_white_overlay_cache: dict = {}
-
 def _apply_white_overlay(surface, intensity):
     """
     Return a copy of surface blended with white at the given intensity.
@@ -19,13 +18,8 @@ def _apply_white_overlay(surface, intensity):
         pygame.Surface: New surface with white overlay applied.
     """
     result = surface.copy()
-    size = surface.get_size()
-    white_layer = _white_overlay_cache.get(size)
-    if white_layer is None:
-        white_layer = pygame.Surface(size)
-        _white_overlay_cache[size] = white_layer
-    white_layer.fill((intensity, intensity, intensity))
-    result.blit(white_layer, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
+    # Additive fill brightens in place; no full-size white layer to allocate, fill and blit
+    result.fill((intensity, intensity, intensity), special_flags=pygame.BLEND_RGB_ADD)
     return result
 
 
@@ -35,6 +29,8 @@ class MossMother:
     FRAME_WIDTH = 253
     FRAME_HEIGHT = 282
     ANIMATION_SCALE = 0.45
+    # 8-connected BFS step offsets, built once instead of per search
+    _BFS_NEIGHBORS = ((-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1))
 
     def __init__(self, x, y, screen_width, screen_height):
         """
@@ -146,6 +142,8 @@ class MossMother:
         self.next_stagger_idx = 0
         self.stagger_recovery_time = 0.6
         self.stagger_recovery_timer = 0.0
+        # Set by the game once the death fung-mote burst has been emitted
+        self._fung_mote_death_spawned = False
 
         # Knockback
         self.knockback_velocity_x = 0.0
@@ -156,6 +154,10 @@ class MossMother:
         # Constant for pathfinding
         self.cell_size = 64
         self.path_search_radius = 18
+        # Grid cells already tested against the colliders; valid for one collider list and box size
+        self._blocked_cells = {}
+        self._blocked_cells_source = None
+        self._blocked_cells_box = None
 
         # Camera velocity cache
         self._camera_velocity = [0, 0]
@@ -670,14 +672,21 @@ class MossMother:
         if collision_rects is None:
             return target_world
 
+        # Use the boss collision box for checking; one rect is moved around instead of
+        # allocating one per cell, and collidelist runs the overlap scan in C.
+        candidate = pygame.Rect(0, 0, self.rect.width * 0.8, self.rect.height * 0.8)
+
         def is_point_blocked(px, py):
-            # Use the boss collision box for checking.
-            candidate = pygame.Rect(0, 0, self.rect.width * 0.8, self.rect.height * 0.8)
             candidate.center = (px, py)
-            for cr in collision_rects:
-                if candidate.colliderect(cr):
-                    return True
-            return False
+            return candidate.collidelist(collision_rects) != -1
+
+        # The colliders are static, so a cell's blocked state only changes with the collider
+        # list or the box size; reuse earlier results instead of re-testing every frame
+        if self._blocked_cells_source is not collision_rects or self._blocked_cells_box != candidate.size:
+            self._blocked_cells = {}
+            self._blocked_cells_source = collision_rects
+            self._blocked_cells_box = candidate.size
+        blocked_cells = self._blocked_cells
 
         sx, sy = start_world
         tx, ty = target_world
@@ -689,13 +698,13 @@ class MossMother:
             return target_world
 
         visited = set([start_cell])
-        queue = [start_cell]
+        queue = deque([start_cell])
         parent = {start_cell: None}
 
-        neighbors = [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)]
+        neighbors = self._BFS_NEIGHBORS
 
         while queue:
-            cx, cy = queue.pop(0)
+            cx, cy = queue.popleft()
             if (cx, cy) == target_cell:
                 break
 
@@ -707,10 +716,12 @@ class MossMother:
                     continue
                 visited.add((nx, ny))
 
-                world_x = (nx + 0.5) * self.cell_size
-                world_y = (ny + 0.5) * self.cell_size
-
-                if is_point_blocked(world_x, world_y):
+                blocked = blocked_cells.get((nx, ny))
+                if blocked is None:
+                    world_x = (nx + 0.5) * self.cell_size
+                    world_y = (ny + 0.5) * self.cell_size
+                    blocked = blocked_cells[(nx, ny)] = is_point_blocked(world_x, world_y)
+                if blocked:
                     continue
 
                 parent[(nx, ny)] = (cx, cy)
@@ -829,7 +840,8 @@ class MossMother:
             sx, sy = self.attack_start
             mx, my = self.attack_mid
             x = sx + (mx - sx) * t
-            y = my - (my - sy) * ((1.0 - t) ** 2)
+            u = 1.0 - t
+            y = my - (my - sy) * (u * u)
             self._set_world_center(x, y, camera_x=camera_x, camera_y=camera_y)
             self.facing_right = mx >= sx
 
@@ -939,16 +951,15 @@ class MossMother:
 
         dx = target_world[0] - world_x
         dy = target_world[1] - world_y
-        dist = math.hypot(dx, dy)
-        if dist > 1e-3:
-            norm_x = dx / dist
-            norm_y = dy / dist
+        dist_sq = dx * dx + dy * dy
+        if dist_sq > 1e-6:
+            # One sqrt and one divide give the speed-per-unit factor for both axes
+            step_scale = self.speed / math.sqrt(dist_sq)
+            self.velocity_x = dx * step_scale
+            self.velocity_y = dy * step_scale
         else:
-            norm_x = 0.0
-            norm_y = 0.0
-
-        self.velocity_x = norm_x * self.speed
-        self.velocity_y = norm_y * self.speed
+            self.velocity_x = 0.0
+            self.velocity_y = 0.0
 
         self.rect.x += int(self.velocity_x * dt)
         self._resolve_horizontal_collisions(collision_rects, camera_x=camera_x, camera_y=camera_y)
@@ -1347,13 +1358,12 @@ class MossMother:
         Returns:
             pygame.Rect: Adjusted rect for blitting the sprite.
         """
-        draw_rect = self.rect.copy()
-        draw_rect.x += int(screen_offset[0])
-        draw_rect.y += int(look_y_offset + screen_offset[1])
         offset_x, offset_y = self._get_animation_draw_offset()
-        draw_rect.x += int(offset_x)
-        draw_rect.y += int(offset_y)
-        return draw_rect
+        # One move() builds the result rect instead of a copy plus four in-place shifts
+        return self.rect.move(
+            int(screen_offset[0]) + int(offset_x),
+            int(look_y_offset + screen_offset[1]) + int(offset_y),
+        )
 
     def draw(self, screen, look_y_offset=0, screen_offset=(0, 0)):
         """
@@ -1368,10 +1378,8 @@ class MossMother:
 
         if self.is_dying and not self.death_body_visible:
             for part in self.death_parts:
-                draw_rect = part["rect"].copy()
-                draw_rect.x += int(screen_offset[0])
-                draw_rect.y += int(look_y_offset + screen_offset[1])
-                screen.blit(part["image"], draw_rect)
+                part_rect = part["rect"]
+                screen.blit(part["image"], (part_rect.x + int(screen_offset[0]), part_rect.y + int(look_y_offset + screen_offset[1])))
             return
 
         draw_surf = _apply_white_overlay(self.image, int(255 * self.hit_white_timer / 0.12)) if self.hit_white_timer > 0.0 else self.image
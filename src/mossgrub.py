@@ -6,8 +6,6 @@ from asset_paths import resolve_image_path
 import config
 
 
-_white_overlay_cache: dict = {}
-
 def _apply_white_overlay(surface, intensity):
     """
     Return a copy of surface blended with white at the given intensity.
@@ -18,13 +16,8 @@ def _apply_white_overlay(surface, intensity):
         pygame.Surface: New surface with white overlay applied.
     """
     result = surface.copy()
-    size = surface.get_size()
-    white_layer = _white_overlay_cache.get(size)
-    if white_layer is None:
-        white_layer = pygame.Surface(size)
-        _white_overlay_cache[size] = white_layer
-    white_layer.fill((intensity, intensity, intensity))
-    result.blit(white_layer, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
+    # Additive fill brightens in place; no full-size white layer to allocate, fill and blit
+    result.fill((intensity, intensity, intensity), special_flags=pygame.BLEND_RGB_ADD)
     return result
 
 
@@ -113,6 +106,8 @@ class MossGrub:
         # Sub-pixel accumulator for horizontal movement precision.
         self._frac_x = 0.0
         self.hit_white_timer = 0.0
+        # Set by the game once the death fung-mote burst has been emitted
+        self._fung_mote_death_spawned = False
     
     def _load_mossgrub_animation(self):
         """Load mossgrub animations from spritesheet."""
@@ -433,13 +428,12 @@ class MossGrub:
         Returns:
             pygame.Rect: Adjusted rect for blitting the sprite.
         """
-        draw_rect = self.rect.copy()
-        draw_rect.x += int(screen_offset[0])
-        draw_rect.y += int(look_y_offset + screen_offset[1])
         offset_x, offset_y = self._get_animation_draw_offset()
-        draw_rect.x += int(offset_x)
-        draw_rect.y += int(offset_y)
-        return draw_rect
+        # One move() builds the result rect instead of a copy plus four in-place shifts
+        return self.rect.move(
+            int(screen_offset[0]) + int(offset_x),
+            int(look_y_offset + screen_offset[1]) + int(offset_y),
+        )
 
     def draw(self, screen, look_y_offset=0, screen_offset=(0, 0)):
         """
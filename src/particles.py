@@ -2,7 +2,169 @@ import pygame
 import random
 import math
 import os
-from typing import List, Dict, Tuple
+import sys
+import numpy as np
+from typing import List, Tuple
+
+# Optional dependency: numba JIT-compiles the particle kernels (falls back to NumPy without it)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    njit = None
+
+# Column layout of the ember state array (one row per ember)
+_E_X, _E_Y, _E_VX, _E_VY = 0, 1, 2, 3
+_E_LIFE, _E_INITIAL_LIFE = 4, 5
+_E_SIZE, _E_SIZE_RATE, _E_MIN_SIZE, _E_MAX_SIZE = 6, 7, 8, 9
+_E_ANGLE, _E_TIME, _E_SIN_FREQ, _E_SIN_AMP = 10, 11, 12, 13
+_E_EXTENT, _E_IMAGE = 14, 15
+_E_FIELDS = 16
+
+# Spark/smoke burst kinds and column layout of the burst state array (one row per particle)
+_PK_SPARK, _PK_SMOKE = 0, 1
+_P_X, _P_Y, _P_VX, _P_VY = 0, 1, 2, 3
+_P_LIFE, _P_INITIAL_LIFE, _P_SIZE, _P_GRAVITY = 4, 5, 6, 7
+_P_KIND, _P_R, _P_G, _P_B = 8, 9, 10, 11
+_P_FIELDS = 12
+
+# Column layout of the floating-text state array (one row per popup)
+_T_X, _T_Y, _T_VY, _T_TIME, _T_DURATION = 0, 1, 2, 3, 4
+_T_FIELDS = 5
+
+# Gameplay particle type codes and column layout of the gameplay state array
+_GP_FUNG_MOTE, _GP_MOSSBONE, _GP_CORAL_ASPID = 0, 1, 2
+_G_COLUMNS = {
+    'type': 0, 'x': 1, 'y': 2, 'vx': 3, 'vy': 4,
+    'gravity': 5, 'ground_y': 6, 'scale': 7, 'rotation': 8, 'rot_speed': 9,
+    'life': 10, 'jitter_timer': 11, 'wander_phase': 12, 'wander_speed': 13,
+    'wander_amp_x': 14, 'wander_amp_y': 15, 'anim_time': 16, 'anim_fps': 17,
+    'anim_index': 18, 'half_w': 19, 'half_h': 20, 'image': 21,
+}
+_G_TYPE, _G_X, _G_Y, _G_VX, _G_VY = 0, 1, 2, 3, 4
+_G_GRAVITY, _G_GROUND_Y, _G_SCALE, _G_ROTATION, _G_ROT_SPEED = 5, 6, 7, 8, 9
+_G_LIFE, _G_JITTER, _G_WANDER_PHASE, _G_WANDER_SPEED = 10, 11, 12, 13
+_G_WANDER_AMP_X, _G_WANDER_AMP_Y, _G_ANIM_TIME, _G_ANIM_FPS = 14, 15, 16, 17
+_G_ANIM_INDEX, _G_HALF_W, _G_HALF_H, _G_IMAGE = 18, 19, 20, 21
+_G_FIELDS = 22
+
+
+def _step_embers(data, count, dt, screen_w, screen_h, cull):
+    """
+    Advance embers in a single pass and compact survivors to the front of *data*.
+    Args:
+        data (np.ndarray): Ember state array, one row per ember.
+        count (int): Number of live rows.
+        dt (float): Elapsed time in seconds since the last frame.
+        screen_w (float): Screen width used for off-screen culling.
+        screen_h (float): Screen height used for off-screen culling.
+        cull (bool): Whether to drop embers that left the screen.
+    Returns:
+        int: Number of embers still alive.
+    """
+    alive = 0
+    for i in range(count):
+        data[i, _E_X] += data[i, _E_VX] * dt
+        data[i, _E_Y] += data[i, _E_VY] * dt
+        data[i, _E_LIFE] -= dt
+
+        size = data[i, _E_SIZE] + data[i, _E_SIZE_RATE] * dt
+        size = min(max(size, data[i, _E_MIN_SIZE]), data[i, _E_MAX_SIZE])
+        data[i, _E_SIZE] = size
+
+        data[i, _E_TIME] += dt
+        data[i, _E_X] += math.sin(data[i, _E_TIME] * data[i, _E_SIN_FREQ]) * data[i, _E_SIN_AMP]
+
+        if data[i, _E_LIFE] <= 0:
+            continue
+        if cull:
+            radius = max(1, int(data[i, _E_EXTENT] * size))
+            x = data[i, _E_X]
+            y = data[i, _E_Y]
+            if x + radius < 0 or x - radius > screen_w or y + radius < 0 or y - radius > screen_h:
+                continue
+
+        if alive != i:
+            data[alive, :] = data[i, :]
+        alive += 1
+    return alive
+
+
+def _step_gameplay_particles(data, count, dt, frame_count, left, right, top, bottom):
+    """
+    Advance gameplay particles in a single pass and compact survivors to the front of *data*.
+    Args:
+        data (np.ndarray): Gameplay particle state array, one row per particle.
+        count (int): Number of live rows.
+        dt (float): Elapsed time in seconds since the last frame.
+        frame_count (int): Number of mossbone animation frames.
+        left (float): Left edge of the visible world area.
+        right (float): Right edge of the visible world area.
+        top (float): Top edge of the visible world area.
+        bottom (float): Bottom edge of the visible world area.
+    Returns:
+        int: Number of particles still alive.
+    """
+    alive = 0
+    for i in range(count):
+        data[i, _G_LIFE] -= dt
+        particle_type = data[i, _G_TYPE]
+
+        if particle_type == _GP_MOSSBONE:
+            phase = data[i, _G_WANDER_PHASE] + data[i, _G_WANDER_SPEED] * dt
+            data[i, _G_WANDER_PHASE] = phase
+            data[i, _G_X] += (data[i, _G_VX] + math.sin(phase) * data[i, _G_WANDER_AMP_X]) * dt
+            data[i, _G_Y] += (data[i, _G_VY] + math.cos(phase * 1.23) * data[i, _G_WANDER_AMP_Y]) * dt
+            data[i, _G_ANIM_TIME] += dt
+            data[i, _G_ANIM_INDEX] = int(data[i, _G_ANIM_TIME] * data[i, _G_ANIM_FPS]) % frame_count
+        else:
+            if particle_type == _GP_CORAL_ASPID:
+                data[i, _G_JITTER] -= dt
+                if data[i, _G_JITTER] <= 0.0:
+                    data[i, _G_JITTER] = np.random.uniform(0.08, 0.24)
+                    data[i, _G_VX] = min(max(data[i, _G_VX] + np.random.uniform(-30.0, 34.0), 20.0), 140.0)
+                    data[i, _G_VY] = min(max(data[i, _G_VY] + np.random.uniform(-36.0, 18.0), -220.0), -35.0)
+            data[i, _G_X] += data[i, _G_VX] * dt
+            data[i, _G_Y] += data[i, _G_VY] * dt
+            data[i, _G_VY] += data[i, _G_GRAVITY] * dt
+            data[i, _G_ROTATION] += data[i, _G_ROT_SPEED] * dt
+
+        if data[i, _G_LIFE] <= 0.0:
+            continue
+        if particle_type == _GP_FUNG_MOTE and data[i, _G_Y] >= data[i, _G_GROUND_Y]:
+            continue
+        x = data[i, _G_X]
+        y = data[i, _G_Y]
+        if (
+            x + data[i, _G_HALF_W] < left
+            or x - data[i, _G_HALF_W] > right
+            or y + data[i, _G_HALF_H] < top
+            or y - data[i, _G_HALF_H] > bottom
+        ):
+            continue
+
+        if alive != i:
+            data[alive, :] = data[i, :]
+        alive += 1
+    return alive
+
+
+# Explicit signatures make numba compile eagerly at import (or load from the on-disk cache),
+# so no JIT pause can land on the first frame that steps particles.
+if NUMBA_AVAILABLE:
+    # Frozen (PyInstaller) builds ship no source for numba's cache locator, so compile in memory there
+    _numba_cache = not getattr(sys, "frozen", False)
+    try:
+        _step_embers = njit(
+            "int64(float64[:, ::1], int64, float64, float64, float64, boolean)", cache=_numba_cache
+        )(_step_embers)
+        _step_gameplay_particles = njit(
+            "int64(float64[:, ::1], int64, float64, int64, float64, float64, float64, float64)", cache=_numba_cache
+        )(_step_gameplay_particles)
+    except Exception as e:
+        print(f"Warning: numba kernels unavailable, using NumPy ({e})")
+        NUMBA_AVAILABLE = False
 
 class ParticleSystem:
     """Particle system managing embers, sparks, smoke, gameplay world particles, and screen shake."""
@@ -13,8 +175,15 @@ class ParticleSystem:
             screen_width (int | None): Logical screen width in pixels.
             screen_height (int | None): Logical screen height in pixels.
         """
-        self.particles: List[Dict] = []
-        self.float_texts: List[Dict] = []
+        # Spark/smoke bursts are stored as a NumPy array (one row per particle, see _P_*)
+        self.max_burst_particles = 500
+        self._burst_data = np.zeros((self.max_burst_particles, _P_FIELDS), dtype=np.float64)
+        self._burst_count = 0
+        # Floating text popups: numeric state in a NumPy array, (text, color) labels alongside
+        self.max_float_texts = 64
+        self._text_data = np.zeros((self.max_float_texts, _T_FIELDS), dtype=np.float64)
+        self._text_count = 0
+        self._text_labels: List[Tuple[str, Tuple[int, int, int]]] = []
         # Screen shake
         self.shake_amount = 0.0
         self.shake_time = 0.0
@@ -30,12 +199,28 @@ class ParticleSystem:
         self.ember_base_spawn_interval = 0.05
         self.max_particles = 1000
         self.max_cache_entries = 240
+
+        # Title-screen embers are stored as a NumPy array (one row per ember) so their
+        # per-frame motion can be advanced with a handful of vectorized operations.
+        self._ember_data = np.zeros((self.max_particles, _E_FIELDS), dtype=np.float64)
+        self._ember_count = 0
+        self._ember_images: List[pygame.Surface] = []
         
         # Surface cache for particle rendering
         self._surface_cache = {}
 
         # Gameplay/world particle effects
-        self.gameplay_particles: List[Dict] = []
+        # Gameplay particles are stored as a NumPy array (one row per particle, see _G_*)
+        # so the per-frame motion of every type is advanced with vectorized operations.
+        self.max_gameplay_particles = 300
+        self._gp_data = np.zeros((self.max_gameplay_particles, _G_FIELDS), dtype=np.float64)
+        self._gp_count = 0
+        self._gp_images: List[pygame.Surface] = []
+        # Scaled gameplay sprites keyed by (image, width, height); a particle's scale never changes,
+        # so each one reuses the same entry every frame instead of smoothscaling again
+        self._gp_scaled_cache = {}
+        self.max_gp_scaled_entries = 512
+        self._rng = np.random.default_rng()  # bulk random draws for bursts and vectorized jitter
         self.fung_mote_image = None
         self.mossbone_small_frames: List[pygame.Surface] = []
         self.coral_particle_image = None
@@ -44,7 +229,6 @@ class ParticleSystem:
         self.mossbone_spawn_interval = 0.35
         self.coral_aspid_spawn_timer = 0.0
         self.coral_aspid_spawn_interval = 0.22
-        self.max_gameplay_particles = 300
         self.immediate_offscreen_cull = True  # [21] github copilot
         
     def load_ember_image(self, image_path):
@@ -90,7 +274,61 @@ class ParticleSystem:
 
     def _can_spawn_gameplay_particle(self):
         """Return True if there is room for one more gameplay particle."""
-        return len(self.gameplay_particles) < self.max_gameplay_particles
+        return self._gp_count < self.max_gameplay_particles
+
+    def _gameplay_image_index(self, image):
+        """
+        Return the index of a gameplay particle image, registering it on first use.
+        Args:
+            image (pygame.Surface): Particle image.
+        Returns:
+            int: Index into self._gp_images.
+        """
+        for i, known in enumerate(self._gp_images):
+            if known is image:
+                return i
+        self._gp_images.append(image)
+        return len(self._gp_images) - 1
+
+    def _append_gameplay_particle(self, particle_type, x, y, vx, vy, scale, life, image=None, **fields):
+        """
+        Write one gameplay particle into the next free row of the state array.
+        Args:
+            particle_type (int): One of the _GP_* type codes.
+            x (float): World x-coordinate.
+            y (float): World y-coordinate.
+            vx (float): Horizontal velocity (base velocity for mossbone insects).
+            vy (float): Vertical velocity (base velocity for mossbone insects).
+            scale (float): Draw scale factor.
+            life (float): Lifetime in seconds.
+            image (pygame.Surface | None): Sprite; mossbone insects use their frame list instead.
+            **fields: Extra columns by name (e.g. rotation=..., gravity=...).
+        """
+        if not self._can_spawn_gameplay_particle():
+            return
+        row = self._gp_data[self._gp_count]
+        row[:] = 0.0
+        row[_G_TYPE] = particle_type
+        row[_G_X] = x
+        row[_G_Y] = y
+        row[_G_VX] = vx
+        row[_G_VY] = vy
+        row[_G_SCALE] = scale
+        row[_G_LIFE] = life
+        for name, value in fields.items():
+            row[_G_COLUMNS[name]] = value
+
+        # Half-extents of the drawn sprite, used for off-screen culling
+        if particle_type == _GP_MOSSBONE:
+            base_w, base_h = self.mossbone_small_frames[0].get_size()
+            row[_G_IMAGE] = -1
+        else:
+            base_w, base_h = image.get_size()
+            row[_G_IMAGE] = self._gameplay_image_index(image)
+        scale = max(0.1, float(scale))
+        row[_G_HALF_W] = max(1.0, base_w * scale * 0.5)
+        row[_G_HALF_H] = max(1.0, base_h * scale * 0.5)
+        self._gp_count += 1
 
     def spawn_fung_mote_death_burst(self, world_x, world_y, ground_y, count=None):
         """
@@ -105,24 +343,33 @@ class ParticleSystem:
             return
 
         burst_count = random.randint(15, 20) if count is None else max(1, int(count))
-        for _ in range(burst_count):
-            if not self._can_spawn_gameplay_particle():
-                break
-
-            self.gameplay_particles.append({
-                'type': 'fung_mote',
-                'x': float(world_x) + random.uniform(-14.0, 14.0),
-                'y': float(world_y) + random.uniform(-10.0, 8.0),
-                'vx': random.uniform(-240.0, 240.0),
-                'vy': random.uniform(-820.0, -420.0),
-                'gravity': random.uniform(1700.0, 2100.0),
-                'ground_y': float(ground_y),
-                'image': self.fung_mote_image,
-                'scale': random.uniform(0.55, 0.95),
-                'rotation': random.uniform(0.0, 360.0),
-                'rot_speed': random.uniform(-220.0, 220.0),
-                'life': random.uniform(1.8, 2.5),
-            })
+        start = self._gp_count
+        n = min(burst_count, self.max_gameplay_particles - start)
+        if n <= 0:
+            return
+
+        # Fill every row of the burst at once instead of one _append_gameplay_particle call per mote
+        rng = self._rng
+        rows = self._gp_data[start:start + n]
+        rows[:] = 0.0
+        rows[:, _G_TYPE] = _GP_FUNG_MOTE
+        rows[:, _G_X] = float(world_x) + rng.uniform(-14.0, 14.0, n)
+        rows[:, _G_Y] = float(world_y) + rng.uniform(-10.0, 8.0, n)
+        rows[:, _G_VX] = rng.uniform(-240.0, 240.0, n)
+        rows[:, _G_VY] = rng.uniform(-820.0, -420.0, n)
+        rows[:, _G_SCALE] = rng.uniform(0.55, 0.95, n)
+        rows[:, _G_LIFE] = rng.uniform(1.8, 2.5, n)
+        rows[:, _G_GRAVITY] = rng.uniform(1700.0, 2100.0, n)
+        rows[:, _G_GROUND_Y] = float(ground_y)
+        rows[:, _G_ROTATION] = rng.uniform(0.0, 360.0, n)
+        rows[:, _G_ROT_SPEED] = rng.uniform(-220.0, 220.0, n)
+        rows[:, _G_IMAGE] = self._gameplay_image_index(self.fung_mote_image)
+
+        # Half-extents of the drawn sprite, used for off-screen culling
+        base_w, base_h = self.fung_mote_image.get_size()
+        rows[:, _G_HALF_W] = np.maximum(1.0, base_w * rows[:, _G_SCALE] * 0.5)
+        rows[:, _G_HALF_H] = np.maximum(1.0, base_h * rows[:, _G_SCALE] * 0.5)
+        self._gp_count += n
 
     def _spawn_mossbone_insect(self, camera_world_rect):
         """Spawn one animated mossbone insect around the current camera view."""
@@ -133,22 +380,21 @@ class ParticleSystem:
         spawn_x = random.uniform(camera_world_rect.left - margin, camera_world_rect.right + margin)
         spawn_y = random.uniform(camera_world_rect.top - margin, camera_world_rect.bottom + margin)
         scale = random.uniform(0.35, 0.65)
-        self.gameplay_particles.append({
-            'type': 'mossbone_insect',
-            'x': spawn_x,
-            'y': spawn_y,
-            'base_vx': random.uniform(-55.0, 90.0),
-            'base_vy': random.uniform(-45.0, 45.0),
-            'wander_phase': random.uniform(0.0, math.pi * 2.0),
-            'wander_speed': random.uniform(0.9, 1.8),
-            'wander_amp_x': random.uniform(25.0, 65.0),
-            'wander_amp_y': random.uniform(18.0, 55.0),
-            'anim_time': 0.0,
-            'anim_fps': random.uniform(8.0, 13.0),
-            'anim_index': random.randrange(len(self.mossbone_small_frames)),
-            'scale': scale,
-            'life': random.uniform(18.0, 32.0),
-        })
+        self._append_gameplay_particle(
+            _GP_MOSSBONE,
+            spawn_x,
+            spawn_y,
+            random.uniform(-55.0, 90.0),
+            random.uniform(-45.0, 45.0),
+            scale,
+            random.uniform(18.0, 32.0),
+            wander_phase=random.uniform(0.0, math.pi * 2.0),
+            wander_speed=random.uniform(0.9, 1.8),
+            wander_amp_x=random.uniform(25.0, 65.0),
+            wander_amp_y=random.uniform(18.0, 55.0),
+            anim_fps=random.uniform(8.0, 13.0),
+            anim_index=random.randrange(len(self.mossbone_small_frames)),
+        )
 
     def _spawn_coral_or_aspid_particle(self, camera_world_rect):
         """Spawn one drifting particle that generally moves bottom-left to top-right."""
@@ -161,19 +407,23 @@ class ParticleSystem:
 
         spawn_x = random.uniform(camera_world_rect.left - 80, camera_world_rect.right - 20)
         spawn_y = random.uniform(camera_world_rect.bottom - 80, camera_world_rect.bottom + 160)
-        self.gameplay_particles.append({
-            'type': 'coral_aspid',
-            'x': spawn_x,
-            'y': spawn_y,
-            'vx': random.uniform(45.0, 110.0),
-            'vy': random.uniform(-165.0, -90.0),
-            'jitter_timer': random.uniform(0.08, 0.22),
-            'image': image,
-            'scale': random.uniform(0.45, 0.95),
-            'rotation': random.uniform(-35.0, 35.0),
-            'rot_speed': random.uniform(-48.0, 48.0),
-            'life': random.uniform(8.0, 15.0),
-        })
+        self._append_gameplay_particle(
+            _GP_CORAL_ASPID,
+            spawn_x,
+            spawn_y,
+            random.uniform(45.0, 110.0),
+            random.uniform(-165.0, -90.0),
+            random.uniform(0.45, 0.95),
+            random.uniform(8.0, 15.0),
+            image=image,
+            jitter_timer=random.uniform(0.08, 0.22),
+            rotation=random.uniform(-35.0, 35.0),
+            rot_speed=random.uniform(-48.0, 48.0),
+        )
+
+    def _count_gameplay_particles(self, particle_type):
+        """Return the number of live gameplay particles of the given type code."""
+        return int(np.count_nonzero(self._gp_data[:self._gp_count, _G_TYPE] == particle_type))
 
     def update_gameplay_particles(self, dt, camera_world_rect, ground_colliders=None):
         """
@@ -189,82 +439,73 @@ class ParticleSystem:
         self.mossbone_spawn_timer += dt
         while self.mossbone_spawn_timer >= self.mossbone_spawn_interval:
             self.mossbone_spawn_timer -= self.mossbone_spawn_interval
-            mossbone_count = sum(1 for p in self.gameplay_particles if p['type'] == 'mossbone_insect')
-            if mossbone_count < 22:
+            if self._count_gameplay_particles(_GP_MOSSBONE) < 22:
                 self._spawn_mossbone_insect(camera_world_rect)
 
         self.coral_aspid_spawn_timer += dt
         while self.coral_aspid_spawn_timer >= self.coral_aspid_spawn_interval:
             self.coral_aspid_spawn_timer -= self.coral_aspid_spawn_interval
-            drift_count = sum(1 for p in self.gameplay_particles if p['type'] == 'coral_aspid')
-            if drift_count < 46:
+            if self._count_gameplay_particles(_GP_CORAL_ASPID) < 46:
                 self._spawn_coral_or_aspid_particle(camera_world_rect)
 
-        alive_particles = []
-        min_x = float(camera_world_rect.left)
-        max_x = float(camera_world_rect.right)
-        min_y = float(camera_world_rect.top)
-        max_y = float(camera_world_rect.bottom)
+        count = self._gp_count
+        if count == 0:
+            return
 
-        for p in self.gameplay_particles:
-            p['life'] -= dt
-            if p['life'] <= 0.0:
-                continue
+        if NUMBA_AVAILABLE:
+            self._gp_count = _step_gameplay_particles(
+                self._gp_data, count, float(dt), max(1, len(self.mossbone_small_frames)),
+                float(camera_world_rect.left), float(camera_world_rect.right),
+                float(camera_world_rect.top), float(camera_world_rect.bottom),
+            )
+            return
 
-            particle_type = p.get('type')
-            if particle_type == 'fung_mote':
-                p['x'] += p['vx'] * dt
-                p['y'] += p['vy'] * dt
-                p['vy'] += p['gravity'] * dt
-                p['rotation'] += p.get('rot_speed', 0.0) * dt
-                if p['y'] >= p.get('ground_y', max_y):
-                    continue
-            elif particle_type == 'mossbone_insect':
-                p['wander_phase'] += p['wander_speed'] * dt
-                drift_x = math.sin(p['wander_phase']) * p['wander_amp_x']
-                drift_y = math.cos(p['wander_phase'] * 1.23) * p['wander_amp_y']
-                p['x'] += (p['base_vx'] + drift_x) * dt
-                p['y'] += (p['base_vy'] + drift_y) * dt
-                p['anim_time'] += dt
-                frame_count = max(1, len(self.mossbone_small_frames))
-                p['anim_index'] = int(p['anim_time'] * p['anim_fps']) % frame_count
-            elif particle_type == 'coral_aspid':
-                p['jitter_timer'] -= dt
-                if p['jitter_timer'] <= 0.0:
-                    p['jitter_timer'] = random.uniform(0.08, 0.24)
-                    p['vx'] += random.uniform(-30.0, 34.0)
-                    p['vy'] += random.uniform(-36.0, 18.0)
-                    p['vx'] = max(20.0, min(140.0, p['vx']))
-                    p['vy'] = max(-220.0, min(-35.0, p['vy']))
-                p['x'] += p['vx'] * dt
-                p['y'] += p['vy'] * dt
-                p['rotation'] += p.get('rot_speed', 0.0) * dt
-
-            image = p.get('image')
-            if particle_type == 'mossbone_insect' and self.mossbone_small_frames:
-                frame_index = int(p.get('anim_index', 0)) % len(self.mossbone_small_frames)
-                image = self.mossbone_small_frames[frame_index]
-
-            if image is not None:
-                base_w, base_h = image.get_size()
-                scale = max(0.1, float(p.get('scale', 1.0)))
-                half_w = max(1.0, (base_w * scale) * 0.5)
-                half_h = max(1.0, (base_h * scale) * 0.5)
-            else:
-                half_w = 2.0
-                half_h = 2.0
-
-            if (
-                p['x'] + half_w < min_x
-                or p['x'] - half_w > max_x
-                or p['y'] + half_h < min_y
-                or p['y'] - half_h > max_y
-            ):
-                continue
+        g = self._gp_data[:count]
+        g[:, _G_LIFE] -= dt
+        particle_types = g[:, _G_TYPE]
 
-            alive_particles.append(p)
+        # Mossbone insects: base velocity plus a sin/cos wander, and a looping frame index
+        moss = np.flatnonzero(particle_types == _GP_MOSSBONE)
+        if moss.size:
+            phase = g[moss, _G_WANDER_PHASE] + g[moss, _G_WANDER_SPEED] * dt
+            g[moss, _G_WANDER_PHASE] = phase
+            g[moss, _G_X] += (g[moss, _G_VX] + np.sin(phase) * g[moss, _G_WANDER_AMP_X]) * dt
+            g[moss, _G_Y] += (g[moss, _G_VY] + np.cos(phase * 1.23) * g[moss, _G_WANDER_AMP_Y]) * dt
+            g[moss, _G_ANIM_TIME] += dt
+            frame_count = max(1, len(self.mossbone_small_frames))
+            g[moss, _G_ANIM_INDEX] = (g[moss, _G_ANIM_TIME] * g[moss, _G_ANIM_FPS]).astype(np.int64) % frame_count
 
-        self.gameplay_particles = alive_particles
+        # Coral/aspid drifters: randomly nudge velocity whenever their jitter timer runs out
+        coral = np.flatnonzero(particle_types == _GP_CORAL_ASPID)
+        if coral.size:
+            g[coral, _G_JITTER] -= dt
+            jittered = coral[g[coral, _G_JITTER] <= 0.0]
+            if jittered.size:
+                n = jittered.size
+                rng = self._rng
+                g[jittered, _G_JITTER] = rng.uniform(0.08, 0.24, n)
+                g[jittered, _G_VX] = np.clip(g[jittered, _G_VX] + rng.uniform(-30.0, 34.0, n), 20.0, 140.0)
+                g[jittered, _G_VY] = np.clip(g[jittered, _G_VY] + rng.uniform(-36.0, 18.0, n), -220.0, -35.0)
+
+        # Fung motes and drifters integrate velocity directly (drifters have no gravity)
+        ballistic = np.flatnonzero(particle_types != _GP_MOSSBONE)
+        if ballistic.size:
+            g[ballistic, _G_X] += g[ballistic, _G_VX] * dt
+            g[ballistic, _G_Y] += g[ballistic, _G_VY] * dt
+            g[ballistic, _G_VY] += g[ballistic, _G_GRAVITY] * dt
+            g[ballistic, _G_ROTATION] += g[ballistic, _G_ROT_SPEED] * dt
+
+        keep = g[:, _G_LIFE] > 0.0
+        keep &= ~((particle_types == _GP_FUNG_MOTE) & (g[:, _G_Y] >= g[:, _G_GROUND_Y]))
+        keep &= g[:, _G_X] + g[:, _G_HALF_W] >= camera_world_rect.left
+        keep &= g[:, _G_X] - g[:, _G_HALF_W] <= camera_world_rect.right
+        keep &= g[:, _G_Y] + g[:, _G_HALF_H] >= camera_world_rect.top
+        keep &= g[:, _G_Y] - g[:, _G_HALF_H] <= camera_world_rect.bottom
+
+        alive = int(np.count_nonzero(keep))
+        if alive != count:
+            self._gp_data[:alive] = g[keep]
+            self._gp_count = alive
 
     def draw_gameplay_particles(self, surface: pygame.Surface, camera_x=0, camera_y=0, look_y_offset=0, screen_offset=(0, 0)):
         """
@@ -276,38 +517,56 @@ class ParticleSystem:
             look_y_offset (float): Additional vertical look-ahead offset.
             screen_offset (tuple[float, float]): Screen shake (x, y) offset.
         """
-        if not self.gameplay_particles:
+        if self._gp_count == 0:
             return
 
         shake_x = int(screen_offset[0])
         shake_y = int(screen_offset[1])
+        frames = self.mossbone_small_frames
+        images = self._gp_images
 
-        for p in self.gameplay_particles:
-            image = p.get('image')
-            if p.get('type') == 'mossbone_insect':
-                if not self.mossbone_small_frames:
+        for row in self._gp_data[:self._gp_count].tolist():
+            if row[_G_TYPE] == _GP_MOSSBONE:
+                if not frames:
                     continue
-                frame_index = int(p.get('anim_index', 0)) % len(self.mossbone_small_frames)
-                image = self.mossbone_small_frames[frame_index]
-
-            if image is None:
-                continue
+                image = frames[int(row[_G_ANIM_INDEX]) % len(frames)]
+            else:
+                image = images[int(row[_G_IMAGE])]
 
             base_w, base_h = image.get_size()
-            scale = max(0.1, float(p.get('scale', 1.0)))
+            scale = max(0.1, row[_G_SCALE])
             draw_w = max(1, int(base_w * scale))
             draw_h = max(1, int(base_h * scale))
-            scaled = pygame.transform.smoothscale(image, (draw_w, draw_h))
+            scaled = self._get_scaled_gameplay_image(image, draw_w, draw_h)
 
-            rotation = float(p.get('rotation', 0.0))
+            rotation = row[_G_ROTATION]
             if abs(rotation) > 0.01:
                 scaled = pygame.transform.rotate(scaled, rotation)
 
-            screen_x = int(p['x'] - camera_x + shake_x)
-            screen_y = int(p['y'] - camera_y - look_y_offset + shake_y)
+            screen_x = int(row[_G_X] - camera_x + shake_x)
+            screen_y = int(row[_G_Y] - camera_y - look_y_offset + shake_y)
             draw_rect = scaled.get_rect(center=(screen_x, screen_y))
             surface.blit(scaled, draw_rect)
         
+    def _get_scaled_gameplay_image(self, image, draw_w, draw_h):
+        """
+        Return a gameplay sprite smoothscaled to the given size, scaling it only once.
+        Args:
+            image (pygame.Surface): Source sprite or mossbone frame.
+            draw_w (int): Target width in pixels.
+            draw_h (int): Target height in pixels.
+        Returns:
+            pygame.Surface: Scaled surface (shared; do not modify).
+        """
+        cache_key = (image, draw_w, draw_h)
+        scaled = self._gp_scaled_cache.get(cache_key)
+        if scaled is None:
+            scaled = pygame.transform.smoothscale(image, (draw_w, draw_h))
+            self._gp_scaled_cache[cache_key] = scaled
+            if len(self._gp_scaled_cache) > self.max_gp_scaled_entries:
+                self._gp_scaled_cache.pop(next(iter(self._gp_scaled_cache)), None)
+        return scaled
+
     def enable_ember_spawning(self, enabled=True):
         """Toggle automatic ember particle spawning."""
         self.ember_enabled = enabled
@@ -335,7 +594,19 @@ class ParticleSystem:
         scale_bucket = round(scale_factor * 4) / 4.0
         angle_bucket = int(round(angle / 5.0) * 5)
         alpha_bucket = max(0, min(255, int(round(alpha / 24.0) * 24)))
+        return self._get_bucketed_ember_surface(img, scale_bucket, angle_bucket, alpha_bucket)
 
+    def _get_bucketed_ember_surface(self, img, scale_bucket, angle_bucket, alpha_bucket):
+        """
+        Return the cached ember image for already-quantized scale, angle and alpha buckets.
+        Args:
+            img (pygame.Surface): Source ember image.
+            scale_bucket (float): Scale factor, quantized to quarter steps.
+            angle_bucket (int): Rotation in degrees, quantized to 5 degree steps.
+            alpha_bucket (int): Opacity, quantized to steps of 24 and clamped to 0–255.
+        Returns:
+            pygame.Surface: Scaled, rotated, and alpha-set surface.
+        """
         cache_key = (id(img), scale_bucket, angle_bucket, alpha_bucket)
         cached = self._surface_cache.get(cache_key)
         if cached is not None:
@@ -350,6 +621,92 @@ class ParticleSystem:
         self._trim_surface_cache()
         return rotated_img
 
+    def _particle_count(self):
+        """Return the number of live screen-space particles, including embers."""
+        return self._burst_count + self._ember_count
+
+    def _ember_image_index(self, image):
+        """
+        Return the index of an ember image, registering it on first use.
+        Args:
+            image (pygame.Surface): Ember image.
+        Returns:
+            int: Index into self._ember_images.
+        """
+        for i, known in enumerate(self._ember_images):
+            if known is image:
+                return i
+        self._ember_images.append(image)
+        return len(self._ember_images) - 1
+
+    def _append_ember(self, x, y, vx, vy, life, size, size_change_rate, min_size, max_size, image, angle, sin_freq, sin_amp):
+        """Write one ember into the next free row of the ember state array."""
+        if self._ember_count >= self._ember_data.shape[0]:
+            return
+        image_index = self._ember_image_index(image)
+        row = self._ember_data[self._ember_count]
+        row[_E_X] = x
+        row[_E_Y] = y
+        row[_E_VX] = vx
+        row[_E_VY] = vy
+        row[_E_LIFE] = life
+        row[_E_INITIAL_LIFE] = life
+        row[_E_SIZE] = size
+        row[_E_SIZE_RATE] = size_change_rate
+        row[_E_MIN_SIZE] = min_size
+        row[_E_MAX_SIZE] = max_size
+        row[_E_ANGLE] = angle
+        row[_E_TIME] = 0.0
+        row[_E_SIN_FREQ] = sin_freq
+        row[_E_SIN_AMP] = sin_amp
+        # Half-extent of the drawn sprite per unit of size, used for off-screen culling
+        row[_E_EXTENT] = max(image.get_width(), image.get_height()) * 0.5 / 3.0
+        row[_E_IMAGE] = image_index
+        self._ember_count += 1
+
+    def _update_embers(self, dt: float):
+        """
+        Advance all embers by dt seconds and compact out dead or off-screen ones.
+        Args:
+            dt (float): Elapsed time in seconds since the last frame.
+        """
+        count = self._ember_count
+        if count == 0:
+            return
+
+        screen_w = self.screen_width or 0
+        screen_h = self.screen_height or 0
+        if NUMBA_AVAILABLE:
+            cull = self.immediate_offscreen_cull and screen_w > 0 and screen_h > 0
+            self._ember_count = _step_embers(self._ember_data, count, float(dt), float(screen_w), float(screen_h), cull)
+            return
+
+        e = self._ember_data[:count]
+        e[:, _E_X] += e[:, _E_VX] * dt
+        e[:, _E_Y] += e[:, _E_VY] * dt
+        e[:, _E_LIFE] -= dt
+
+        # Grow/shrink and clamp (round embers use an open range, so the clamp is a no-op)
+        e[:, _E_SIZE] += e[:, _E_SIZE_RATE] * dt
+        np.clip(e[:, _E_SIZE], e[:, _E_MIN_SIZE], e[:, _E_MAX_SIZE], out=e[:, _E_SIZE])
+
+        # Sin wave sway
+        e[:, _E_TIME] += dt
+        e[:, _E_X] += np.sin(e[:, _E_TIME] * e[:, _E_SIN_FREQ]) * e[:, _E_SIN_AMP]
+
+        keep = e[:, _E_LIFE] > 0
+        if self.immediate_offscreen_cull and screen_w > 0 and screen_h > 0:
+            radius = np.maximum(1, (e[:, _E_EXTENT] * e[:, _E_SIZE]).astype(np.int64))
+            keep &= e[:, _E_X] + radius >= 0
+            keep &= e[:, _E_X] - radius <= screen_w
+            keep &= e[:, _E_Y] + radius >= 0
+            keep &= e[:, _E_Y] - radius <= screen_h
+
+        alive = int(np.count_nonzero(keep))
+        if alive != count:
+            self._ember_data[:alive] = e[keep]
+            self._ember_count = alive
+
     def spawn_sparks(self, x: float, y: float, count: int = 12, color: Tuple[int,int,int]=(255,200,100)):
         """
         Spawn burst spark particles at the given position.
@@ -359,25 +716,23 @@ class ParticleSystem:
             count (int): Number of sparks to emit.
             color (tuple[int, int, int]): RGB color of the sparks.
         """
-        MAX = 500
-        available = max(0, MAX - len(self.particles))
-        to_spawn = min(count, available)
-        for _ in range(to_spawn):
-            ang = random.uniform(0, math.pi*2)
-            spd = random.uniform(40, 220)
-            life = random.uniform(0.35, 0.9)
-            self.particles.append({
-                'x': x + random.uniform(-8, 8),
-                'y': y + random.uniform(-8, 8),
-                'vx': math.cos(ang) * spd,
-                'vy': math.sin(ang) * spd * 0.6 - random.uniform(10, 60),
-                'life': life,
-                'initial_life': life,
-                'size': random.uniform(2, 4),
-                'color': color,
-                'gravity': 300,
-                'type': 'spark'
-            })
+        rows = self._claim_burst_rows(count)
+        n = len(rows)
+        if n == 0:
+            return
+        rng = self._rng
+        ang = rng.uniform(0, math.pi*2, n)
+        spd = rng.uniform(40, 220, n)
+        rows[:, _P_X] = x + rng.uniform(-8, 8, n)
+        rows[:, _P_Y] = y + rng.uniform(-8, 8, n)
+        rows[:, _P_VX] = np.cos(ang) * spd
+        rows[:, _P_VY] = np.sin(ang) * spd * 0.6 - rng.uniform(10, 60, n)
+        rows[:, _P_LIFE] = rng.uniform(0.35, 0.9, n)
+        rows[:, _P_INITIAL_LIFE] = rows[:, _P_LIFE]
+        rows[:, _P_SIZE] = rng.uniform(2, 4, n)
+        rows[:, _P_GRAVITY] = 300
+        rows[:, _P_KIND] = _PK_SPARK
+        rows[:, _P_R:_P_B + 1] = color
 
     def spawn_smoke(self, x: float, y: float, count: int = 10):
         """
@@ -387,23 +742,34 @@ class ParticleSystem:
             y (float): Vertical spawn position in screen pixels.
             count (int): Number of smoke puffs to emit.
         """
-        MAX = 500
-        available = max(0, MAX - len(self.particles))
-        to_spawn = min(count, available)
-        for _ in range(to_spawn):
-            life = random.uniform(0.9, 2.0)
-            self.particles.append({
-                'x': x + random.uniform(-12, 12),
-                'y': y + random.uniform(-6, 6),
-                'vx': random.uniform(-20, 20),
-                'vy': random.uniform(-40, -10),
-                'life': life,
-                'initial_life': life,
-                'size': random.uniform(8, 18),
-                'color': (180, 180, 180),
-                'gravity': -20,
-                'type': 'smoke'
-            })
+        rows = self._claim_burst_rows(count)
+        n = len(rows)
+        if n == 0:
+            return
+        rng = self._rng
+        rows[:, _P_X] = x + rng.uniform(-12, 12, n)
+        rows[:, _P_Y] = y + rng.uniform(-6, 6, n)
+        rows[:, _P_VX] = rng.uniform(-20, 20, n)
+        rows[:, _P_VY] = rng.uniform(-40, -10, n)
+        rows[:, _P_LIFE] = rng.uniform(0.9, 2.0, n)
+        rows[:, _P_INITIAL_LIFE] = rows[:, _P_LIFE]
+        rows[:, _P_SIZE] = rng.uniform(8, 18, n)
+        rows[:, _P_GRAVITY] = -20
+        rows[:, _P_KIND] = _PK_SMOKE
+        rows[:, _P_R:_P_B + 1] = (180, 180, 180)
+
+    def _claim_burst_rows(self, count):
+        """
+        Reserve up to *count* free rows of the burst state array.
+        Args:
+            count (int): Number of particles requested.
+        Returns:
+            np.ndarray: View of the claimed rows (may be empty when the pool is full).
+        """
+        start = self._burst_count
+        n = max(0, min(int(count), self.max_burst_particles - start))
+        self._burst_count = start + n
+        return self._burst_data[start:start + n]
 
     # [9] github copilot
     def spawn_embers(self, x: float, y: float, count: int = 1, image=None):
@@ -415,13 +781,17 @@ class ParticleSystem:
             count (int): Number of embers to spawn.
             image (pygame.Surface | None): Custom ember image; falls back to self.ember_image.
         """
+        img = image or self.ember_image
+        if img is None:
+            return
         MAX = 1000
-        available = max(0, MAX - len(self.particles))
+        available = max(0, MAX - self._particle_count())
         to_spawn = min(count, available)
         for _ in range(to_spawn):
             life = random.uniform(15.0, 20.0)  # Much longer life to traverse the screen
             # Size with stronger bias towards smaller (farther) particles
-            initial_size = 9 * (random.uniform(0, 1) ** 3)
+            r = random.random()
+            initial_size = 9 * (r * r * r)
             # Depth factor: larger embers are in front and move faster.
             depth_t = (initial_size - 1.0) / 9.0  # 0 = far/back, 1 = near/front
             speed_scale = 0.45 + 1.05 * depth_t
@@ -433,27 +803,21 @@ class ParticleSystem:
             vy = base_vy * speed_scale
             # Random size change behavior
             size_change_rate = random.uniform(-0.5, 0.5)  # Can grow or shrink
-            self.particles.append({
-                'x': x + random.uniform(-self.screen_width, self.screen_width),
-                'y': y + random.uniform(self.screen_height, 0),
-                'vx': vx,
-                'vy': vy,
-                'life': life,
-                'initial_life': life,
-                'size': initial_size,
-                'initial_size': initial_size,
-                'size_change_rate': size_change_rate,
-                'min_size': 3.0,
-                'max_size': 10.0,
-                'color': None,
-                'gravity': 0,  # No gravity for floating embers
-                'type': 'ember',
-                'image': image,
-                'angle': random.uniform(-20, 20),  # Random rotation angle ±25 degrees
-                'time': 0,  # For sin wave movement
-                'sin_freq': random.uniform(1, 5),  # Frequency for sin wave
-                'sin_amp': (1.5 + 8.5 * depth_t)  # Foreground embers sway more
-            })
+            self._append_ember(
+                x=x + random.uniform(-self.screen_width, self.screen_width),
+                y=y + random.uniform(self.screen_height, 0),
+                vx=vx,
+                vy=vy,
+                life=life,
+                size=initial_size,
+                size_change_rate=size_change_rate,
+                min_size=3.0,
+                max_size=10.0,
+                image=img,
+                angle=random.uniform(-20, 20),  # Random rotation angle ±25 degrees
+                sin_freq=random.uniform(1, 5),  # Frequency for sin wave
+                sin_amp=(1.5 + 8.5 * depth_t),  # Foreground embers sway more
+            )
 
     def spawn_round_embers(self, x: float, y: float, count: int = 1, image=None):
         """
@@ -465,13 +829,16 @@ class ParticleSystem:
             image (pygame.Surface | None): Custom image; falls back to self.ember_round_image.
         """
         img = image or self.ember_round_image
+        if img is None:
+            return
         MAX = 1000
-        available = max(0, MAX - len(self.particles))
+        available = max(0, MAX - self._particle_count())
         to_spawn = min(count, available)
         for _ in range(to_spawn):
             life = random.uniform(15.0, 20.0)
             # Background bias: strong cubic bias keeps most particles small/far.
-            initial_size = 1.0 + 3.0 * (random.uniform(0, 1) ** 3)
+            r = random.random()
+            initial_size = 1.0 + 3.0 * (r * r * r)
             # Depth factor: 0 = far/back, 1 = near/front.
             depth_t = (initial_size - 1.0) / 3.0
             speed_scale = 0.45 + 1.05 * depth_t
@@ -481,24 +848,22 @@ class ParticleSystem:
             vx = base_vx * speed_scale
             vy = base_vy * speed_scale
 
-            self.particles.append({
-                'x': x + random.uniform(-self.screen_width, self.screen_width),
-                'y': y + random.uniform(self.screen_height, 0),
-                'vx': vx,
-                'vy': vy,
-                'life': life,
-                'initial_life': life,
-                'size': initial_size,
-                'initial_size': initial_size,
-                'color': None,
-                'gravity': 0,
-                'type': 'ember',
-                'image': img,
-                'angle': random.uniform(-20, 20),
-                'time': 0,
-                'sin_freq': random.uniform(1, 5),
-                'sin_amp': 1.5 + 8.5 * depth_t,
-            })
+            # Round embers keep a constant size (no rate, open clamp range)
+            self._append_ember(
+                x=x + random.uniform(-self.screen_width, self.screen_width),
+                y=y + random.uniform(self.screen_height, 0),
+                vx=vx,
+                vy=vy,
+                life=life,
+                size=initial_size,
+                size_change_rate=0.0,
+                min_size=0.0,
+                max_size=math.inf,
+                image=img,
+                angle=random.uniform(-20, 20),
+                sin_freq=random.uniform(1, 5),
+                sin_amp=1.5 + 8.5 * depth_t,
+            )
 
     def add_detection_popup(self, delta: int, x: float, y: float):
         """
@@ -508,18 +873,18 @@ class ParticleSystem:
             x (float): Horizontal spawn position in screen pixels.
             y (float): Vertical spawn position in screen pixels.
         """
+        if self._text_count >= self.max_float_texts:
+            return
         txt = f"{'+' if delta>0 else ''}{int(delta)}"
         col = (0,255,0) if delta > 0 else (255,0,0)
-        self.float_texts.append({
-            'text': txt,
-            'x': x + random.uniform(-12, 12),
-            'y': y + random.uniform(-6, 6),
-            'vy': -40 - random.uniform(0, 40),
-            'time': 1.0,
-            'duration': 1.0,
-            'color': col,
-            'alpha': 255,
-        })
+        row = self._text_data[self._text_count]
+        row[_T_X] = x + random.uniform(-12, 12)
+        row[_T_Y] = y + random.uniform(-6, 6)
+        row[_T_VY] = -40 - random.uniform(0, 40)
+        row[_T_TIME] = 1.0
+        row[_T_DURATION] = 1.0
+        self._text_labels.append((txt, col))
+        self._text_count += 1
 
     def update(self, dt: float):
         """
@@ -527,57 +892,45 @@ class ParticleSystem:
         Args:
             dt (float): Elapsed time in seconds since the last frame.
         """
-        # Update particles
-        alive_particles = []
-        screen_w = self.screen_width or 0
-        screen_h = self.screen_height or 0
-        for p in self.particles:
-            p['x'] += p['vx'] * dt
-            p['y'] += p['vy'] * dt
-            p['vy'] += p.get('gravity', 0) * dt
-            p['life'] -= dt
-            
-            # Update size for particles that have size_change_rate
-            if 'size_change_rate' in p:
-                p['size'] += p['size_change_rate'] * dt
-                # Clamp size within bounds
-                p['size'] = max(p.get('min_size', 0.5), min(p.get('max_size', 10.0), p['size']))
-            
-            # Sin wave movement for embers
-            if p['type'] == 'ember':
-                p['time'] += dt
-                p['x'] += math.sin(p['time'] * p['sin_freq']) * p['sin_amp']
-
-            if p['life'] <= 0:
-                continue
+        # Update embers (vectorized)
+        self._update_embers(dt)
+
+        # Update spark/smoke bursts (vectorized motion + expiry, compacted in place)
+        count = self._burst_count
+        if count:
+            b = self._burst_data[:count]
+            b[:, _P_X] += b[:, _P_VX] * dt
+            b[:, _P_Y] += b[:, _P_VY] * dt
+            b[:, _P_VY] += b[:, _P_GRAVITY] * dt
+            b[:, _P_LIFE] -= dt
+            keep = b[:, _P_LIFE] > 0
 
+            screen_w = self.screen_width or 0
+            screen_h = self.screen_height or 0
             if self.immediate_offscreen_cull and screen_w > 0 and screen_h > 0:
-                if p['type'] == 'ember' and p.get('image'):
-                    img = p['image']
-                    radius = max(1, int(max(img.get_width(), img.get_height()) * p.get('size', 1.0) * 0.5 / 3.0))
-                else:
-                    radius = max(1, int(p.get('size', 2)))
-
-                if (
-                    p['x'] + radius < 0
-                    or p['x'] - radius > screen_w
-                    or p['y'] + radius < 0
-                    or p['y'] - radius > screen_h
-                ):
-                    continue
+                radius = np.maximum(1, b[:, _P_SIZE].astype(np.int64))
+                keep &= b[:, _P_X] + radius >= 0
+                keep &= b[:, _P_X] - radius <= screen_w
+                keep &= b[:, _P_Y] + radius >= 0
+                keep &= b[:, _P_Y] - radius <= screen_h
 
-            alive_particles.append(p)
-        self.particles = alive_particles
-
-        # Update floating texts
-        alive_texts = []
-        for ft in self.float_texts:
-            ft['y'] += ft['vy'] * dt
-            ft['time'] -= dt
-            ft['alpha'] = max(0, int(255 * (ft['time'] / max(0.01, ft.get('duration', 1.0)))))
-            if ft['time'] > 0:
-                alive_texts.append(ft)
-        self.float_texts = alive_texts
+            alive = int(np.count_nonzero(keep))
+            if alive != count:
+                self._burst_data[:alive] = b[keep]
+                self._burst_count = alive
+
+        # Update floating texts (vectorized rise + expiry, compacted in place)
+        count = self._text_count
+        if count:
+            t = self._text_data[:count]
+            t[:, _T_Y] += t[:, _T_VY] * dt
+            t[:, _T_TIME] -= dt
+            keep = t[:, _T_TIME] > 0
+            alive = int(np.count_nonzero(keep))
+            if alive != count:
+                self._text_data[:alive] = t[keep]
+                self._text_labels = [label for label, kept in zip(self._text_labels, keep.tolist()) if kept]
+                self._text_count = alive
         
         # Decay screen shake
         if self.shake_time > 0:
@@ -592,12 +945,12 @@ class ParticleSystem:
         # Handle automatic ember spawning
         if self.ember_enabled and self.ember_image and self.screen_width and self.screen_height:
             self.ember_spawn_timer += dt
-            load_t = min(1.0, len(self.particles) / max(1, self.max_particles))
+            load_t = min(1.0, self._particle_count() / max(1, self.max_particles))
             spawn_interval = self.ember_base_spawn_interval + (0.09 * load_t)
             if self.ember_spawn_timer >= spawn_interval:
                 self.ember_spawn_timer = 0.0
                 # Randomly choose to spawn from bottom edge or left edge
-                if random.choice([True, False]):
+                if random.random() < 0.5:
                     # Spawn from bottom edge (anywhere along the bottom)
                     spawn_x = random.uniform(0, self.screen_width)
                     spawn_y = random.uniform(self.screen_height * 0.95, self.screen_height)
@@ -611,11 +964,11 @@ class ParticleSystem:
         # Handle automatic round ember spawning
         if self.ember_enabled and self.ember_round_image and self.screen_width and self.screen_height:
             self.ember_round_spawn_timer += dt
-            load_t = min(1.0, len(self.particles) / max(1, self.max_particles))
+            load_t = min(1.0, self._particle_count() / max(1, self.max_particles))
             spawn_interval = self.ember_base_spawn_interval + (0.11 * load_t)
             if self.ember_round_spawn_timer >= spawn_interval:
                 self.ember_round_spawn_timer = 0.0
-                if random.choice([True, False]):
+                if random.random() < 0.5:
                     spawn_x = random.uniform(0, self.screen_width)
                     spawn_y = random.uniform(self.screen_height * 0.95, self.screen_height)
                 else:
@@ -632,54 +985,76 @@ class ParticleSystem:
             size_min (float | None): Skip particles smaller than this size.
             size_max (float | None): Skip particles larger than this size.
         """
-        # Sort particles by size for depth effect (smaller = farther = behind, larger = closer = in front)
-        self.particles.sort(key=lambda p: p.get('size', 0))
-        
-        for p in self.particles:
-            if size_min is not None and p.get('size', 0) < size_min:
-                continue
-            if size_max is not None and p.get('size', 0) > size_max:
-                continue
-            life_frac = max(0.0, min(1.0, p['life'] / max(0.001, p.get('initial_life', p['life']))))
-            alpha = int(255 * life_frac)
-            
-            if p['type'] == 'ember' and p.get('image'):
-                # Use image for ember particles
-                img = p['image']
-                angle = p.get('angle', 0)
-                rotated_img = self._get_cached_ember_surface(img, p['size'], angle, alpha)
-                
+        # Embers, sparks and smoke share one size-sorted depth order (smaller = farther = behind,
+        # larger = closer = in front), so both groups are collected first and sorted together
+        blit_entries = []
+        entry_sizes = []
+
+        count = self._ember_count
+        if count:
+            e = self._ember_data[:count]
+            sizes = e[:, _E_SIZE]
+            mask = np.ones(count, dtype=bool)
+            if size_min is not None:
+                mask &= sizes >= size_min
+            if size_max is not None:
+                mask &= sizes <= size_max
+            visible = e[mask]
+            life_frac = np.clip(visible[:, _E_LIFE] / np.maximum(0.001, visible[:, _E_INITIAL_LIFE]), 0.0, 1.0)
+            alphas = (255 * life_frac).astype(np.int64)
+            # Quantize every ember's cache key in one pass instead of per-ember round/min/max chains
+            scale_buckets = (np.round(np.maximum(0.2, visible[:, _E_SIZE] / 3.0) * 4) / 4.0).tolist()
+            angle_buckets = (np.round(visible[:, _E_ANGLE] / 5.0) * 5).astype(np.int64).tolist()
+            alpha_buckets = np.clip(np.round(alphas / 24.0) * 24, 0, 255).astype(np.int64).tolist()
+            image_indices = visible[:, _E_IMAGE].astype(np.int64).tolist()
+            positions = visible[:, _E_X:_E_Y + 1].astype(np.int64).tolist()
+            images = self._ember_images
+            for image_index, scale_bucket, angle_bucket, alpha_bucket, (x, y) in zip(
+                image_indices, scale_buckets, angle_buckets, alpha_buckets, positions
+            ):
+                rotated_img = self._get_bucketed_ember_surface(images[image_index], scale_bucket, angle_bucket, alpha_bucket)
                 # Draw centered on particle position
-                surface.blit(rotated_img, (int(p['x']) - rotated_img.get_width()//2, int(p['y']) - rotated_img.get_height()//2))
-            elif p['type'] == 'spark':
-                r = max(1, int(p['size']))
-                cache_key = ('spark', r, p['color'], alpha)
-                
-                if cache_key not in self._surface_cache:
-                    s = pygame.Surface((r*2, r*2), pygame.SRCALPHA)
-                    col = p['color'] + (alpha,)
-                    pygame.draw.circle(s, col, (r, r), r)
-                    self._surface_cache[cache_key] = s
-                    self._trim_surface_cache()
-                else:
-                    s = self._surface_cache[cache_key]
-                
-                surface.blit(s, (int(p['x'])-r, int(p['y'])-r))
-            else:
-                r = max(1, int(p['size']))
-                smoke_alpha = max(20, int(150 * life_frac))
-                cache_key = ('smoke', r, p['color'], smoke_alpha)
-                
-                if cache_key not in self._surface_cache:
+                blit_entries.append((rotated_img, (x - rotated_img.get_width()//2, y - rotated_img.get_height()//2)))
+            entry_sizes.append(visible[:, _E_SIZE])
+
+        # Sparks and smoke, drawn from cached circle surfaces
+        count = self._burst_count
+        if count:
+            b = self._burst_data[:count]
+            sizes = b[:, _P_SIZE]
+            mask = np.ones(count, dtype=bool)
+            if size_min is not None:
+                mask &= sizes >= size_min
+            if size_max is not None:
+                mask &= sizes <= size_max
+            visible = b[mask]
+            life_frac = np.clip(visible[:, _P_LIFE] / np.maximum(0.001, visible[:, _P_INITIAL_LIFE]), 0.0, 1.0)
+            is_spark = visible[:, _P_KIND] == _PK_SPARK
+            alphas = np.where(
+                is_spark,
+                (255 * life_frac).astype(np.int64),
+                np.maximum(20, (150 * life_frac).astype(np.int64)),
+            ).tolist()
+            radii = np.maximum(1, visible[:, _P_SIZE].astype(np.int64)).tolist()
+            colors = visible[:, _P_R:_P_B + 1].astype(np.int64).tolist()
+            positions = visible[:, _P_X:_P_Y + 1].astype(np.int64).tolist()
+
+            for spark, r, color, alpha, (x, y) in zip(is_spark.tolist(), radii, colors, alphas, positions):
+                color = tuple(color)
+                cache_key = ('spark' if spark else 'smoke', r, color, alpha)
+                s = self._surface_cache.get(cache_key)
+                if s is None:
                     s = pygame.Surface((r*2, r*2), pygame.SRCALPHA)
-                    sc = p['color'] + (smoke_alpha,)
-                    pygame.draw.circle(s, sc, (r, r), r)
+                    pygame.draw.circle(s, color + (alpha,), (r, r), r)
+                    s = s.convert_alpha()
                     self._surface_cache[cache_key] = s
                     self._trim_surface_cache()
-                else:
-                    s = self._surface_cache[cache_key]
-                
-                surface.blit(s, (int(p['x'])-r, int(p['y'])-r))
+                blit_entries.append((s, (x - r, y - r)))
+            entry_sizes.append(visible[:, _P_SIZE])
+
+        if blit_entries:
+            order = np.argsort(np.concatenate(entry_sizes), kind='stable').tolist()
+            surface.blits([blit_entries[i] for i in order], doreturn=False)
 
     def draw_float_texts(self, surface: pygame.Surface, font: pygame.font.Font):
         """
@@ -688,15 +1063,34 @@ class ParticleSystem:
             surface (pygame.Surface): Target surface.
             font (pygame.font.Font): Font used to render popup text.
         """
-        for ft in self.float_texts:
-            txt_surf = font.render(ft['text'], True, ft['color'])
-            txt_surf.set_alpha(ft.get('alpha', 255))
-            surface.blit(txt_surf, (int(ft['x']), int(ft['y'])))
+        count = self._text_count
+        if count == 0:
+            return
+
+        t = self._text_data[:count]
+        # Fade with remaining life, quantized so fading popups reuse a few cached surfaces
+        alphas = (255 * (t[:, _T_TIME] / np.maximum(0.01, t[:, _T_DURATION]))).astype(np.int64)
+        alpha_buckets = np.clip((alphas // 16) * 16, 0, 255).tolist()
+        positions = t[:, _T_X:_T_Y + 1].astype(np.int64).tolist()
+
+        blit_sequence = []
+        for (text, color), alpha_bucket, pos in zip(self._text_labels, alpha_buckets, positions):
+            cache_key = ('float_text', id(font), text, color, alpha_bucket)
+            txt_surf = self._surface_cache.get(cache_key)
+            if txt_surf is None:
+                txt_surf = font.render(text, True, color).convert_alpha()
+                txt_surf.set_alpha(alpha_bucket)
+                self._surface_cache[cache_key] = txt_surf
+                self._trim_surface_cache()
+            blit_sequence.append((txt_surf, pos))
+        surface.blits(blit_sequence, doreturn=False)
 
     def clear(self):
         """Remove all particles and reset screen shake."""
-        self.particles.clear()
-        self.float_texts.clear()
+        self._burst_count = 0
+        self._ember_count = 0
+        self._text_count = 0
+        self._text_labels.clear()
         self.shake_amount = 0.0
         self.shake_time = 0.0
         self.shake_duration = 0.0
@@ -1,22 +1,33 @@
 from __future__ import annotations
 
+import json
 import os
 import sys
+import tempfile
 from pathlib import Path
 
 
 APP_NAME = "Silksong"
 
+# Resolved once: the bundle root never moves while the game runs
+_BUNDLE_ROOT = None
+# Set after the user data directory has been created, so later lookups skip the mkdir
+_user_data_dir_ready = False
+
 
 def _bundle_root() -> Path:
     """
-    Return the root directory for bundled assets.
+    Return the root directory for bundled assets, resolving it on first use.
     Returns:
         Path: PyInstaller _MEIPASS when frozen, otherwise the project root.
     """
-    if getattr(sys, "frozen", False):
-        return Path(getattr(sys, "_MEIPASS", Path(sys.executable).resolve().parent))
-    return Path(__file__).resolve().parent.parent
+    global _BUNDLE_ROOT
+    if _BUNDLE_ROOT is None:
+        if getattr(sys, "frozen", False):
+            _BUNDLE_ROOT = Path(getattr(sys, "_MEIPASS", Path(sys.executable).resolve().parent))
+        else:
+            _BUNDLE_ROOT = Path(__file__).resolve().parent.parent
+    return _BUNDLE_ROOT
 
 
 def bundled_path(*parts: str) -> str:
@@ -71,8 +82,11 @@ def ensure_user_data_dir() -> Path:
     Returns:
         Path: The user data directory path.
     """
+    global _user_data_dir_ready
     data_dir = user_data_dir()
-    data_dir.mkdir(parents=True, exist_ok=True)
+    if not _user_data_dir_ready:
+        data_dir.mkdir(parents=True, exist_ok=True)
+        _user_data_dir_ready = True
     return data_dir
 
 
@@ -84,4 +98,31 @@ def user_data_file(name: str) -> str:
     Returns:
         str: Absolute path string.
     """
-    return str(ensure_user_data_dir() / name)
\ No newline at end of file
+    return str(ensure_user_data_dir() / name)
+
+
+def write_json_atomic(path: str, data) -> None:
+    """
+    Write data as JSON to path by writing and fsyncing a temp file beside it, then swapping it in.
+    A crash or power loss leaves either the old or the new file, never a truncated one; if the
+    write fails, the temp file is removed and the error re-raised.
+    Args:
+        path (str): Destination file path; its directory must already exist.
+        data: JSON-serializable object to write.
+    """
+    f = tempfile.NamedTemporaryFile('w', dir=os.path.dirname(path), suffix=".tmp", delete=False)
+    temp_path = f.name
+    try:
+        with f:
+            json.dump(data, f, indent=2)
+            # Reach the disk before the swap, so a power loss cannot leave the renamed file empty
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        # Never leave a stray temp file in the user data directory
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
\ No newline at end of file
@@ -3,7 +3,7 @@ import os
 import json
 import config
 from asset_paths import resolve_image_path
-from button import Button
+from button import Button, mirrored_pointer
 from audio import AudioManager
 from hornet import Hornet
 from animation import Animation
@@ -12,7 +12,10 @@ from runtime_paths import user_data_file
 
 class SaveSlotButton:
     """Visual button for a save slot with hover effects and background."""
-    
+
+    # Hover overlays shared by every slot, keyed by (width, height)
+    _hover_overlay_cache = {}
+
     def __init__(self, x: int, y: int, width: int, height: int, slot_num: int, save_exists: bool, background_img=None):
         """Create a save slot button at the given position."""
         self.x = x
@@ -43,7 +46,14 @@ class SaveSlotButton:
                 pointer_size = 70
                 self.hover_pointer = pygame.transform.scale(self.hover_pointer, (pointer_size, pointer_size))
                 break
+        # Right-hand pointer is the same image mirrored; flip it once here rather than per draw
+        self.hover_pointer_flipped = (
+            pygame.transform.flip(self.hover_pointer, True, False) if self.hover_pointer else None
+        )
         
+        # Semi-transparent hover overlay (filled once, shared across slots)
+        self.hover_overlay = self._get_hover_overlay(width, height)
+
         # Font for "New File" text
         self.font = config.get_font(36)
         self.title_font = config.get_title_font(28)
@@ -52,14 +62,34 @@ class SaveSlotButton:
         self.is_hovering = False
         self.active = True
         
+    @classmethod
+    def _get_hover_overlay(cls, width: int, height: int) -> pygame.Surface:
+        """
+        Return the shared hover overlay for a slot of the given size.
+        Args:
+            width (int): Slot width in pixels.
+            height (int): Slot height in pixels.
+        Returns:
+            pygame.Surface: Pre-filled semi-transparent white surface.
+        """
+        key = (width, height)
+        overlay = cls._hover_overlay_cache.get(key)
+        if overlay is None:
+            overlay = pygame.Surface(key, pygame.SRCALPHA)
+            overlay.fill((255, 255, 255, 180))
+            overlay = overlay.convert_alpha()
+            cls._hover_overlay_cache[key] = overlay
+        return overlay
+
     def update_save_status(self, save_exists: bool, background_img=None):
         """Refresh whether a save exists and update the background image."""
         self.save_exists = save_exists
         self.background_img = background_img
     
-    def update(self, dt: float):
-        """Update hover state based on mouse position."""
-        mouse_pos = pygame.mouse.get_pos()
+    def update(self, dt: float, mouse_pos=None):
+        """Update hover state based on mouse position (queried here when not passed in)."""
+        if mouse_pos is None:
+            mouse_pos = pygame.mouse.get_pos()
         self.is_hovering = self.rect.collidepoint(mouse_pos) and self.active
     
     def draw(self, screen: pygame.Surface):
@@ -70,16 +100,14 @@ class SaveSlotButton:
             screen.blit(self.background_img, (self.x, self.y))
         else:
             # Draw transparent empty slot with "NEW GAME" text
-            new_file_text = self.font.render("NEW GAME", True, config.white)
+            new_file_text = config.render_text(self.font, "NEW GAME", config.white)
             text_rect = new_file_text.get_rect(center=self.rect.center)
             screen.blit(new_file_text, text_rect)
         
         # Draw border when hovering
         if self.is_hovering:
             # Draw semi-transparent overlay
-            overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            overlay.fill((255, 255, 255, 180))
-            screen.blit(overlay, (self.x, self.y))
+            screen.blit(self.hover_overlay, (self.x, self.y))
 
             # Draw cursor pointers on both sides
             if self.hover_pointer:
@@ -92,7 +120,7 @@ class SaveSlotButton:
                 screen.blit(left_pointer, left_pointer_rect)
                 
                 # Right pointer
-                right_pointer = pygame.transform.flip(self.hover_pointer, True, False)
+                right_pointer = self.hover_pointer_flipped
                 right_pointer_rect = self.hover_pointer.get_rect(
                     left=self.rect.right - 20, 
                     centery=self.rect.centery
@@ -173,9 +201,10 @@ class TrashButton:
             loop=False
         )
 
-    def update(self, dt: float):
-        """Update hover state and pointer animation."""
-        mouse_pos = pygame.mouse.get_pos()
+    def update(self, dt: float, mouse_pos=None):
+        """Update hover state and pointer animation (mouse queried here when not passed in)."""
+        if mouse_pos is None:
+            mouse_pos = pygame.mouse.get_pos()
         self.is_hovering = self.rect.collidepoint(mouse_pos) and self.active
 
         if self.press_timer > 0:
@@ -215,7 +244,7 @@ class TrashButton:
             left_rect = pointer_frame.get_rect(right=self.rect.left - 10, centery=self.y)
             screen.blit(pointer_frame, left_rect)
 
-            right_pointer = pygame.transform.flip(pointer_frame, True, False)
+            right_pointer = mirrored_pointer(pointer_frame)
             right_rect = right_pointer.get_rect(left=self.rect.right + 10, centery=self.y)
             screen.blit(right_pointer, right_rect)
 
@@ -255,6 +284,8 @@ class SaveFile:
         
         # Pre-load font for status text using config's cached fonts
         self.status_font = config.get_font(20)
+        # Rendered "HP / Silk" line per slot, keyed on the displayed values
+        self._slot_info_cache = {}
         
         # Load background image for existing save files
         played_file_path = resolve_image_path("mosscave_area_art.png")
@@ -301,6 +332,18 @@ class SaveFile:
         borders_path = resolve_image_path("save_file_border.png")
         self.borders = self._load_and_scale_image(borders_path, 377, 669)
 
+        # The title and the four slot borders never change, so compose them once:
+        # the title is rendered a single time and the borders become one strip blitted per frame
+        self._title_surface = config.render_text(config.super_title_font, "Select Save Slot", config.white)
+        self._title_rect = self._title_surface.get_rect(center=(config.screen_width/2, 100))
+        border_w, border_h = self.borders.get_size()
+        border_start_x = int(config.screen_width / 2 - 2 * slot_spacing)
+        strip = pygame.Surface((3 * slot_spacing + border_w, border_h), pygame.SRCALPHA)
+        for i in range(4):
+            strip.blit(self.borders, (i * slot_spacing, 0))
+        self._borders_strip = strip.convert_alpha()
+        self._borders_strip_pos = (border_start_x, 187)
+
     def _load_and_scale_image(self, image_path, width, height):
         """
         Load an image and scale it to the given dimensions.
@@ -508,22 +551,27 @@ class SaveFile:
         
         return None 
 
-    def update(self, dt: float):
-        """Update all save slot and trash button animations."""
+    def update(self, dt: float, mouse_pos=None):
+        """
+        Update all save slot and trash button animations.
+        Args:
+            dt (float): Elapsed time in seconds since the last frame.
+            mouse_pos (tuple | None): Mouse position for this frame; queried here when None.
+        """
+        if mouse_pos is None:
+            mouse_pos = pygame.mouse.get_pos()
         # Update all save slot buttons
         for slot_num in [1, 2, 3, 4]:
-            self.save_slot_buttons[slot_num].update(dt)
-            self.trash_buttons[slot_num].update(dt)
+            self.save_slot_buttons[slot_num].update(dt, mouse_pos)
+            self.trash_buttons[slot_num].update(dt, mouse_pos)
         
         # Update close button
-        self.close_button.update(dt)
+        self.close_button.update(dt, mouse_pos)
     
     def draw(self, screen):
         """Draw the save file selection screen with slot buttons and borders."""        
-        # Draw title
-        title_text = config.super_title_font.render("Select Save Slot", True, config.white)
-        title_rect = title_text.get_rect(center=(config.screen_width/2, 100))
-        screen.blit(title_text, title_rect) 
+        # Draw title (pre-rendered in __init__)
+        screen.blit(self._title_surface, self._title_rect)
         
         # Draw save slot buttons with status and trash buttons
         for slot_num in [1, 2, 3, 4]:
@@ -534,25 +582,23 @@ class SaveFile:
             # Draw save info text if save exists
             game_state = self.slot_status_cache.get(slot_num)
             if game_state:
-                saved_health = game_state.get("player_health", 5)
-                saved_silk = game_state.get("player_silk", 0)
-
-                info_text = self.status_font.render(
-                    f"HP: {int(saved_health)}  Silk: {int(saved_silk)}",
-                    True,
-                    config.white
-                )
-                info_rect = info_text.get_rect(midbottom=(button.rect.centerx, button.rect.bottom - 20))
-                screen.blit(info_text, info_rect)
+                info_key = (int(game_state.get("player_health", 5)), int(game_state.get("player_silk", 0)))
+                cached_info = self._slot_info_cache.get(slot_num)
+                if cached_info is None or cached_info[0] != info_key:
+                    info_text = config.render_text(
+                        self.status_font,
+                        f"HP: {info_key[0]}  Silk: {info_key[1]}",
+                        config.white
+                    )
+                    info_rect = info_text.get_rect(midbottom=(button.rect.centerx, button.rect.bottom - 20))
+                    cached_info = (info_key, info_text, info_rect)
+                    self._slot_info_cache[slot_num] = cached_info
+                screen.blit(cached_info[1], cached_info[2])
             # Draw trash button
             self.trash_buttons[slot_num].draw(screen)
 
-        # Draw borders over each save slot
-        slot_spacing = 400
-        start_x = int(config.screen_width / 2 - 2 * slot_spacing)
-        start_y = 187
-        for i in range(4):
-            screen.blit(self.borders, (start_x + i * slot_spacing, start_y))
+        # Draw borders over each save slot (one pre-composed strip)
+        screen.blit(self._borders_strip, self._borders_strip_pos)
         
         # Draw back button
         self.close_button.draw(screen)
\ No newline at end of file
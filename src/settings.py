@@ -5,8 +5,8 @@ import config
 from slider import Slider
 from transition import TransitionType
 from audio import AudioManager
-from button import Button
-from runtime_paths import user_data_file
+from button import Button, draw_buttons
+from runtime_paths import user_data_file, write_json_atomic
 
 class SettingsMenu:
     """In-game settings menu with sub-menus for game, audio, video, and keyboard options."""
@@ -26,6 +26,8 @@ class SettingsMenu:
         # Use config's cached fonts instead of loading new ones
         self.font = config.get_font(40)
         self.title_font = config.get_title_font(48)
+        # Slider labels are rendered with freetype and cached by each Slider until the value changes
+        self.label_font = config.get_freetype_font(40)
         self.button_spacing = 80
         self.button_font_size = 40
         self.shifty = 80
@@ -46,6 +48,9 @@ class SettingsMenu:
             'camera_shake': True,
             'brightness': 0.8
         }
+        # Overlay alpha derived from brightness; only changes when the setting does
+        self.darkness_alpha = 0
+        self._refresh_darkness_alpha()
 
         # Initialization of menus
         self._init_options_menu()
@@ -65,6 +70,9 @@ class SettingsMenu:
         
         # Track if we're transitioning between menus
         self.pending_menu = None
+
+        # Pre-composited dim overlay + static header text per sub-menu
+        self._menu_backdrop_cache = {}
     
     # TODO: Create one parent function to initialize menus (copilot will do this)
 
@@ -87,8 +95,8 @@ class SettingsMenu:
             'language': Button(self.panel_x + 250, self.panel_y + self.shifty + 25, "Language: English", config.white, config.title_font_path, self.button_font_size),
             'camera_shake': Button(self.panel_x + 250, self.panel_y + self.shifty + self.button_spacing + 25, "Camera Shake: ON", config.white, config.title_font_path, self.button_font_size),
         }
-        self.game_back_button = Button(self.panel_x + 250, config.screen_height - 70,
-                                                 "Back", config.white, config.title_font_path, self.button_font_size)
+        # Every sub-menu shares the single Back button created with the options menu
+        self.game_back_button = self.close_button
     
     def _init_audio_menu(self):
         """Create volume sliders for master, sfx, and music."""
@@ -103,8 +111,7 @@ class SettingsMenu:
             'music': Slider(slider_x, self.panel_y + 240, 350, 10, 0.0, 1.0,
                            volumes['music'], "Music Volume", self.audio_manager.set_music_volume),
         }
-        self.audio_back_button = Button(self.panel_x + 250, config.screen_height - 70,
-                                                  "Back", config.white, config.title_font_path, self.button_font_size)
+        self.audio_back_button = self.close_button
     
     def _init_video_menu(self):
         """Create the brightness slider for video settings."""
@@ -114,19 +121,22 @@ class SettingsMenu:
             'brightness': Slider(slider_x, self.panel_y + 80, 350, 10, 0.0, 1.0,
                                  self.settings_data['brightness'], "Brightness", self._set_brightness),
         }
-        self.video_back_button = Button(self.panel_x + 250, config.screen_height - 70,
-                                                  "Back", config.white, config.title_font_path, self.button_font_size)
+        self.video_back_button = self.close_button
     
     def _init_keyboard_menu(self):
         """Create the keyboard settings sub-menu with a back button."""
-        
-        self.keyboard_back_button = Button(self.panel_x + 250, config.screen_height - 70,
-                                                       "Back", config.white, config.title_font_path, self.button_font_size)
+        self.keyboard_back_button = self.close_button
     
     def _set_brightness(self, value):
         """Update the brightness setting and save."""
         self.settings_data['brightness'] = value
+        self._refresh_darkness_alpha()
         self.save_progress()
+
+    def _refresh_darkness_alpha(self):
+        """Recompute the screen-darkening overlay alpha from the brightness setting."""
+        brightness = max(0.0, min(1.0, self.settings_data.get('brightness', 0.8)))
+        self.darkness_alpha = int((1.0 - brightness) * 255)
     
     def _toggle_camera_shake(self):
         """Toggle the camera shake setting on or off."""
@@ -143,9 +153,7 @@ class SettingsMenu:
     def save_progress(self):
         """Save all settings and game progress to disk."""
         try:
-            # Make sure directory exists
-            os.makedirs(os.path.dirname(self.save_path), exist_ok=True)
-
+            # The directory was created once by user_data_file() in __init__
             existing_data = {}
             if os.path.exists(self.save_path):
                 with open(self.save_path, 'r') as f:
@@ -168,8 +176,8 @@ class SettingsMenu:
                     'difficulty': getattr(self.game, 'difficulty', 'normal')
                 })
             
-            with open(self.save_path, 'w') as f:
-                json.dump(save_data, f, indent=2)
+            # Same swap-in write as AudioManager, since both update this shared progress file
+            write_json_atomic(self.save_path, save_data)
             
             return True
         except Exception as e:
@@ -197,6 +205,7 @@ class SettingsMenu:
             # Restore game settings
             game_settings = save_data.get('game_settings', {})
             self.settings_data.update(game_settings)
+            self._refresh_darkness_alpha()
 
             # Keep slider values synced with loaded settings
             if 'brightness' in self.video_sliders:
@@ -340,10 +349,10 @@ class SettingsMenu:
 
         values_changed = any(abs(self.audio_sliders[key].value - previous_values[key]) > 0.0001 for key in self.audio_sliders)
         if values_changed:
+            # Only audio_settings changed; the audio manager coalesces these into one debounced write
             self.audio_manager.set_master_volume(self.audio_sliders['master'].value)
             self.audio_manager.set_sfx_volume(self.audio_sliders['sfx'].value)
             self.audio_manager.set_music_volume(self.audio_sliders['music'].value)
-            self.save_progress()
         
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self.audio_back_button.is_clicked(event.pos):
@@ -416,47 +425,107 @@ class SettingsMenu:
             # Fallback if no transition manager
             self.current_menu = new_menu
     
-    def update(self, dt):
+    def update(self, dt, mouse_pos=None):
         """
         Tick all visible buttons and sliders for the current menu.
         Args:
             dt (float): Elapsed time in seconds since the last frame.
+            mouse_pos (tuple | None): Mouse position for this frame; queried here when None.
         """
         if self.visible:
-            self.close_button.update(dt)
+            if mouse_pos is None:
+                mouse_pos = pygame.mouse.get_pos()
+            # Shared Back button (also used as each sub-menu's back button)
+            self.close_button.update(dt, mouse_pos)
             
             if self.current_menu == "options":
                 for button in self.options_buttons.values():
-                    button.update(dt)
+                    button.update(dt, mouse_pos)
             elif self.current_menu == "game":
                 for button in self.game_buttons.values():
-                    button.update(dt)
-                self.game_back_button.update(dt)
+                    button.update(dt, mouse_pos)
             elif self.current_menu == "audio":
                 for slider in self.audio_sliders.values():
                     slider.update()
-                self.audio_back_button.update(dt)
             elif self.current_menu == "video":
                 for slider in self.video_sliders.values():
                     slider.update()
-                self.video_back_button.update(dt)
-            elif self.current_menu == "keyboard":
-                self.keyboard_back_button.update(dt)
         
-    def draw(self, screen, font):
+    _MENU_TITLES = {
+        "options": "Options",
+        "game": "Game Settings",
+        "audio": "Audio Settings",
+        "video": "Video Settings",
+        "keyboard": "Keyboard Settings",
+    }
+
+    def _get_menu_backdrop(self, menu):
+        """
+        Return the cached full-screen backdrop for a sub-menu.
+        The dim overlay, menu title and any static labels are composited once.
+        Args:
+            menu (str): Sub-menu name.
+        Returns:
+            pygame.Surface: Full-screen SRCALPHA surface.
+        """
+        backdrop = self._menu_backdrop_cache.get(menu)
+        if backdrop is not None:
+            return backdrop
+
+        backdrop = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        backdrop.fill((0, 0, 0, 180))
+
+        title = self.title_font.render(self._MENU_TITLES.get(menu, ""), True, config.white)
+        title_rect = title.get_rect(center=(self.panel_rect.centerx, self.panel_rect.y - 30))
+        backdrop.blit(title, title_rect)
+
+        if menu == "keyboard":
+            # Placeholder text for keyboard functions
+            placeholder_text = self.font.render("Keyboard Functions Image", True, config.white)
+            placeholder_rect = placeholder_text.get_rect(center=(self.panel_rect.centerx, self.panel_y + 150))
+            backdrop.blit(placeholder_text, placeholder_rect)
+
+        backdrop = backdrop.convert_alpha()
+        self._menu_backdrop_cache[menu] = backdrop
+        return backdrop
+
+    def _get_composed_backdrop(self, menu, background):
+        """
+        Return the sub-menu backdrop already blended over a static background.
+        One opaque full-screen blit then replaces an opaque blit plus a full-screen alpha blend.
+        Args:
+            menu (str): Sub-menu name.
+            background (pygame.Surface): Opaque screen-sized image drawn behind the menu.
+        Returns:
+            pygame.Surface: Full-screen opaque surface.
+        """
+        key = (menu, background)
+        composed = self._menu_backdrop_cache.get(key)
+        if composed is None:
+            composed = background.copy()
+            composed.blit(self._get_menu_backdrop(menu), (0, 0))
+            self._menu_backdrop_cache[key] = composed
+        return composed
+
+    def draw(self, screen, font, background=None):
         """
         Draw the settings panel overlay onto the screen.
         Args:
             screen (pygame.Surface): Target surface.
             font (pygame.font.Font): Font used for text labels.
+            background (pygame.Surface | None): Static screen-sized image behind the menu; when
+                given it is drawn too, pre-blended with the backdrop.
         """
         if not self.visible:
+            if background is not None:
+                screen.blit(background, (0, 0))
             return
         
-        # Background
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        screen.blit(overlay, (0, 0))
+        # Background and menu title (pre-composited)
+        if background is not None:
+            screen.blit(self._get_composed_backdrop(self.current_menu, background), (0, 0))
+        else:
+            screen.blit(self._get_menu_backdrop(self.current_menu), (0, 0))
 
         if self.current_menu == "options":
             self._draw_options_menu(screen)
@@ -473,21 +542,10 @@ class SettingsMenu:
 
     def _draw_options_menu(self, screen):
         """Render the main options menu."""
-        # Draw title
-        title = self.title_font.render("Options", True, config.white)
-        title_rect = title.get_rect(center=(self.panel_rect.centerx, self.panel_rect.y - 30))
-        screen.blit(title, title_rect)
-        for button in self.options_buttons.values():
-            button.draw(screen)
-        
-        self.close_button.draw(screen)
+        draw_buttons(screen, [*self.options_buttons.values(), self.close_button])
     
     def _draw_game_menu(self, screen):
         """Render the game settings menu."""
-        menu_label = self.title_font.render("Game Settings", True, config.white)
-        menu_label_rect = menu_label.get_rect(center=(self.panel_rect.centerx, self.panel_rect.y - 30))
-        screen.blit(menu_label, menu_label_rect)
-        
         # Update button text based on current settings
         shake_text = "Camera Shake: ON" if self.settings_data['camera_shake'] else "Camera Shake: OFF"
         self.game_buttons['camera_shake'].text = shake_text
@@ -495,43 +553,23 @@ class SettingsMenu:
         language_text = f"Language: {self.settings_data['language'].capitalize()}"
         self.game_buttons['language'].text = language_text
         
-        for button in self.game_buttons.values():
-            button.draw(screen)
-        
-        self.game_back_button.draw(screen)
+        draw_buttons(screen, [*self.game_buttons.values(), self.game_back_button])
     
     def _draw_audio_menu(self, screen):
         """Render the audio settings menu."""
-        menu_label = self.title_font.render("Audio Settings", True, config.white)
-        menu_label_rect = menu_label.get_rect(center=(self.panel_rect.centerx, self.panel_rect.y - 30))
-        screen.blit(menu_label, menu_label_rect)
-        
         for slider in self.audio_sliders.values():
-            slider.draw(screen, self.font)
+            slider.draw(screen, self.label_font)
         
         self.audio_back_button.draw(screen)
     
     def _draw_video_menu(self, screen):
         """Render the video settings menu."""
-        menu_label = self.title_font.render("Video Settings", True, config.white)
-        menu_label_rect = menu_label.get_rect(center=(self.panel_rect.centerx, self.panel_rect.y - 30))
-        screen.blit(menu_label, menu_label_rect)
-        
         for slider in self.video_sliders.values():
-            slider.draw(screen, self.font)
+            slider.draw(screen, self.label_font)
         
         self.video_back_button.draw(screen)
     
     def _draw_keyboard_menu(self, screen):
         """Render the keyboard settings placeholder."""
-        menu_label = self.title_font.render("Keyboard Settings", True, config.white)
-        menu_label_rect = menu_label.get_rect(center=(self.panel_rect.centerx, self.panel_rect.y - 30))
-        screen.blit(menu_label, menu_label_rect)
-        
-        # Placeholder text for keyboard functions
-        placeholder_text = self.font.render("Keyboard Functions Image", True, config.white)
-        placeholder_rect = placeholder_text.get_rect(center=(self.panel_rect.centerx, self.panel_y + 150))
-        screen.blit(placeholder_text, placeholder_rect)
-        
         self.keyboard_back_button.draw(screen)
         
\ No newline at end of file
@@ -1,9 +1,17 @@
 import pygame
+import pygame.freetype
 from typing import Optional, Callable
 
 class Slider:
     """Draggable slider for adjusting a numeric value within a range."""
 
+    # Draw colors, converted to pygame.Color once instead of per draw call
+    _TRACK_COLOR = pygame.Color(100, 100, 100)
+    _FILL_COLOR = pygame.Color(255, 255, 255)
+    _HANDLE_COLOR = pygame.Color(230, 230, 230)
+    _HANDLE_DRAG_COLOR = pygame.Color(200, 200, 200)
+    _LABEL_COLOR = pygame.Color(255, 255, 255)
+
     def __init__(self, x: int, y: int, width: int, height: int, min_val: float, max_val: float,
                  initial_val: float, label: str = "", callback: Optional[Callable] = None):
         self.rect = pygame.Rect(x, y, width, height)
@@ -14,10 +22,19 @@ class Slider:
         self.callback = callback
         self.dragging = False
         self.handle_width = 20
+        # Rendered label, rebuilt only when the displayed percentage (or font) changes
+        self._label_key = None
+        self._label_surface = None
+        self._label_pos = None
+        self._handle_value = None  # value the handle rect was last placed for, see update
         self.update()
     
     def update(self):
         """Recalculate the handle position from the current value."""
+        # Menus call this every frame; a slider at rest keeps its handle rect
+        if self.value == self._handle_value:
+            return
+        self._handle_value = self.value
         progress = (self.value - self.min_val) / (self.max_val - self.min_val)
         handle_x = self.rect.x + progress * (self.rect.width - self.handle_width)
         self.handle_rect = pygame.Rect(handle_x, self.rect.y - 5, self.handle_width, self.rect.height + 10)
@@ -49,12 +66,23 @@ class Slider:
         
     def draw(self, surface, font=None):
         """Draw the slider track, fill bar, handle, and optional label."""
-        pygame.draw.rect(surface, (100, 100, 100), self.rect, border_radius=self.rect.height//2)
+        pygame.draw.rect(surface, self._TRACK_COLOR, self.rect, border_radius=self.rect.height//2)
         fill_width = int((self.value - self.min_val) / (self.max_val - self.min_val) * self.rect.width)
         fill_rect = pygame.Rect(self.rect.x, self.rect.y, fill_width, self.rect.height)
-        pygame.draw.rect(surface, (255, 255, 255), fill_rect, border_radius=self.rect.height//2)
-        handle_color = (230, 230, 230) if not self.dragging else (200, 200, 200)
+        pygame.draw.rect(surface, self._FILL_COLOR, fill_rect, border_radius=self.rect.height//2)
+        handle_color = self._HANDLE_COLOR if not self.dragging else self._HANDLE_DRAG_COLOR
         pygame.draw.rect(surface, handle_color, self.handle_rect, border_radius=5)
         if self.label and font:
-            text = font.render(f"{self.label}: {int(self.value * 100)}%", True, (255, 255, 255))
-            surface.blit(text, (self.rect.x, self.rect.y - 35))
\ No newline at end of file
+            percent = int(self.value * 100)
+            if self._label_key != (font, percent):
+                label = f"{self.label}: {percent}%"
+                if isinstance(font, pygame.freetype.Font):
+                    # Origin mode: bounds are offsets from the pen origin, whose baseline sits at the ascender
+                    text, bounds = font.render(label, self._LABEL_COLOR)
+                    self._label_pos = (self.rect.x + bounds.x, self.rect.y - 35 + font.get_sized_ascender() - bounds.y)
+                else:
+                    text = font.render(label, True, self._LABEL_COLOR)
+                    self._label_pos = (self.rect.x, self.rect.y - 35)
+                self._label_surface = text.convert_alpha()
+                self._label_key = (font, percent)
+            surface.blit(self._label_surface, self._label_pos)
\ No newline at end of file
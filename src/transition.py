@@ -70,14 +70,23 @@ class TransitionManager:
         
         # Cached surfaces for performance
         self._overlay_cache = None
+        # Full-screen scratch surfaces for the circle transition (allocated on first use, refilled per frame)
+        self._circle_mask = None
+        self._circle_cutout = None
         self._max_circle_radius = int(((screen_width ** 2 + screen_height ** 2) ** 0.5) / 2) + 50
 
         # Video properties
         self.video_speed_multiplier = video_speed_multiplier
         self.video_loop = video_loop
 
-        # Animation easing
+        # Animation easing (bound methods looked up once, not per transition)
         self.easing_function = self._linear_ease
+        self._easing_map = {
+            'linear': self._linear_ease,
+            'ease_in': self._ease_in,
+            'ease_out': self._ease_out,
+            'ease_in_out': self._ease_in_out
+        }
 
     def start_transition(self, 
                      target_state: Any = None, 
@@ -117,13 +126,7 @@ class TransitionManager:
         self.midpoint_hold_timer = self.midpoint_hold_duration
 
         # Set easing function
-        easing_map = {
-            'linear': self._linear_ease,
-            'ease_in': self._ease_in,
-            'ease_out': self._ease_out,
-            'ease_in_out': self._ease_in_out
-        }
-        self.easing_function = easing_map.get(easing, self._linear_ease)
+        self.easing_function = self._easing_map.get(easing, self._linear_ease)
 
         # Set initial phase
         if transition_type in [TransitionType.FADE_COLOR, TransitionType.FADE_VIDEO, TransitionType.FADE_IMAGE]:
@@ -229,7 +232,8 @@ class TransitionManager:
             if self.midpoint_hold_timer <= 0.0:
                 self.phase = 'out'
         else:
-            self.progress += progress_delta
+            # Progress is clamped here, once per frame, so the easing functions can trust t in [0, 1]
+            self.progress = min(1.0, self.progress + progress_delta)
 
             if self.phase == 'in':
                 if self.progress >= 0.5:
@@ -271,9 +275,15 @@ class TransitionManager:
                         ret, frame = self.video_cap.read()
                 
                 if ret:
-                    frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    surf = pygame.surfarray.make_surface(frame.swapaxes(0, 1))
-                    self.current_frame = pygame.transform.scale(surf, (self.width, self.height)).convert()
+                    # Resize in OpenCV so pygame only wraps an already screen-sized buffer
+                    if frame.shape[1] != self.width or frame.shape[0] != self.height:
+                        frame = cv2.resize(frame, (self.width, self.height), interpolation=cv2.INTER_AREA)
+                    # Wrap OpenCV's BGR buffer directly; convert() makes the only copy
+                    self.current_frame = pygame.image.frombuffer(
+                        frame,
+                        (self.width, self.height),
+                        "BGR"
+                    ).convert()
             except Exception as e:
                 print(f"Error updating video frame: {e}")
         
@@ -430,11 +440,16 @@ class TransitionManager:
         if radius <= 0:
             return
             
-        mask = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        mask = self._circle_mask
+        if mask is None:
+            mask = self._circle_mask = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         mask.fill(self.fade_color)
 
-        circle_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         if self.transition_type == TransitionType.CIRCLE_EXPAND:
+            circle_surface = self._circle_cutout
+            if circle_surface is None:
+                circle_surface = self._circle_cutout = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            circle_surface.fill((0, 0, 0, 0))
             pygame.draw.circle(circle_surface, (0, 0, 0, 0), self.circle_center, radius)
             mask.blit(circle_surface, (0, 0), special_flags=pygame.BLEND_RGBA_SUB)
         else:  # CIRCLE_CONTRACT
@@ -475,9 +490,9 @@ class TransitionManager:
         Args:
             t (float): Normalized progress (0–1).
         Returns:
-            float: Clamped value of t.
+            float: t unchanged.
         """
-        return max(0.0, min(1.0, t))
+        return t
 
     def _ease_in(self, t: float) -> float:
         """
@@ -487,7 +502,6 @@ class TransitionManager:
         Returns:
             float: Eased value.
         """
-        t = max(0.0, min(1.0, t))
         return t * t
 
     def _ease_out(self, t: float) -> float:
@@ -498,7 +512,6 @@ class TransitionManager:
         Returns:
             float: Eased value.
         """
-        t = max(0.0, min(1.0, t))
         return 1 - (1 - t) * (1 - t)
 
     def _ease_in_out(self, t: float) -> float:
@@ -509,8 +522,10 @@ class TransitionManager:
         Returns:
             float: Eased value.
         """
-        t = max(0.0, min(1.0, t))
-        return 2 * t * t if t < 0.5 else 1 - pow(-2 * t + 2, 2) / 2
+        if t < 0.5:
+            return 2 * t * t
+        u = 2 - 2 * t
+        return 1 - u * u * 0.5
     
     # Utility functions
     def is_active(self) -> bool:
@@ -50,14 +50,16 @@ class Tutorial:
     TRANSITION_SPEED = 3.5   # fraction of screen per second (full slide ≈ 0.29 s)
 
     # colors and styling
+    # Colors only passed to pygame.draw are pre-built pygame.Color objects; the ones that
+    # key config.render_text stay tuples because pygame.Color is not hashable.
     _OVERLAY_ALPHA    = 210
     _PANEL_COLOR      = (35,  33,  38 )
-    _PLACEHOLDER_COLOR= (55,  52,  58 )
-    _BORDER_COLOR     = (140, 125, 105)
+    _PLACEHOLDER_COLOR= pygame.Color(55,  52,  58 )
+    _BORDER_COLOR     = pygame.Color(140, 125, 105)
     _TEXT_COLOR       = (235, 225, 210)
     _HINT_COLOR       = (175, 165, 150)
-    _DOT_ACTIVE_COLOR = (220, 195, 160)
-    _DOT_IDLE_COLOR   = (80,  76,  72 )
+    _DOT_ACTIVE_COLOR = pygame.Color(220, 195, 160)
+    _DOT_IDLE_COLOR   = pygame.Color(80,  76,  72 )
     _NEXT_IDLE_COLOR  = (210, 185, 150)
     _NEXT_HOVER_COLOR = (255, 235, 195)
     _NEXT_BG_COLOR    = (55,  50,  45 )
@@ -81,9 +83,17 @@ class Tutorial:
         self._next_slide_idx  = 0
         self._transition_dir  = 1     # 1 = next (right-to-left), -1 = back (left-to-right)
 
-        # Full-screen translucent overlay (built once)
-        self._overlay = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
-        self._overlay.fill((20, 20, 25, self._OVERLAY_ALPHA))
+        # The translucent overlay always lands on a black screen, so it is resolved once into
+        # the solid color it produces and drawn as a single fill
+        overlay = pygame.Surface((1, 1), pygame.SRCALPHA)
+        overlay.fill((20, 20, 25, self._OVERLAY_ALPHA))
+        backdrop = pygame.Surface((1, 1))
+        backdrop.fill((0, 0, 0))
+        backdrop.blit(overlay, (0, 0))
+        self._backdrop_color = backdrop.get_at((0, 0))
+        # Composed panel of the current idle slide (panel-sized, no buttons) and which slide it shows
+        self._idle_panel = None
+        self._idle_panel_slide = None
 
         # Panel geometry
         panel_w = int(screen_width  * 0.72)
@@ -95,6 +105,13 @@ class Tutorial:
             panel_h,
         )
 
+        # Panel background and border rasterized once; rounded corners stay transparent
+        self._panel_surface = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
+        panel_local = self._panel_surface.get_rect()
+        pygame.draw.rect(self._panel_surface, self._PANEL_COLOR,  panel_local, border_radius=14)
+        pygame.draw.rect(self._panel_surface, self._BORDER_COLOR, panel_local, width=2, border_radius=14)
+        self._panel_surface = self._panel_surface.convert_alpha()
+
         # Image placeholder area (local coords, relative to panel top-left)
         img_margin = 30
         img_h      = int(panel_h * 0.58)
@@ -158,28 +175,24 @@ class Tutorial:
         self._font_hint  = config.get_font(26)
         self._font_ph    = config.get_font(22)
 
-    # slide rendering helper (draws slide *idx* with panel shifted by *x_offset* pixels for transition animation)
-    def _draw_slide(self, surface: pygame.Surface, idx: int, x_offset: int):
+    # slide rendering helper (draws slide *idx* with the panel's top-left at (*px*, *py*))
+    def _draw_slide(self, surface: pygame.Surface, idx: int, px: int, py: int):
         """
-        Render slide *idx* with its panel shifted by *x_offset* pixels.
+        Render slide *idx* with the panel's top-left corner at (*px*, *py*).
         Args:
             surface (pygame.Surface): Target surface to render onto.
             idx (int): Index of the slide to render.
-            x_offset (int): Horizontal offset in pixels for transition animation.
+            px (int): Panel left edge on *surface*; shifted during transition animation.
+            py (int): Panel top edge on *surface*.
         """
         if not (0 <= idx < len(self.SLIDES)):
             return
 
         slide = self.SLIDES[idx]
         pw    = self._panel_rect.width
-        ph    = self._panel_rect.height
-        px    = self._panel_rect.x + x_offset
-        py    = self._panel_rect.y
 
         # panel background with border
-        panel_r = pygame.Rect(px, py, pw, ph)
-        pygame.draw.rect(surface, self._PANEL_COLOR,   panel_r, border_radius=14)
-        pygame.draw.rect(surface, self._BORDER_COLOR,  panel_r, width=2, border_radius=14)
+        surface.blit(self._panel_surface, (px, py))
 
         #
         img_r = pygame.Rect(
@@ -196,15 +209,17 @@ class Tutorial:
         #  slide title
         text_x  = px + 30
         title_y = py + self._img_local.bottom + 26
-        title_s = self._font_label.render(slide["label"], True, self._TEXT_COLOR)
-        surface.blit(title_s, (text_x, title_y))
+        # Text sits on the opaque panel, so render it onto the panel color
+        title_s = config.render_text(self._font_label, slide["label"], self._TEXT_COLOR, self._PANEL_COLOR)
+        text_blits = [(title_s, (text_x, title_y))]
 
-        # hint text (multi-line)
+        # hint text (multi-line), submitted together with the title in one blits call
         hint_y = title_y + title_s.get_height() + 14
         for line in slide["hint"].split("\n"):
-            ls = self._font_hint.render(line, True, self._HINT_COLOR)
-            surface.blit(ls, (text_x, hint_y))
+            ls = config.render_text(self._font_hint, line, self._HINT_COLOR, self._PANEL_COLOR)
+            text_blits.append((ls, (text_x, hint_y)))
             hint_y += ls.get_height() + 6
+        surface.blits(text_blits, doreturn=False)
 
         # dot indicators (centered horizontally below the panel, above the button)
         n        = len(self.SLIDES)
@@ -238,28 +253,36 @@ class Tutorial:
             is_last = self.current_slide == len(self.SLIDES) - 1
             self._back_button.active = not is_first
             self._next_button.text = "Done" if is_last else "Next"
-            self._back_button.update(dt)
-            self._next_button.update(dt)
+            self._back_button.update(dt, mouse_pos)
+            self._next_button.update(dt, mouse_pos)
 
     def draw(self, surface: pygame.Surface):
         """
         Render the tutorial overlay onto *surface*.
+        The dark backdrop covers the whole surface, so the caller does not need to clear it first.
         Args:
             surface (pygame.Surface): Target surface (usually the main screen) to render onto.
         """
         self._ensure_fonts()
 
-        # Semi-transparent dark backdrop
-        surface.blit(self._overlay, (0, 0))
-
+        # Dark backdrop (the overlay color over black)
+        surface.fill(self._backdrop_color)
+        px = self._panel_rect.x
+        py = self._panel_rect.y
         if self._transitioning:
             t       = self._transition_t
             out_off = -int(t * self.w) * self._transition_dir
             in_off  = int((1.0 - t) * self.w) * self._transition_dir
-            self._draw_slide(surface, self.current_slide, out_off)
-            self._draw_slide(surface, self._next_slide_idx, in_off)
+            self._draw_slide(surface, self.current_slide, px + out_off, py)
+            self._draw_slide(surface, self._next_slide_idx, px + in_off, py)
         else:
-            self._draw_slide(surface, self.current_slide, 0)
+            # An idle slide never changes, so compose its panel once and reuse it until the slide does
+            if self._idle_panel_slide != self.current_slide:
+                panel = pygame.Surface(self._panel_rect.size, pygame.SRCALPHA)
+                self._draw_slide(panel, self.current_slide, 0, 0)
+                self._idle_panel = panel.convert_alpha()
+                self._idle_panel_slide = self.current_slide
+            surface.blit(self._idle_panel, (px, py))
             if self.current_slide > 0:
                 self._back_button.draw(surface)
             self._next_button.draw(surface)
@@ -310,5 +333,7 @@ class Tutorial:
         self._transition_t  = 0.0
         self._next_slide_idx = 0
         self._transition_dir = 1
+        self._idle_panel = None
+        self._idle_panel_slide = None
         self._back_button.active = False
         self._next_button.text = "Next"